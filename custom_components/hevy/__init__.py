@@ -3,13 +3,14 @@ from __future__ import annotations
 
 import logging
 from datetime import timedelta
+from functools import partial
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.typing import ConfigType
 
-from .api import HevyApiClient
 from .const import (
     CONF_API_KEY,
     CONF_POLLING_INTERVAL,
@@ -19,12 +20,33 @@ from .const import (
     DOMAIN,
 )
 from .coordinator import HevyDataUpdateCoordinator
+from .ics import HevyCalendarFeedView
+from .manager import async_get_client_manager, async_release_client
+from .outbox import HevyWorkoutOutbox
 from .services import async_register_services, async_unregister_services
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.CALENDAR]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Hevy Workout Tracker component.
+
+    Registers the .ics feed view once for all config entries.
+
+    Args:
+        hass: Home Assistant instance
+        config: Home Assistant configuration
+
+    Returns:
+        True if setup succeeded
+    """
+    hass.http.register_view(HevyCalendarFeedView())
+    return True
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Hevy Workout Tracker from a config entry.
@@ -38,9 +60,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """
     hass.data.setdefault(DOMAIN, {})
 
-    api_key = entry.data[CONF_API_KEY]
-    session = async_get_clientsession(hass)
-    client = HevyApiClient(api_key, session)
+    # Entries share one session, one request budget, and staggered polls
+    manager = async_get_client_manager(hass)
+    client = manager.async_get_client(entry.entry_id, entry.data[CONF_API_KEY])
+    entry.async_on_unload(partial(async_release_client, hass, entry.entry_id))
 
     # Get polling interval and unit system from options or use defaults
     polling_interval_minutes = entry.options.get(
@@ -50,13 +73,22 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     update_interval = timedelta(minutes=polling_interval_minutes)
 
     coordinator = HevyDataUpdateCoordinator(hass, client, update_interval, unit_system)
+    coordinator.async_offset_polls(
+        manager.poll_offset(entry.entry_id, update_interval)
+    )
+
+    # Load queued workouts first so the first refresh shows them as pending
+    outbox = HevyWorkoutOutbox(hass, coordinator, entry.entry_id)
+    await outbox.async_load()
+    coordinator.outbox = outbox
+    entry.async_on_unload(outbox.async_stop)
 
     # Fetch exercise templates and routines before first data refresh
-    await coordinator.fetch_exercise_templates()
-    await coordinator.fetch_routines()
+    await coordinator.fetch_catalog()
 
     # Fetch initial data
     await coordinator.async_config_entry_first_refresh()
+    outbox.async_start()
 
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
@@ -2,15 +2,58 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import logging
+from collections.abc import AsyncIterator
+from contextlib import aclosing, asynccontextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from importlib.util import find_spec
 from typing import Any, Self
+from urllib.parse import urlencode
 
 import aiohttp
-
-from .const import API_BASE_URL, API_TIMEOUT
+from aiohttp import hdrs
+
+from .breaker import HevyCircuitBreaker
+from .const import (
+    API_BASE_URL,
+    API_MAX_CONCURRENT,
+    API_RATE_BURST,
+    API_RATE_LIMIT,
+    API_TIMEOUT,
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_MAX_RESET_SECONDS,
+    BREAKER_RESET_SECONDS,
+    JSON_EXECUTOR_BYTES,
+    RATE_LIMIT_BACKOFF,
+    STREAM_CHUNK_BYTES,
+)
+from .jsonstream import iter_array_items
+from .scheduler import RequestScheduler, current_request_class
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # pragma: no cover - orjson ships with Home Assistant
+    from json import loads as json_loads
 
 _LOGGER = logging.getLogger(__name__)
 
+# Only advertise encodings aiohttp can decode in this install; it
+# decodes brotli with whichever of these two packages is present
+HAS_BROTLI = find_spec("brotli") is not None or find_spec("brotlicffi") is not None
+ACCEPT_ENCODING = "gzip, deflate, br" if HAS_BROTLI else "gzip, deflate"
+
+
+def _parse_time(value: str | None) -> datetime | None:
+    """Parse an API timestamp, or None if it is missing or malformed."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
 
 class HevyApiError(Exception):
     """Base exception for Hevy API errors."""
@@ -20,19 +63,163 @@ class HevyAuthError(HevyApiError):
     """Exception for authentication errors."""
 
 
+class HevyUnavailableError(HevyApiError):
+    """Exception for requests refused while the circuit breaker is open."""
+
+
+class HevyRequestError(HevyApiError):
+    """Exception for requests Hevy rejected (4xx); sending them again won't help."""
+
+
+class HevyConnectionError(HevyApiError):
+    """Exception for requests that timed out or lost the connection.
+
+    The request may still have reached Hevy, so a write that failed this
+    way may have taken effect.
+    """
+
+
+@dataclass(slots=True)
+class _CachedResponse:
+    """Last body of a conditional GET, with the validators it came with."""
+
+    etag: str | None
+    last_modified: str | None
+    digest: str
+    data: dict[str, Any]
+
+
 class HevyApiClient:
-    """Hevy API Client."""
+    """Hevy API Client.
 
-    def __init__(self, api_key: str, session: aiohttp.ClientSession | None = None) -> None:
+    GETs of slow-changing endpoints (exercise templates, routines, routine
+    folders) are conditional: the last body is kept per URL with its ETag
+    and Last-Modified, and sent back as If-None-Match / If-Modified-Since.
+    A 304, or a 200 whose body hashes the same as the cached one, returns
+    the cached dict itself, so callers can skip re-processing by identity.
+
+    Every request goes through a RequestScheduler, at the priority set
+    with scheduler.request_priority around the call (refresh by default),
+    so interactive calls are not stuck behind background work. A circuit
+    breaker refuses requests outright while the API keeps failing.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        session: aiohttp.ClientSession | None = None,
+        scheduler: RequestScheduler | None = None,
+        breaker: HevyCircuitBreaker | None = None,
+    ) -> None:
         """Initialize the API client.
 
         Args:
             api_key: The Hevy API key
             session: Optional aiohttp session (will create one if not provided)
+            scheduler: Optional scheduler shared with other clients (will
+                create one if not provided)
+            breaker: Optional circuit breaker shared with other clients
+                (will create one if not provided)
         """
         self._api_key = api_key
         self._session = session
         self._own_session = session is None
+        self._conditional_cache: dict[str, _CachedResponse] = {}
+        self._stats = {
+            "requests": 0,
+            "bytes_received": 0,
+            "conditional_requests": 0,
+            "not_modified": 0,
+            "unchanged": 0,
+        }
+        # Endpoint -> requests, bytes on the wire, and bytes after decompression
+        self._endpoint_stats: dict[str, dict[str, int]] = {}
+        # Endpoint -> requests sent, and total and slowest seconds to finish
+        self._latencies: dict[str, list[float]] = {}
+        self._own_scheduler = scheduler is None
+        self._scheduler = scheduler or RequestScheduler(
+            API_RATE_LIMIT, API_RATE_BURST, API_MAX_CONCURRENT
+        )
+        self._breaker = breaker or HevyCircuitBreaker(
+            BREAKER_FAILURE_THRESHOLD, BREAKER_RESET_SECONDS, BREAKER_MAX_RESET_SECONDS
+        )
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Request counters, including the conditional cache hit rate.
+
+        A hit is a conditional request answered with 304 Not Modified or
+        with a body identical to the cached one.
+        """
+        conditional = self._stats["conditional_requests"]
+        hits = self._stats["not_modified"] + self._stats["unchanged"]
+        return {
+            **self._stats,
+            "hit_rate": round(hits / conditional * 100, 1) if conditional else None,
+            "endpoints": {
+                endpoint: self._endpoint_summary(endpoint)
+                for endpoint in self._endpoint_stats.keys() | self._latencies.keys()
+            },
+            "scheduler": self._scheduler.stats,
+            "breaker": self._breaker.stats,
+        }
+
+    def _endpoint_summary(self, endpoint: str) -> dict[str, Any]:
+        """Transfer counters and response latencies for one endpoint."""
+        summary: dict[str, Any] = dict(
+            self._endpoint_stats.get(
+                endpoint, {"requests": 0, "bytes_on_wire": 0, "bytes_decoded": 0}
+            )
+        )
+        if (latency := self._latencies.get(endpoint)) is not None:
+            sent, total, slowest = latency
+            summary["sent"] = int(sent)
+            summary["avg_latency_ms"] = round(total / sent * 1000, 1)
+            summary["max_latency_ms"] = round(slowest * 1000, 1)
+        return summary
+
+    def _record_transfer(
+        self,
+        endpoint: str,
+        response: aiohttp.ClientResponse,
+        decoded: int,
+        complete: bool = True,
+    ) -> None:
+        """Count a response body before and after decompression.
+
+        The compressed size comes from Content-Length. Chunked responses
+        don't send one, and bodies abandoned part way were not fully
+        transferred, so those are counted at their decoded size.
+        """
+        try:
+            wire = int(response.headers[hdrs.CONTENT_LENGTH]) if complete else decoded
+        except (KeyError, ValueError):
+            wire = decoded
+        counters = self._endpoint_stats.setdefault(
+            endpoint, {"requests": 0, "bytes_on_wire": 0, "bytes_decoded": 0}
+        )
+        counters["requests"] += 1
+        counters["bytes_on_wire"] += wire
+        counters["bytes_decoded"] += decoded
+        self._stats["bytes_received"] += decoded
+
+    @staticmethod
+    async def _decode(body: bytes) -> Any:
+        """Decode a JSON body, off the event loop when it is large.
+
+        Raises:
+            HevyApiError: If the body is not valid JSON
+        """
+        if not body.strip():
+            return {}
+        try:
+            if len(body) >= JSON_EXECUTOR_BYTES:
+                return await asyncio.get_running_loop().run_in_executor(
+                    None, json_loads, body
+                )
+            return json_loads(body)
+        except ValueError as err:
+            raise HevyApiError(f"Invalid JSON response: {err}") from err
 
     async def __aenter__(self) -> Self:
         """Async enter."""
@@ -42,8 +229,64 @@ class HevyApiClient:
 
     async def __aexit__(self, *args: object) -> None:
         """Async exit."""
-        if self._own_session and self._session:
-            await self._session.close()
+        await self.close()
+
+    @asynccontextmanager
+    async def _send(
+        self, method: str, endpoint: str, headers: dict[str, str], **kwargs: Any
+    ) -> AsyncIterator[aiohttp.ClientResponse]:
+        """Send a request once the breaker and the scheduler admit it.
+
+        The request's deadline covers the wait in the queue and the
+        response; API_TIMEOUT additionally bounds the response alone.
+        How the request ended is reported to the circuit breaker.
+
+        Raises:
+            HevyUnavailableError: If the circuit breaker is open
+            TimeoutError: If the deadline or API_TIMEOUT passes
+        """
+        if not self._session:
+            raise HevyApiError("Session not initialized")
+
+        # Checked before queueing, so a refused request costs no token
+        probe = self._breaker.allow()
+        if probe is False:
+            raise HevyUnavailableError(
+                "Hevy API unavailable after repeated failures, "
+                f"retrying in {self._breaker.retry_in:.0f}s"
+            )
+
+        loop = asyncio.get_running_loop()
+        priority, budget = current_request_class()
+        deadline = loop.time() + budget if budget is not None else None
+        healthy: bool | None = None
+        sent_at: float | None = None
+        try:
+            async with asyncio.timeout_at(deadline):
+                async with self._scheduler.slot(priority):
+                    sent_at = loop.time()
+                    try:
+                        async with asyncio.timeout(API_TIMEOUT):
+                            async with self._session.request(
+                                method,
+                                f"{API_BASE_URL}{endpoint}",
+                                headers=headers,
+                                **kwargs,
+                            ) as response:
+                                healthy = response.status < 500
+                                yield response
+                    except (asyncio.TimeoutError, aiohttp.ClientError):
+                        healthy = False
+                        raise
+        finally:
+            self._breaker.record(healthy, probe)
+            if sent_at is not None:
+                # Time in the queue is not the API's latency
+                elapsed = loop.time() - sent_at
+                latency = self._latencies.setdefault(endpoint, [0, 0.0, 0.0])
+                latency[0] += 1
+                latency[1] += elapsed
+                latency[2] = max(latency[2], elapsed)
 
     async def _request(
         self,
@@ -51,6 +294,7 @@ class HevyApiClient:
         endpoint: str,
         params: dict[str, Any] | None = None,
         json: dict[str, Any] | None = None,
+        conditional: bool = False,
     ) -> dict[str, Any]:
         """Make an API request.
 
@@ -58,6 +302,7 @@ class HevyApiClient:
             method: HTTP method (GET, POST, etc.)
             endpoint: API endpoint (e.g., "/workouts")
             params: Optional query parameters
+            conditional: Revalidate against the cached body for this URL
 
         Returns:
             Response data as dict
@@ -66,33 +311,131 @@ class HevyApiClient:
             HevyAuthError: If authentication fails
             HevyApiError: If request fails
         """
-        if not self._session:
-            raise HevyApiError("Session not initialized")
+        headers = {"api-key": self._api_key, hdrs.ACCEPT_ENCODING: ACCEPT_ENCODING}
+        cache_key = f"{endpoint}?{urlencode(sorted((params or {}).items()))}"
+        cached = self._conditional_cache.get(cache_key) if conditional else None
+        if cached is not None:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+
+        self._stats["requests"] += 1
+        if conditional:
+            self._stats["conditional_requests"] += 1
+        try:
+            async with self._send(
+                method, endpoint, headers, params=params, json=json
+            ) as response:
+                if response.status == 304:
+                    if cached is None:
+                        raise HevyApiError("Not modified, but nothing is cached")
+                    self._stats["not_modified"] += 1
+                    return cached.data
+                await self._raise_for_status(response)
+
+                body = await response.read()
+                self._record_transfer(endpoint, response, len(body))
+                if not conditional:
+                    return await self._decode(body)
+
+                # Without validators upstream, a matching hash still
+                # tells the caller nothing changed
+                digest = hashlib.sha1(body, usedforsecurity=False).hexdigest()
+                if cached is not None and cached.digest == digest:
+                    self._stats["unchanged"] += 1
+                    data = cached.data
+                else:
+                    data = await self._decode(body)
+                self._conditional_cache[cache_key] = _CachedResponse(
+                    etag=response.headers.get("ETag"),
+                    last_modified=response.headers.get("Last-Modified"),
+                    digest=digest,
+                    data=data,
+                )
+                return data
 
-        url = f"{API_BASE_URL}{endpoint}"
-        headers = {"api-key": self._api_key}
+        except asyncio.TimeoutError as err:
+            raise HevyConnectionError("Request timeout") from err
+        except aiohttp.ClientError as err:
+            raise HevyConnectionError(f"Request failed: {err}") from err
 
-        try:
-            async with asyncio.timeout(API_TIMEOUT):
-                async with self._session.request(
-                    method, url, headers=headers, params=params, json=json
-                ) as response:
-                    if response.status == 401:
-                        raise HevyAuthError("Invalid API key")
-                    if response.status == 403:
-                        raise HevyAuthError("Access forbidden")
-                    if response.status >= 400:
-                        text = await response.text()
-                        raise HevyApiError(
-                            f"API request failed with status {response.status}: {text}"
-                        )
-
-                    return await response.json()
+    async def _raise_for_status(self, response: aiohttp.ClientResponse) -> None:
+        """Raise the matching error for an unsuccessful response.
+
+        A 429 also pauses the scheduler for the Retry-After period.
+        """
+        if response.status == 401:
+            raise HevyAuthError("Invalid API key")
+        if response.status == 403:
+            raise HevyAuthError("Access forbidden")
+        if response.status == 429:
+            retry_after = response.headers.get(hdrs.RETRY_AFTER, "")
+            self._scheduler.throttle(
+                float(retry_after) if retry_after.isdigit() else RATE_LIMIT_BACKOFF
+            )
+            raise HevyApiError("Rate limited by the Hevy API")
+        if response.status >= 400:
+            text = await response.text()
+            error = HevyApiError if response.status >= 500 else HevyRequestError
+            raise error(
+                f"API request failed with status {response.status}: {text}"
+            )
+
+    async def _stream_workouts_until(
+        self, params: dict[str, Any], stop_before: datetime
+    ) -> dict[str, Any]:
+        """Read a /workouts page workout by workout, up to a cutoff.
+
+        Workouts are decoded one at a time as the body arrives, and the
+        rest of the body is never read once a workout starts before the
+        cutoff, so peak memory is one workout plus one chunk rather than
+        the whole page tree.
 
+        Returns:
+            The page with only the workouts at or after the cutoff, and
+            "truncated" set if the cutoff was reached
+        """
+        headers = {"api-key": self._api_key, hdrs.ACCEPT_ENCODING: ACCEPT_ENCODING}
+        page: dict[str, Any] = {}
+        workouts: list[dict[str, Any]] = []
+        truncated = False
+        self._stats["requests"] += 1
+        try:
+            async with self._send(
+                "GET", "/workouts", headers, params=params
+            ) as response:
+                await self._raise_for_status(response)
+                received = 0
+
+                async def _chunks() -> AsyncIterator[bytes]:
+                    nonlocal received
+                    async for chunk in response.content.iter_chunked(
+                        STREAM_CHUNK_BYTES
+                    ):
+                        received += len(chunk)
+                        yield chunk
+
+                async with aclosing(
+                    iter_array_items(_chunks(), "workouts", page)
+                ) as items:
+                    async for workout in items:
+                        start = _parse_time(workout.get("start_time"))
+                        if start is not None and start < stop_before:
+                            truncated = True
+                            break
+                        workouts.append(workout)
+                self._record_transfer(
+                    "/workouts", response, received, complete=not truncated
+                )
         except asyncio.TimeoutError as err:
-            raise HevyApiError("Request timeout") from err
+            raise HevyConnectionError("Request timeout") from err
         except aiohttp.ClientError as err:
-            raise HevyApiError(f"Request failed: {err}") from err
+            raise HevyConnectionError(f"Request failed: {err}") from err
+        except ValueError as err:
+            raise HevyApiError(f"Invalid JSON response: {err}") from err
+
+        return {**page, "workouts": workouts, "truncated": truncated}
 
     async def validate_api_key(self) -> bool:
         """Validate the API key by making a test request.
@@ -123,36 +466,46 @@ class HevyApiClient:
         return data.get("workout_count", 0)
 
     async def get_workouts(
-        self, page: int = 1, page_size: int = 10
+        self,
+        page: int = 1,
+        page_size: int = 10,
+        stop_before: datetime | None = None,
     ) -> dict[str, Any]:
         """Get paginated workout list.
 
         Args:
             page: Page number (1-indexed)
             page_size: Number of workouts per page
+            stop_before: Stop reading at the first workout that starts
+                before this; the page is then marked "truncated"
 
         Returns:
             Dict with workout data, page info
         """
         params = {"page": page, "pageSize": page_size}
+        if stop_before is not None:
+            return await self._stream_workouts_until(params, stop_before)
         return await self._request("GET", "/workouts", params=params)
 
     async def create_workout(self, workout: dict[str, Any]) -> dict[str, Any]:
         return await self._request("POST", "/workouts", json=workout)
 
     async def get_workout_events(
-        self, page: int = 1, page_size: int = 10
+        self, page: int = 1, page_size: int = 10, since: datetime | None = None
     ) -> dict[str, Any]:
         """Get workout events with full exercise and set details.
 
         Args:
             page: Page number (1-indexed)
             page_size: Number of events per page
+            since: Only events after this time
 
         Returns:
             Dict with events array and page info
         """
-        params = {"page": page, "pageSize": page_size}
+        params: dict[str, Any] = {"page": page, "pageSize": page_size}
+        if since is not None:
+            params["since"] = since.isoformat()
         return await self._request("GET", "/workouts/events", params=params)
 
     async def get_exercise_templates(
@@ -168,17 +521,45 @@ class HevyApiClient:
             Dict with exercise templates and pagination info
         """
         params = {"page": page, "pageSize": page_size}
-        return await self._request("GET", "/exercise_templates", params=params)
+        return await self._request(
+            "GET", "/exercise_templates", params=params, conditional=True
+        )
 
-    async def get_routines(self) -> dict[str, Any]:
+    async def get_routines(
+        self, page: int = 1, page_size: int = 10
+    ) -> dict[str, Any]:
         """Get saved routines.
 
+        Args:
+            page: Page number (1-indexed)
+            page_size: Number of routines per page
+
         Returns:
-            Dict with routine data
+            Dict with routines and pagination info
         """
-        return await self._request("GET", "/routines")
+        params = {"page": page, "pageSize": page_size}
+        return await self._request("GET", "/routines", params=params, conditional=True)
+
+    async def get_routine_folders(
+        self, page: int = 1, page_size: int = 10
+    ) -> dict[str, Any]:
+        """Get routine folders.
+
+        Args:
+            page: Page number (1-indexed)
+            page_size: Number of folders per page
+
+        Returns:
+            Dict with routine folders and pagination info
+        """
+        params = {"page": page, "pageSize": page_size}
+        return await self._request(
+            "GET", "/routine_folders", params=params, conditional=True
+        )
 
     async def close(self) -> None:
-        """Close the session if owned by this client."""
+        """Close the session and scheduler if owned by this client."""
+        if self._own_scheduler:
+            self._scheduler.close()
         if self._own_session and self._session:
             await self._session.close()
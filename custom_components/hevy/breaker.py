@@ -0,0 +1,124 @@
+"""Circuit breaker that fails API requests fast while Hevy is down."""
+from __future__ import annotations
+
+import time
+from typing import Any
+
+BREAKER_CLOSED = "closed"
+BREAKER_OPEN = "open"
+BREAKER_HALF_OPEN = "half_open"
+
+
+class HevyCircuitBreaker:
+    """Track API health and refuse requests while the API is failing.
+
+    Closed: requests go through, and consecutive failures are counted.
+    After failure_threshold of them the breaker opens, and requests are
+    refused without touching the network. Once the reset timeout has
+    passed, the next request is let through as a probe (half-open)
+    while the rest keep failing fast. A healthy probe closes the
+    breaker; a failed one reopens it for twice as long, up to
+    max_reset_seconds.
+
+    Only transport failures (timeouts, connection errors) and 5xx
+    responses count. Client errors, including auth failures, say
+    nothing about whether Hevy is up.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int,
+        reset_seconds: float,
+        max_reset_seconds: float,
+    ) -> None:
+        """Initialize the breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the breaker
+            reset_seconds: How long it first stays open before a probe
+            max_reset_seconds: Cap for the doubling open period
+        """
+        self._failure_threshold = failure_threshold
+        self._base_reset = reset_seconds
+        self._max_reset = max_reset_seconds
+        self._reset = reset_seconds
+        self.state = BREAKER_CLOSED
+        self._failures = 0
+        self._open_until = 0.0
+        self._opened_at: float | None = None
+        self._trips = 0
+        self._rejected = 0
+
+    @property
+    def retry_in(self) -> float:
+        """Seconds until the next probe is allowed, 0 if it already is."""
+        if self.state != BREAKER_OPEN:
+            return 0.0
+        return max(0.0, self._open_until - time.monotonic())
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Breaker state and counters."""
+        return {
+            "state": self.state,
+            "consecutive_failures": self._failures,
+            "open_for": (
+                round(time.monotonic() - self._opened_at, 1)
+                if self._opened_at is not None
+                else None
+            ),
+            "retry_in": round(self.retry_in, 1),
+            "trips": self._trips,
+            "rejected": self._rejected,
+        }
+
+    def allow(self) -> bool | None:
+        """Decide whether a request may go out.
+
+        Returns:
+            False if the request should fail fast, True if it is the
+            half-open probe, and None for an ordinary request
+        """
+        if self.state == BREAKER_CLOSED:
+            return None
+        if self.state == BREAKER_OPEN and time.monotonic() >= self._open_until:
+            self.state = BREAKER_HALF_OPEN
+            return True
+        self._rejected += 1
+        return False
+
+    def record(self, healthy: bool | None, probe: bool | None = None) -> None:
+        """Record how a request that was let through ended.
+
+        Args:
+            healthy: True if the API answered below 500, False on a
+                transport failure or 5xx, None if the request was
+                abandoned before either (cancelled, deadline passed)
+            probe: What allow() returned for the request
+        """
+        if healthy is None:
+            if probe:
+                # No verdict; let the next request probe instead
+                self.state = BREAKER_OPEN
+            return
+        if healthy:
+            self.state = BREAKER_CLOSED
+            self._failures = 0
+            self._reset = self._base_reset
+            self._opened_at = None
+            return
+
+        self._failures += 1
+        if probe:
+            self._reset = min(self._reset * 2, self._max_reset)
+            self._open()
+        elif self.state == BREAKER_CLOSED and self._failures >= self._failure_threshold:
+            self._trips += 1
+            self._open()
+
+    def _open(self) -> None:
+        now = time.monotonic()
+        self.state = BREAKER_OPEN
+        self._open_until = now + self._reset
+        if self._opened_at is None:
+            self._opened_at = now
@@ -0,0 +1,64 @@
+"""Memoized service responses for the Hevy integration."""
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+from .const import RESPONSE_CACHE_SIZE
+
+
+class HevyResponseCache:
+    """LRU cache of built service responses with hit/miss counters.
+
+    Callers include the coordinator's data version in their keys, and the
+    coordinator clears the cache on every refresh, so a cached response is
+    never older than one poll.
+    """
+
+    def __init__(self, max_entries: int = RESPONSE_CACHE_SIZE) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of responses kept
+        """
+        self._max_entries = max_entries
+        self._entries: OrderedDict[Hashable, dict[str, Any]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> dict[str, Any] | None:
+        """Return the cached response for key, counting the hit or miss.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached response, or None on a miss
+        """
+        response = self._entries.get(key)
+        if response is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return response
+
+    def put(self, key: Hashable, response: dict[str, Any]) -> None:
+        """Store a response, evicting the least recently used one if full.
+
+        Args:
+            key: Cache key
+            response: Response to cache
+        """
+        self._entries[key] = response
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached response (counters are kept)."""
+        self._entries.clear()
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import dataclasses
 import hashlib
-from datetime import datetime, timedelta
+import logging
+from bisect import bisect_left
+from datetime import date, datetime, timedelta
 from typing import Any
 
 from homeassistant.components.calendar import (
@@ -14,13 +17,24 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
 
-from .const import CONF_API_KEY, DOMAIN
+from .api import HevyApiError
+from .const import CONF_API_KEY, DEFAULT_WORKOUT_DURATION_MINUTES, DOMAIN
 from .coordinator import HevyDataUpdateCoordinator
+from .scheduler import RequestPriority, request_priority
 from .sensor import get_device_info
 
+_LOGGER = logging.getLogger(__name__)
+
 PARALLEL_UPDATES = 0
 
+# How far before a range start an older workout may begin and still overlap it
+HISTORY_LOOKBEHIND = timedelta(days=1)
+
+# Projected days kept memoized before the memo is cleared
+PROJECTION_MEMO_DAYS = 400
+
 
 def _parse_dt(date_str: str | None) -> datetime | None:
     """Parse an ISO 8601 datetime string from the Hevy API.
@@ -121,6 +135,148 @@ def _workout_to_event(
     )
 
 
+class _WorkoutEventIndex:
+    """Pre-built workout events sorted by start for bisected range queries.
+
+    Built once per coordinator data version. Events are ordered by start
+    time, and the longest event duration bounds how far before the range
+    start an overlapping event can begin, so a query only scans the slice
+    that can actually overlap.
+    """
+
+    def __init__(self, events: list[CalendarEvent]) -> None:
+        """Initialize the index.
+
+        Args:
+            events: Calendar events in any order
+        """
+        self._events = sorted(events, key=lambda e: e.start)
+        self._starts = [event.start for event in self._events]
+        self._max_duration = max(
+            (event.end - event.start for event in self._events),
+            default=timedelta(0),
+        )
+
+    @property
+    def latest(self) -> CalendarEvent | None:
+        """Return the event with the latest start time."""
+        return self._events[-1] if self._events else None
+
+    def overlapping(self, start: datetime, end: datetime) -> list[CalendarEvent]:
+        """Return events overlapping [start, end), sorted by start time.
+
+        Args:
+            start: Start of the query range (inclusive)
+            end: End of the query range (exclusive)
+
+        Returns:
+            List of CalendarEvents sorted by start time
+        """
+        lo = bisect_left(self._starts, start - self._max_duration)
+        hi = bisect_left(self._starts, end, lo)
+        return [event for event in self._events[lo:hi] if event.end > start]
+
+
+class _RotationProjection:
+    """Upcoming routine events projected over the learned training days.
+
+    The k-th training day on or after the anchor date gets routine
+    (next_index + k) of the rotation. k is computed arithmetically from the
+    date, so only dates inside a requested range are visited, and events
+    are memoized (up to PROJECTION_MEMO_DAYS of them) for as long as the
+    rotation state stays the same.
+    """
+
+    def __init__(
+        self,
+        routines: list[dict[str, Any]],
+        next_index: int,
+        weekdays: list[int],
+        anchor: date,
+        start_minutes: int,
+        duration_minutes: int,
+    ) -> None:
+        """Initialize the projection.
+
+        Args:
+            routines: Routines in rotation order
+            next_index: Index of the next routine in the rotation
+            weekdays: Training weekdays (0 = Monday)
+            anchor: First date the projection may place a workout on
+            start_minutes: Usual local start time in minutes after midnight
+            duration_minutes: Usual workout duration in minutes
+        """
+        self._routines = routines
+        self._next_index = next_index
+        self._weekdays = frozenset(weekdays)
+        self._anchor = anchor
+        self._start = timedelta(minutes=start_minutes)
+        self._duration = timedelta(minutes=duration_minutes)
+        self._events: dict[date, CalendarEvent] = {}
+
+    def _training_days_before(self, day: date) -> int:
+        """Count training days in [anchor, day)."""
+        full_weeks, remainder = divmod((day - self._anchor).days, 7)
+        count = full_weeks * len(self._weekdays)
+        first = self._anchor + timedelta(days=full_weeks * 7)
+        for offset in range(remainder):
+            if (first + timedelta(days=offset)).weekday() in self._weekdays:
+                count += 1
+        return count
+
+    def _event_for(self, day: date) -> CalendarEvent:
+        event = self._events.get(day)
+        if event is None:
+            ordinal = self._training_days_before(day)
+            routine = self._routines[
+                (self._next_index + ordinal) % len(self._routines)
+            ]
+            start = dt_util.start_of_local_day(day) + self._start
+            exercises = [
+                exercise["name"]
+                for exercise in routine.get("exercises", [])
+                if exercise.get("name")
+            ]
+            event = CalendarEvent(
+                start=start,
+                end=start + self._duration,
+                summary=f"{routine['title']} (planned)",
+                description="\n".join(exercises) or None,
+                uid=f"planned_{routine['id']}_{day.isoformat()}",
+            )
+            if len(self._events) >= PROJECTION_MEMO_DAYS:
+                self._events.clear()
+            self._events[day] = event
+        return event
+
+    def overlapping(self, start: datetime, end: datetime) -> list[CalendarEvent]:
+        """Return projected events overlapping [start, end), sorted by start.
+
+        Args:
+            start: Start of the query range (inclusive)
+            end: End of the query range (exclusive)
+
+        Returns:
+            List of projected CalendarEvents
+        """
+        now = dt_util.now().replace(second=0, microsecond=0)
+        day = max(self._anchor, dt_util.as_local(start - self._duration).date())
+        last = dt_util.as_local(end).date()
+        events: list[CalendarEvent] = []
+        while day <= last:
+            if day.weekday() in self._weekdays:
+                event = self._event_for(day)
+                if event.start < now:
+                    # Today's workout is not logged yet, so it is still ahead
+                    event = dataclasses.replace(
+                        event, start=now, end=now + self._duration
+                    )
+                if event.end > start and event.start < end:
+                    events.append(event)
+            day += timedelta(days=1)
+        return events
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -162,24 +318,79 @@ class HevyCalendarEntity(CoordinatorEntity[HevyDataUpdateCoordinator], CalendarE
         self._attr_unique_id = f"{key_hash}_workout_calendar"
         self._attr_name = "Workout calendar"
         self._attr_device_info = get_device_info(entry)
+        self._index: _WorkoutEventIndex | None = None
+        self._index_version: int | None = None
+        self._projection: _RotationProjection | None = None
+        self._projection_key: tuple[Any, ...] | None = None
+
+    def _get_index(self) -> _WorkoutEventIndex:
+        """Return the event index for the current coordinator data.
+
+        The index (and the CalendarEvent objects in it) is reused until the
+        coordinator's data version changes.
+        """
+        version = self.coordinator.data_version
+        if self._index is None or self._index_version != version:
+            workouts: list[dict[str, Any]] = self.coordinator.data.get("workouts", [])
+            events: list[CalendarEvent] = []
+            for workout in workouts:
+                event = _workout_to_event(workout, self.coordinator)
+                if event is not None:
+                    events.append(event)
+            self._index = _WorkoutEventIndex(events)
+            self._index_version = version
+        return self._index
+
+    def _get_projection(self) -> _RotationProjection | None:
+        """Return the upcoming-workout projection for the current rotation.
+
+        Hevy does not schedule workouts, so upcoming events continue the
+        routine rotation over the weekdays the user usually trains on. The
+        projection is rebuilt only when that rotation state changes.
+        """
+        data = self.coordinator.data
+        routine_data = data.get("routine_data") or {}
+        pattern = data.get("training_pattern") or {}
+        routines = self.coordinator.routines
+        position = routine_data.get("rotation_position")
+        weekdays = pattern.get("weekdays")
+        start_minutes = pattern.get("start_minutes")
+        if not routines or position is None or not weekdays or start_minutes is None:
+            return None
+
+        today = dt_util.now().date()
+        anchor = today + timedelta(days=1) if data.get("worked_out_today") else today
+        duration = pattern.get("duration_minutes") or 0
+        if duration <= 0:
+            duration = DEFAULT_WORKOUT_DURATION_MINUTES
+        key = (
+            tuple(routine["id"] for routine in routines),
+            position,
+            tuple(weekdays),
+            anchor,
+            start_minutes,
+            duration,
+        )
+        if self._projection is None or key != self._projection_key:
+            self._projection = _RotationProjection(
+                routines, position - 1, weekdays, anchor, start_minutes, duration
+            )
+            self._projection_key = key
+        return self._projection
 
     @property
     def event(self) -> CalendarEvent | None:
         """Return the most recent workout as the current event.
 
         The coordinator caches 30 days of workout history (all past events).
-        There are no upcoming events since Hevy does not schedule future workouts.
-        This returns the latest workout so the calendar card always shows something.
+        Upcoming events are projections, not scheduled workouts, so this
+        returns the latest real workout so the calendar card always shows
+        something and the calendar state never reflects a guessed session.
         """
         if not self.coordinator.data:
             return None
 
-        workouts: list[dict[str, Any]] = self.coordinator.data.get("workouts", [])
-        if not workouts:
-            return None
-
-        # Workouts are sorted most-recent-first
-        return _workout_to_event(workouts[0], self.coordinator)
+        return self._get_index().latest
 
     async def async_get_events(
         self,
@@ -189,7 +400,11 @@ class HevyCalendarEntity(CoordinatorEntity[HevyDataUpdateCoordinator], CalendarE
     ) -> list[CalendarEvent]:
         """Return workout events that overlap the given date range.
 
-        Called by HA when the calendar view queries for events.
+        Called by HA when the calendar view queries for events. Ranges
+        inside the coordinator's refresh window are served from the event
+        index; anything older comes from the coordinator's history store,
+        which fetches the covering /workouts pages on first use. Ranges
+        reaching into the future also get projected routine events.
 
         Args:
             hass: Home Assistant instance
@@ -202,15 +417,32 @@ class HevyCalendarEntity(CoordinatorEntity[HevyDataUpdateCoordinator], CalendarE
         if not self.coordinator.data:
             return []
 
-        workouts: list[dict[str, Any]] = self.coordinator.data.get("workouts", [])
-
-        events: list[CalendarEvent] = []
+        events = self._get_index().overlapping(start_date, end_date)
+        projection = self._get_projection()
+        if projection is not None:
+            projected = projection.overlapping(start_date, end_date)
+            if projected:
+                events = sorted([*events, *projected], key=lambda e: e.start)
+
+        window_start = self.coordinator.window_start
+        if window_start is None or start_date >= window_start:
+            return events
+
+        try:
+            with request_priority(RequestPriority.INTERACTIVE):
+                workouts = await self.coordinator.history.async_workouts_between(
+                    start_date - HISTORY_LOOKBEHIND, min(end_date, window_start)
+                )
+        except HevyApiError as err:
+            _LOGGER.warning("Failed to fetch older workouts: %s", err)
+            return events
+
+        seen = {event.uid for event in events}
         for workout in workouts:
-            event = _workout_to_event(workout, self.coordinator)
-            if event is None:
+            if workout.get("id") in seen:
                 continue
-            # Include events that overlap the requested range
-            if event.end > start_date and event.start < end_date:
+            event = _workout_to_event(workout, self.coordinator)
+            if event is not None and event.end > start_date and event.start < end_date:
                 events.append(event)
 
         events.sort(key=lambda e: e.start)
@@ -0,0 +1,174 @@
+"""Searchable index over the Hevy exercise template catalog."""
+from __future__ import annotations
+
+import re
+from bisect import bisect_left
+from collections import defaultdict
+from difflib import get_close_matches
+from typing import Any
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Per query token, how much each kind of title match is worth
+_EXACT_SCORE = 3
+_PREFIX_SCORE = 2
+_FUZZY_SCORE = 1
+_FUZZY_CUTOFF = 0.75
+_FUZZY_CANDIDATES = 3
+
+
+def tokenize(text: str | None) -> list[str]:
+    """Split text into lowercase alphanumeric tokens.
+
+    Args:
+        text: Text to split
+
+    Returns:
+        Tokens in order of appearance
+    """
+    return _TOKEN_RE.findall(text.lower()) if text else []
+
+
+class ExerciseCatalogIndex:
+    """Inverted index over exercise template titles and attributes.
+
+    Built once per catalog fetch. Title tokens map to template IDs, and a
+    sorted vocabulary lets a query token match by prefix with a bisect, so
+    "inc ben" finds "Incline Bench Press". Tokens with no exact or prefix
+    match fall back to close spellings. Muscle group, equipment, and type
+    each have their own index for filtering.
+    """
+
+    def __init__(self, templates: dict[str, dict[str, Any]]) -> None:
+        """Build the index.
+
+        Args:
+            templates: Cached exercise templates keyed by template ID
+        """
+        self._tokens: dict[str, set[str]] = defaultdict(set)
+        self._muscle_groups: dict[str, set[str]] = defaultdict(set)
+        self._equipment: dict[str, set[str]] = defaultdict(set)
+        self._types: dict[str, set[str]] = defaultdict(set)
+        self._titles: dict[str, str] = {}
+        # Normalized title -> template ID, for exact name resolution
+        self._by_title: dict[str, str] = {}
+
+        for template_id, template in templates.items():
+            title_tokens = tokenize(template.get("title"))
+            # Normalized title, used for ordering and phrase matching
+            self._titles[template_id] = " ".join(title_tokens)
+            self._by_title.setdefault(self._titles[template_id], template_id)
+            for token in title_tokens:
+                self._tokens[token].add(template_id)
+            groups = [template.get("muscle_group")]
+            groups.extend(template.get("secondary_muscle_groups") or [])
+            for group in groups:
+                if group:
+                    self._muscle_groups[group.lower()].add(template_id)
+            if template.get("equipment"):
+                self._equipment[template["equipment"].lower()].add(template_id)
+            if template.get("type"):
+                self._types[template["type"].lower()].add(template_id)
+
+        self._vocabulary = sorted(self._tokens)
+
+    @property
+    def size(self) -> int:
+        """Number of templates indexed."""
+        return len(self._titles)
+
+    def find(self, title: str) -> str | None:
+        """Look up a template by title, ignoring case and punctuation.
+
+        Args:
+            title: Exercise title to resolve
+
+        Returns:
+            The template ID, or None if no title matches
+        """
+        return self._by_title.get(" ".join(tokenize(title)))
+
+    def _match_token(self, token: str) -> dict[str, int]:
+        """Score every template matching one query token."""
+        scores: dict[str, int] = {}
+        for template_id in self._tokens.get(token, ()):
+            scores[template_id] = _EXACT_SCORE
+
+        index = bisect_left(self._vocabulary, token)
+        while index < len(self._vocabulary) and self._vocabulary[index].startswith(
+            token
+        ):
+            for template_id in self._tokens[self._vocabulary[index]]:
+                scores.setdefault(template_id, _PREFIX_SCORE)
+            index += 1
+
+        if not scores:
+            for close in get_close_matches(
+                token, self._vocabulary, _FUZZY_CANDIDATES, _FUZZY_CUTOFF
+            ):
+                for template_id in self._tokens[close]:
+                    scores.setdefault(template_id, _FUZZY_SCORE)
+        return scores
+
+    def search(
+        self,
+        query: str | None = None,
+        muscle_group: str | None = None,
+        equipment: str | None = None,
+        exercise_type: str | None = None,
+    ) -> list[tuple[str, int]]:
+        """Find templates matching a query and filters, best first.
+
+        Every query token has to match the title (exactly, by prefix, or by
+        a close spelling). Matches are ranked by total score, with a bonus
+        for titles that start with the query, then by title.
+
+        Args:
+            query: Free text to match against titles
+            muscle_group: Primary or secondary muscle group filter
+            equipment: Equipment filter
+            exercise_type: Exercise type filter
+
+        Returns:
+            (template ID, score) pairs; score is 0 when no query is given
+        """
+        candidates: set[str] | None = None
+        for value, index in (
+            (muscle_group, self._muscle_groups),
+            (equipment, self._equipment),
+            (exercise_type, self._types),
+        ):
+            if value:
+                matches = index.get(value.lower(), set())
+                candidates = matches if candidates is None else candidates & matches
+
+        tokens = tokenize(query)
+        if not tokens:
+            ids = self._titles if candidates is None else candidates
+            return sorted(
+                ((template_id, 0) for template_id in ids),
+                key=lambda item: self._titles[item[0]],
+            )
+
+        scores = self._match_token(tokens[0])
+        for token in tokens[1:]:
+            if not scores:
+                break
+            token_scores = self._match_token(token)
+            scores = {
+                template_id: score + token_scores[template_id]
+                for template_id, score in scores.items()
+                if template_id in token_scores
+            }
+
+        phrase = " ".join(tokens)
+        results: list[tuple[str, int]] = []
+        for template_id, score in scores.items():
+            if candidates is not None and template_id not in candidates:
+                continue
+            if self._titles[template_id].startswith(phrase):
+                score += _EXACT_SCORE
+            results.append((template_id, score))
+
+        results.sort(key=lambda item: (-item[1], self._titles[item[0]]))
+        return results
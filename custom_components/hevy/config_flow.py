@@ -13,8 +13,10 @@ from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from .api import HevyApiClient, HevyApiError, HevyAuthError
 from .const import (
     CONF_API_KEY,
+    CONF_ATTRIBUTE_BUDGET,
     CONF_POLLING_INTERVAL,
     CONF_UNIT_SYSTEM,
+    DEFAULT_ATTRIBUTE_BUDGET,
     DEFAULT_NAME,
     DEFAULT_POLLING_INTERVAL,
     DEFAULT_UNIT_SYSTEM,
@@ -155,6 +157,12 @@ class HevyOptionsFlowHandler(config_entries.OptionsFlow):
                             CONF_UNIT_SYSTEM, DEFAULT_UNIT_SYSTEM
                         ),
                     ): vol.In([UNIT_SYSTEM_IMPERIAL, UNIT_SYSTEM_METRIC]),
+                    vol.Optional(
+                        CONF_ATTRIBUTE_BUDGET,
+                        default=self.config_entry.options.get(
+                            CONF_ATTRIBUTE_BUDGET, DEFAULT_ATTRIBUTE_BUDGET
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=1024)),
                 }
             ),
         )
@@ -1,15 +1,27 @@
 """Constants for the Hevy Workout Tracker integration."""
 
 DOMAIN = "hevy"
+DATA_CLIENT_MANAGER = f"{DOMAIN}_client_manager"
 
 # API Configuration
 API_BASE_URL = "https://api.hevyapp.com/v1"
 API_TIMEOUT = 30
+API_RATE_LIMIT = 4.0      # Requests per second admitted by the client
+API_RATE_BURST = 8        # Requests that may be sent back to back
+API_MAX_CONCURRENT = 4    # Requests in flight at once
+RATE_LIMIT_BACKOFF = 5.0  # Pause after a 429 without Retry-After, in seconds
+BREAKER_FAILURE_THRESHOLD = 3      # Consecutive failures that open the breaker
+BREAKER_RESET_SECONDS = 60.0       # First open period before a probe
+BREAKER_MAX_RESET_SECONDS = 900.0  # Cap for the doubling open period
+STALE_DATA_MAX_HOURS = 24  # Last good data is served this long during outages
+JSON_EXECUTOR_BYTES = 256 * 1024  # Larger bodies are decoded in the executor
+STREAM_CHUNK_BYTES = 16 * 1024    # Read size when streaming a workouts page
 
 # Config/Options Keys
 CONF_API_KEY = "api_key"
 CONF_UNIT_SYSTEM = "unit_system"
 CONF_POLLING_INTERVAL = "polling_interval"
+CONF_ATTRIBUTE_BUDGET = "attribute_budget"
 
 # Unit Systems
 UNIT_SYSTEM_IMPERIAL = "imperial"
@@ -17,6 +29,7 @@ UNIT_SYSTEM_METRIC = "metric"
 
 # Defaults
 DEFAULT_POLLING_INTERVAL = 15  # minutes
+DEFAULT_ATTRIBUTE_BUDGET = 16  # KiB of state attributes per entity, 0 = no limit
 DEFAULT_UNIT_SYSTEM = UNIT_SYSTEM_IMPERIAL
 DEFAULT_NAME = "Hevy"
 
@@ -37,10 +50,40 @@ SENSOR_MUSCLE_GROUP_SUMMARY = "muscle_group_summary"
 SENSOR_WEEKLY_MUSCLE_VOLUME = "weekly_muscle_volume"
 SENSOR_WEEKLY_DISTANCE = "weekly_distance"
 SENSOR_NEXT_WORKOUT = "next_workout"
+SENSOR_QUEUED_WORKOUTS = "queued_workouts"
+SENSOR_API_CACHE_HIT_RATE = "api_cache_hit_rate"
+SENSOR_LAST_SYNC = "last_sync"
+
+# Lists the attributes left out of a state to stay within the budget
+ATTR_DETAIL_OMITTED = "detail_omitted"
 
 MUSCLE_DUE_THRESHOLD_DAYS = 3
+WORKING_SET_TYPES = ("normal", "dropset", "failure")  # Set types counted in volume; warmups are not
+TRAINING_DAY_MIN_OCCURRENCES = 2  # Weekday counts as a training day at this many hits
+DEFAULT_WORKOUT_DURATION_MINUTES = 60
 MAX_WORKOUT_PAGES = 10       # Safety cap for pagination
 WORKOUT_HISTORY_DAYS = 30
+WORKOUT_PAGE_SIZE = 10       # Max page size the /workouts endpoint accepts
+ROUTINE_PAGE_SIZE = 10       # Max page size /routines and /routine_folders accept
+MAX_ROUTINE_PAGES = 50       # Safety cap for routine pagination
+ROUTINE_PAGE_CONCURRENCY = 4  # Routine pages fetched in parallel
+CATALOG_REVALIDATE_HOURS = 6  # Templates and routines are re-checked this often
+HISTORY_MAX_CACHED_PAGES = 50  # LRU bound for older /workouts pages
+ICS_FEED_DAYS = 365          # History in the .ics feed past the refresh window
+RESPONSE_CACHE_SIZE = 32     # Memoized service responses per config entry
+EXPORT_DIR = "hevy_exports"  # Under the HA config directory
+PROFILE_DIR = "hevy_profiles"  # Under the HA config directory
+PROFILE_TOP_DEFAULT = 25     # Functions and allocation sites in a profile summary
+EVENT_EXPORT_PROGRESS = "hevy_export_progress"
+IMPORT_DIR = "hevy_imports"  # Under the HA config directory
+IMPORT_STORAGE_VERSION = 1
+IMPORT_CONCURRENCY = 3       # Workouts posted in parallel by import_workouts
+IMPORT_READ_ROWS = 500       # CSV rows read per executor job
+WORKOUT_EVENT_PAGE_SIZE = 10  # Largest page /workouts/events serves
+OUTBOX_STORAGE_VERSION = 1
+OUTBOX_RETRY_BASE_SECONDS = 30   # First retry delay for a queued workout
+OUTBOX_RETRY_MAX_SECONDS = 3600  # Backoff cap
+EVENT_WORKOUT_REJECTED = "hevy_workout_rejected"
 
 # API Endpoints
 ENDPOINT_WORKOUTS = "/workouts"
@@ -48,3 +91,4 @@ ENDPOINT_WORKOUTS_COUNT = "/workouts/count"
 ENDPOINT_WORKOUTS_EVENTS = "/workouts/events"
 ENDPOINT_EXERCISE_TEMPLATES = "/exercise_templates"
 ENDPOINT_ROUTINES = "/routines"
+ENDPOINT_ROUTINE_FOLDERS = "/routine_folders"
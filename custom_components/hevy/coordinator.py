@@ -1,26 +1,49 @@
 """Data Update Coordinator for Hevy integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
-from datetime import datetime, timedelta, timezone
-from typing import Any
+import time
+from collections.abc import Awaitable, Callable
+from datetime import date, datetime, timedelta, timezone
+from statistics import median_low
+from typing import TYPE_CHECKING, Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import dt as dt_util
+from homeassistant.util.read_only_dict import ReadOnlyDict
 
-from .api import HevyApiClient, HevyApiError
+from .api import HevyApiClient, HevyApiError, HevyAuthError
+from .cache import HevyResponseCache
+from .catalog import ExerciseCatalogIndex
 from .const import (
+    CATALOG_REVALIDATE_HOURS,
+    DEFAULT_WORKOUT_DURATION_MINUTES,
     DOMAIN,
     KG_TO_LBS,
+    MAX_ROUTINE_PAGES,
     MAX_WORKOUT_PAGES,
     METERS_TO_KM,
     METERS_TO_MILES,
     MUSCLE_DUE_THRESHOLD_DAYS,
+    ROUTINE_PAGE_CONCURRENCY,
+    ROUTINE_PAGE_SIZE,
+    STALE_DATA_MAX_HOURS,
+    TRAINING_DAY_MIN_OCCURRENCES,
     UNIT_SYSTEM_IMPERIAL,
     UNIT_SYSTEM_METRIC,
+    WORKING_SET_TYPES,
     WORKOUT_HISTORY_DAYS,
+    WORKOUT_PAGE_SIZE,
 )
+from .history import HevyWorkoutHistory, parse_start_time
+from .rollups import HevyRollupStore
+from .scheduler import RequestPriority, request_priority
+from .views import HevyWorkoutViews, intern_text
+
+if TYPE_CHECKING:
+    from .outbox import HevyWorkoutOutbox
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -55,18 +78,103 @@ class HevyDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self._exercise_prs: dict[str, dict[str, Any]] = {}
         self._exercise_distance_prs: dict[str, dict[str, Any]] = {}
         self._exercise_templates: dict[str, dict] = {}  # Cache templates by ID
+        self._exercise_index: ExerciseCatalogIndex | None = None
+        self._exercise_index_source: dict[str, dict] | None = None
+        # Raw API pages last processed, to skip re-processing unchanged ones
+        self._template_pages: dict[int, dict[str, Any]] = {}
+        self._routine_pages: list[dict[str, Any]] = []
+        self._routine_folders: dict[Any, str] = {}
+        self._catalog_fetched_at: datetime | None = None
         self._routines: list[dict[str, Any]] = []
+        # Built once per routines fetch: the get_routines response in the
+        # configured units, and routine ID -> (rotation index, preview)
+        self._routines_view: ReadOnlyDict[str, Any] = ReadOnlyDict(
+            {"count": 0, "routines": []}
+        )
+        self._routine_index: dict[str, tuple[int, list[str]]] = {}
+        # Bumped whenever a refresh brings in different workout data, so
+        # consumers can key caches on it
+        self.data_version = 0
+        self._workout_count: int | None = None
+        # Older workouts are fetched lazily, page by page, on demand
+        self.history = HevyWorkoutHistory(client)
+        # Oldest point the refresh window is known to be complete back to
+        self.window_start: datetime | None = None
+        # Service responses built from the data above, cleared on refresh
+        self.responses = HevyResponseCache()
+        # Converted sets and exercises shared by the sensor data
+        self.views = HevyWorkoutViews(self)
+        # Day-level metric rollups for hevy.query
+        self.rollups = HevyRollupStore(self)
+        # Write-behind queue for logged workouts, attached at entry setup
+        self.outbox: HevyWorkoutOutbox | None = None
+        # Regular interval while the first one is stretched by a poll offset
+        self._poll_interval: timedelta | None = None
+        # When data last came from a successful refresh, and why the most
+        # recent refresh failed (None once one succeeds again)
+        self.data_fetched_at: datetime | None = None
+        self.last_refresh_error: str | None = None
+        # Milliseconds spent in each stage of the most recent refresh
+        self.last_refresh_timings: dict[str, float] = {}
 
     @property
     def exercise_templates(self) -> dict[str, dict]:
         return self._exercise_templates
 
+    @property
+    def exercise_index(self) -> ExerciseCatalogIndex:
+        """Search index over the template catalog, rebuilt when it changes."""
+        if (
+            self._exercise_index is None
+            or self._exercise_index_source is not self._exercise_templates
+            or self._exercise_index.size != len(self._exercise_templates)
+        ):
+            self._exercise_index = ExerciseCatalogIndex(self._exercise_templates)
+            self._exercise_index_source = self._exercise_templates
+        return self._exercise_index
+
     @property
     def routines(self) -> list[dict[str, Any]]:
         return self._routines
 
-    async def fetch_exercise_templates(self) -> None:
-        """Fetch and cache exercise template catalog from all pages."""
+    @property
+    def routines_view(self) -> ReadOnlyDict[str, Any]:
+        """Prebuilt get_routines response in the configured unit system."""
+        return self._routines_view
+
+    @callback
+    def async_offset_polls(self, offset: timedelta) -> None:
+        """Shift scheduled polls by offset, relative to other entries.
+
+        Call before the first refresh. The interval after it is stretched
+        by offset, and since each poll is scheduled from the one before,
+        every later poll stays shifted.
+        """
+        if not offset or self.update_interval is None:
+            return
+        self._poll_interval = self.update_interval
+        self.update_interval = self.update_interval + offset
+
+    async def fetch_catalog(self) -> None:
+        """Fetch exercise templates and routines.
+
+        Both are revalidated with conditional requests, so repeating this
+        is cheap when nothing changed. The fetch time is only recorded
+        once both succeed, so a failed part is retried on the next refresh
+        rather than after the revalidation interval.
+        """
+        results = await asyncio.gather(
+            self.fetch_exercise_templates(), self.fetch_routines()
+        )
+        if all(results):
+            self._catalog_fetched_at = dt_util.utcnow()
+
+    async def fetch_exercise_templates(self) -> bool:
+        """Fetch and cache exercise template catalog from all pages.
+
+        Returns:
+            True if the catalog was fetched, False if the API failed
+        """
         try:
             page = 1
             total_templates = 0
@@ -78,17 +186,34 @@ class HevyDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 if not templates:
                     break  # No more templates
 
+                # The client hands back the same dict for an unchanged page,
+                # and its templates are already cached
+                if self._template_pages.get(page) is data:
+                    total_templates += len(templates)
+                    templates = []
+                else:
+                    self._template_pages[page] = data
+                    self._exercise_index = None
+
                 for template in templates:
                     template_id = template.get("id")
                     if template_id:
+                        # Muscle, equipment, and type names repeat across
+                        # hundreds of templates; keep one copy of each
                         self._exercise_templates[template_id] = {
-                            "title": template.get("title"),
-                            "muscle_group": template.get("primary_muscle_group"),
-                            "secondary_muscle_groups": template.get(
-                                "secondary_muscle_groups", []
+                            "title": intern_text(template.get("title")),
+                            "muscle_group": intern_text(
+                                template.get("primary_muscle_group")
                             ),
-                            "equipment": template.get("equipment"),
-                            "type": template.get("type"),
+                            "secondary_muscle_groups": [
+                                intern_text(muscle)
+                                for muscle in template.get(
+                                    "secondary_muscle_groups"
+                                )
+                                or []
+                            ],
+                            "equipment": intern_text(template.get("equipment")),
+                            "type": intern_text(template.get("type")),
                         }
                         total_templates += 1
 
@@ -104,12 +229,82 @@ class HevyDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             )
         except HevyApiError as err:
             _LOGGER.warning("Failed to fetch exercise templates: %s", err)
+            return False
+        return True
+
+    @staticmethod
+    async def _fetch_all_pages(
+        fetch: Callable[..., Awaitable[dict[str, Any]]]
+    ) -> list[dict[str, Any]]:
+        """Fetch every page of a paginated endpoint.
+
+        The first page gives the page count; the remaining pages are then
+        fetched concurrently.
+
+        Args:
+            fetch: Client method taking page and page_size
+
+        Returns:
+            Raw page responses, in page order
+
+        Raises:
+            HevyApiError: If any page fails
+        """
+        first = await fetch(page=1, page_size=ROUTINE_PAGE_SIZE)
+        page_count = min(first.get("page_count") or 1, MAX_ROUTINE_PAGES)
+        semaphore = asyncio.Semaphore(ROUTINE_PAGE_CONCURRENCY)
+
+        async def _fetch_page(page: int) -> dict[str, Any]:
+            async with semaphore:
+                return await fetch(page=page, page_size=ROUTINE_PAGE_SIZE)
 
-    async def fetch_routines(self) -> None:
-        """Fetch and cache routines from the API."""
+        rest = await asyncio.gather(
+            *(_fetch_page(page) for page in range(2, page_count + 1))
+        )
+        return [first, *rest]
+
+    async def _fetch_routine_folders(self) -> dict[Any, str]:
+        """Fetch routine folder titles by folder ID.
+
+        Folders only label routines, so a failure is logged and the
+        routines are cached without them.
+        """
+        try:
+            pages = await self._fetch_all_pages(self.client.get_routine_folders)
+        except HevyApiError as err:
+            _LOGGER.warning("Failed to fetch routine folders: %s", err)
+            return {}
+        return {
+            folder["id"]: folder.get("title")
+            for page in pages
+            for folder in page.get("routine_folders") or []
+            if folder.get("id") is not None
+        }
+
+    async def fetch_routines(self) -> bool:
+        """Fetch and cache routines from the API, across all pages.
+
+        Returns:
+            True if the routines were fetched, False if the API failed
+        """
         try:
-            data = await self.client.get_routines()
-            routines = data.get("routines", [])
+            pages, folders = await asyncio.gather(
+                self._fetch_all_pages(self.client.get_routines),
+                self._fetch_routine_folders(),
+            )
+            if folders == self._routine_folders and len(pages) == len(
+                self._routine_pages
+            ) and all(
+                page is previous
+                for page, previous in zip(pages, self._routine_pages, strict=True)
+            ):
+                _LOGGER.debug("Routines unchanged, keeping cached views")
+                return True
+            self._routine_pages = pages
+            self._routine_folders = folders
+            routines = [
+                routine for page in pages for routine in page.get("routines") or []
+            ]
             self._routines = []
             for routine in routines:
                 routine_id = routine.get("id")
@@ -141,11 +336,68 @@ class HevyDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     self._routines.append({
                         "id": routine_id,
                         "title": routine.get("title", "Untitled"),
+                        "folder": folders.get(routine.get("folder_id")),
                         "exercises": exercises,
                     })
-            _LOGGER.info("Cached %d routines", len(self._routines))
+            self._build_routine_views()
+            _LOGGER.info(
+                "Cached %d routines in %d folders", len(self._routines), len(folders)
+            )
         except HevyApiError as err:
             _LOGGER.warning("Failed to fetch routines: %s", err)
+            return False
+        return True
+
+    def _build_routine_view(self, routine: dict[str, Any]) -> dict[str, Any]:
+        """Build one routine's get_routines entry in the configured units."""
+        exercises: list[dict[str, Any]] = []
+        for exercise in routine.get("exercises", []):
+            sets: list[dict[str, Any]] = []
+            for set_data in exercise.get("sets", []):
+                set_view: dict[str, Any] = {"type": set_data.get("type", "normal")}
+                weight = self._convert_weight(set_data.get("weight_kg"))
+                if weight is not None:
+                    set_view["weight"] = weight
+                if set_data.get("reps") is not None:
+                    set_view["reps"] = set_data["reps"]
+                if set_data.get("duration_seconds") is not None:
+                    set_view["duration_seconds"] = set_data["duration_seconds"]
+                distance = self._convert_distance(set_data.get("distance_meters"))
+                if distance is not None:
+                    set_view["distance"] = distance
+                sets.append(set_view)
+
+            exercises.append({
+                "name": exercise.get("name"),
+                "exercise_template_id": exercise.get("exercise_template_id"),
+                "sets": sets,
+            })
+
+        return {
+            "id": routine.get("id"),
+            "title": routine.get("title"),
+            "folder": routine.get("folder"),
+            "exercises": exercises,
+        }
+
+    def _build_routine_views(self) -> None:
+        """Precompute everything derived from the routines.
+
+        Routines only change when they are refetched, so unit conversion
+        and exercise previews are done here once instead of on every
+        get_routines call and every refresh.
+        """
+        self._routines_view = ReadOnlyDict({
+            "count": len(self._routines),
+            "routines": [
+                self._build_routine_view(routine) for routine in self._routines
+            ],
+        })
+        self._routine_index = {}
+        for position, routine in enumerate(self._routines):
+            self._routine_index.setdefault(
+                routine["id"], (position, self._routine_exercise_titles(routine))
+            )
 
     async def _fetch_30_day_workouts(self) -> list[dict[str, Any]]:
         """Fetch up to 30 days of workout history with pagination.
@@ -155,9 +407,16 @@ class HevyDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """
         cutoff = datetime.now(tz=timezone.utc) - timedelta(days=WORKOUT_HISTORY_DAYS)
         all_workouts: list[dict[str, Any]] = []
+        window_start = cutoff
 
         for page in range(1, MAX_WORKOUT_PAGES + 1):
-            data = await self.client.get_workouts(page=page, page_size=10)
+            # The client stops reading the page at the first workout older
+            # than the cutoff; only complete pages can be cached
+            data = await self.client.get_workouts(
+                page=page, page_size=WORKOUT_PAGE_SIZE, stop_before=cutoff
+            )
+            if not data.get("truncated"):
+                self.history.add_page(page, data)
             workouts = data.get("workouts", [])
 
             if not workouts:
@@ -178,14 +437,19 @@ class HevyDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                         pass
                 all_workouts.append(workout)
 
-            if reached_cutoff:
+            if reached_cutoff or data.get("truncated"):
                 break
 
             # Check if there are more pages
             page_count = data.get("page_count", 1)
             if page >= page_count:
                 break
+        else:
+            # Safety cap hit before the cutoff, so the window is shorter
+            if all_workouts:
+                window_start = parse_start_time(all_workouts[-1]) or cutoff
 
+        self.window_start = window_start
         return all_workouts
 
     @staticmethod
@@ -226,21 +490,16 @@ class HevyDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 "last_workout_routine_id": None,
                 "rotation_position": 1,
                 "rotation_total": len(self._routines),
-                "exercises_preview": self._routine_exercise_titles(first),
+                "exercises_preview": self._routine_index[first["id"]][1],
             }
 
         last_routine_id = last_workout.get("routine_id")
         last_title = last_workout.get("title")
 
-        # Try to find the last workout's routine by routine_id
-        found_index = None
-        if last_routine_id:
-            for i, routine in enumerate(self._routines):
-                if routine["id"] == last_routine_id:
-                    found_index = i
-                    break
+        # Find the last workout's routine by routine_id
+        found = self._routine_index.get(last_routine_id) if last_routine_id else None
 
-        if found_index is None:
+        if found is None:
             return {
                 "next_routine": "No routine detected for last workout",
                 "routine_id": None,
@@ -252,7 +511,7 @@ class HevyDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 "exercises_preview": [],
             }
 
-        next_index = (found_index + 1) % len(self._routines)
+        next_index = (found[0] + 1) % len(self._routines)
         next_routine = self._routines[next_index]
 
         return {
@@ -263,7 +522,51 @@ class HevyDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             "last_workout_routine_id": last_routine_id,
             "rotation_position": next_index + 1,
             "rotation_total": len(self._routines),
-            "exercises_preview": self._routine_exercise_titles(next_routine),
+            "exercises_preview": self._routine_index[next_routine["id"]][1],
+        }
+
+    def _learn_training_pattern(self) -> dict[str, Any]:
+        """Learn which weekdays, and when, the user usually trains.
+
+        A weekday counts as a training day once it has workouts on at least
+        TRAINING_DAY_MIN_OCCURRENCES distinct dates in the history window.
+
+        Returns:
+            Dict with training weekdays (0 = Monday), usual local start time
+            in minutes after midnight, and usual duration in minutes
+        """
+        dates_by_weekday: dict[int, set[date]] = {}
+        start_minutes: list[int] = []
+        durations: list[int] = []
+
+        for workout in self._workout_history:
+            start_dt = parse_start_time(workout)
+            if start_dt is None:
+                continue
+            local_dt = dt_util.as_local(start_dt)
+            dates_by_weekday.setdefault(local_dt.weekday(), set()).add(
+                local_dt.date()
+            )
+            start_minutes.append(local_dt.hour * 60 + local_dt.minute)
+
+            end_time = workout.get("end_time")
+            if end_time:
+                try:
+                    end_dt = datetime.fromisoformat(end_time.replace("Z", "+00:00"))
+                    durations.append(round((end_dt - start_dt).total_seconds() / 60))
+                except (ValueError, AttributeError):
+                    pass
+
+        return {
+            "weekdays": sorted(
+                weekday
+                for weekday, dates in dates_by_weekday.items()
+                if len(dates) >= TRAINING_DAY_MIN_OCCURRENCES
+            ),
+            "start_minutes": median_low(start_minutes) if start_minutes else None,
+            "duration_minutes": (
+                median_low(durations) if durations else DEFAULT_WORKOUT_DURATION_MINUTES
+            ),
         }
 
     def _aggregate_muscle_groups(self) -> dict[str, Any]:
@@ -397,7 +700,7 @@ class HevyDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 for set_data in exercise.get("sets", []):
                     # Skip warmup sets
                     set_type = set_data.get("type", "normal")
-                    if set_type not in ("normal", "dropset", "failure"):
+                    if set_type not in WORKING_SET_TYPES:
                         continue
 
                     weight_kg = set_data.get("weight_kg")
@@ -480,7 +783,7 @@ class HevyDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
                 for set_data in exercise.get("sets", []):
                     set_type = set_data.get("type", "normal")
-                    if set_type not in ("normal", "dropset", "failure"):
+                    if set_type not in WORKING_SET_TYPES:
                         continue
 
                     distance_meters = set_data.get("distance_meters")
@@ -768,6 +1071,132 @@ class HevyDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         return streak
 
+    def _with_exercise_titles(self, workout: dict[str, Any]) -> dict[str, Any]:
+        """Fill exercise titles a create payload or response omits.
+
+        Per-exercise data and PRs are keyed by title, so titles come from
+        the catalog by template ID.
+
+        Args:
+            workout: Workout dict in API shape
+
+        Returns:
+            Copy of the workout with every exercise titled
+        """
+        exercises: list[dict[str, Any]] = []
+        for exercise in workout.get("exercises") or []:
+            if not exercise.get("title"):
+                template = self._exercise_templates.get(
+                    exercise.get("exercise_template_id"), {}
+                )
+                exercise = {**exercise, "title": template.get("title", "")}
+            exercises.append(exercise)
+        return {**workout, "exercises": exercises}
+
+    def _insert_workout(
+        self, workouts: list[dict[str, Any]], workout: dict[str, Any]
+    ) -> list[dict[str, Any]]:
+        """Insert a workout into a most-recent-first window.
+
+        Args:
+            workouts: Workouts in the window, most recent first
+            workout: Workout to insert; must have a valid start_time
+
+        Returns:
+            New list with the workout inserted in start order, unchanged if
+            the workout is older than the window
+        """
+        workout_dt = parse_start_time(workout)
+        if workout_dt is None or (
+            self.window_start is not None and workout_dt < self.window_start
+        ):
+            return list(workouts)
+
+        index = 0
+        while index < len(workouts):
+            existing_dt = parse_start_time(workouts[index])
+            if existing_dt is not None and existing_dt <= workout_dt:
+                break
+            index += 1
+        return [*workouts[:index], workout, *workouts[index:]]
+
+    @callback
+    def async_add_workout(
+        self, workout: dict[str, Any], replaces: str | None = None
+    ) -> bool:
+        """Ingest a workout created or queued through this integration.
+
+        The workout is inserted into the refresh window, PRs are updated
+        from it alone, and listeners are notified straight away. The next
+        scheduled refresh reconciles anything Hevy computed server side.
+        Workouts flagged "pending" are still in the outbox; they show in
+        the history but do not count towards the total or PRs yet.
+
+        Args:
+            workout: Created workout as returned by the Hevy API
+            replaces: ID of a pending workout this one supersedes
+
+        Returns:
+            True if the workout was ingested, False if it lacks the fields
+            needed and a full refresh is required instead
+        """
+        if not self._ingest_workout(workout, replaces):
+            return False
+        self._async_publish_workouts()
+        return True
+
+    @callback
+    def async_add_workouts(self, workouts: list[dict[str, Any]]) -> bool:
+        """Ingest a batch of created workouts with a single rebuild.
+
+        Like async_add_workout, but the derived data is rebuilt and
+        listeners are notified once for the whole batch.
+
+        Args:
+            workouts: Created workouts as returned by the Hevy API
+
+        Returns:
+            True if every workout was ingested, False if any lacks the
+            fields needed and a full refresh is required instead
+        """
+        ingested = [self._ingest_workout(workout) for workout in workouts]
+        if any(ingested):
+            self._async_publish_workouts()
+        return all(ingested)
+
+    def _ingest_workout(
+        self, workout: dict[str, Any], replaces: str | None = None
+    ) -> bool:
+        """Insert a workout into the window and PRs without rebuilding."""
+        if (
+            self.data is None
+            or parse_start_time(workout) is None
+            or not workout.get("id")
+        ):
+            return False
+
+        workout = self._with_exercise_titles(workout)
+        pending = workout.get("pending", False)
+        is_new = not pending and all(
+            w.get("id") != workout["id"] for w in self._workout_history
+        )
+        superseded = (workout["id"], replaces)
+        workouts = [w for w in self._workout_history if w.get("id") not in superseded]
+        self._workout_history = self._insert_workout(workouts, workout)
+        self._workout_count = (self._workout_count or 0) + int(is_new)
+        self.history.set_workout_count(self._workout_count)
+        if not pending:
+            self._update_exercise_prs([workout])
+        return True
+
+    def _async_publish_workouts(self) -> None:
+        """Rebuild the data from the workout window and notify listeners."""
+        self.data_version += 1
+        self.responses.clear()
+        self.async_set_updated_data(
+            self._build_data(self._workout_history, self._workout_count)
+        )
+
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from Hevy API.
 
@@ -777,332 +1206,305 @@ class HevyDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         Raises:
             UpdateFailed: If update fails
         """
+        # The first refresh scheduled the stretched interval; back to normal
+        if self._poll_interval is not None and self.data is not None:
+            self.update_interval = self._poll_interval
+            self._poll_interval = None
+
+        # Filled in stage by stage, so a failed refresh shows where it got to
+        self.last_refresh_timings = timings = {}
+        lap = time.perf_counter()
+
+        def _stage_done(stage: str) -> None:
+            nonlocal lap
+            now = time.perf_counter()
+            timings[stage] = round((now - lap) * 1000, 1)
+            lap = now
+
+        # The first refresh follows the fetch at setup; after that, retry
+        # a catalog that failed and revalidate one that is due
+        if self.data is not None and (
+            self._catalog_fetched_at is None
+            or dt_util.utcnow() - self._catalog_fetched_at
+            >= timedelta(hours=CATALOG_REVALIDATE_HOURS)
+        ):
+            # Revalidation can run to many pages; let service calls go first
+            with request_priority(RequestPriority.BACKGROUND):
+                await self.fetch_catalog()
+            _stage_done("catalog")
+
         try:
             # Fetch workout count
             workout_count = await self.client.get_workout_count()
+            self.history.set_workout_count(workout_count)
+            _stage_done("workout_count")
 
             # Fetch 30-day workout history with pagination
             workouts = await self._fetch_30_day_workouts()
+            _stage_done("workouts")
+
+            # Workouts still waiting in the outbox stay visible as pending
+            if self.outbox is not None:
+                for pending in self.outbox.pending_workouts():
+                    workouts = self._insert_workout(
+                        workouts, self._with_exercise_titles(pending)
+                    )
+
+            if (
+                self.data is None
+                or workout_count != self._workout_count
+                or workouts != self._workout_history
+            ):
+                self.data_version += 1
 
             # Update workout history (full 30-day window)
             self._workout_history = workouts
+            self._workout_count = workout_count
+            self.responses.clear()
 
-            # Update PRs from all fetched workouts
-            self._update_exercise_prs(self._workout_history)
+            # Update PRs from all fetched workouts; queued ones may never
+            # be accepted, so they don't count until Hevy has them
+            self._update_exercise_prs(
+                [w for w in self._workout_history if not w.get("pending")]
+            )
 
-            # Process data for sensors
-            last_workout = workouts[0] if workouts else None
-            now = dt_util.now()
+            data = self._build_data(workouts, workout_count)
+            _stage_done("process")
 
-            # Calculate weekly workout count
-            week_ago = now - timedelta(days=7)
-            weekly_count = 0
-            for workout in workouts:
-                start_time = workout.get("start_time")
-                if start_time:
-                    try:
-                        workout_dt = datetime.fromisoformat(
-                            start_time.replace("Z", "+00:00")
-                        )
-                        if workout_dt > week_ago:
-                            weekly_count += 1
-                    except (ValueError, AttributeError):
-                        continue
+        except HevyApiError as err:
+            if self._serve_stale(err):
+                return self.data
+            raise UpdateFailed(f"Error communicating with Hevy API: {err}") from err
 
-            # Check if worked out today
-            worked_out_today = False
-            if last_workout:
-                start_time = last_workout.get("start_time")
-                if start_time:
-                    try:
-                        workout_dt = datetime.fromisoformat(
-                            start_time.replace("Z", "+00:00")
-                        )
-                        worked_out_today = (
-                            dt_util.as_local(workout_dt).date() == now.date()
-                        )
-                    except (ValueError, AttributeError):
-                        pass
+        if self.last_refresh_error is not None:
+            _LOGGER.info("Hevy API is reachable again")
+        self.data_fetched_at = dt_util.utcnow()
+        self.last_refresh_error = None
+        return data
 
-            # Process exercises from last workout
-            exercises_summary = []
-            if last_workout:
-                for exercise in last_workout.get("exercises", []):
-                    sets = exercise.get("sets", [])
-                    exercise_title = exercise.get("title", "Unknown")
-
-                    # Convert sets to configured unit system
-                    sets_converted = []
-                    total_reps = 0
-                    total_duration = 0
-                    total_distance_meters = 0
-
-                    for set_data in sets:
-                        weight = self._convert_weight(set_data.get("weight_kg"))
-                        reps = set_data.get("reps")
-                        duration = set_data.get("duration_seconds")
-                        distance = self._convert_distance(set_data.get("distance_meters"))
-
-                        set_info = {
-                            "type": set_data.get("type", "normal"),
-                            "weight": weight,
-                            "weight_unit": self._get_weight_unit(),
-                            "reps": reps,
-                            "duration_seconds": duration,
-                            "distance": distance,
-                            "distance_unit": self._get_distance_unit(),
-                        }
-                        sets_converted.append(set_info)
-
-                        if reps:
-                            total_reps += reps
-                        if duration:
-                            total_duration += duration
-                        if set_data.get("distance_meters") is not None:
-                            total_distance_meters += set_data["distance_meters"]
-
-                    total_distance = self._convert_distance(total_distance_meters)
-
-                    exercise_summary = {
-                        "name": exercise_title,
-                        "sets": sets_converted,
-                        "best_set": self._get_best_set_string(sets),
-                        "total_reps": total_reps if total_reps > 0 else None,
-                        "total_duration_seconds": (
-                            total_duration if total_duration > 0 else None
-                        ),
-                        "total_distance": total_distance if total_distance_meters > 0 else None,
-                        "distance_unit": self._get_distance_unit() if total_distance_meters > 0 else None,
-                        "notes": exercise.get("notes"),
-                    }
-                    exercises_summary.append(exercise_summary)
-
-            # Calculate workout duration
-            workout_duration_minutes = None
-            if last_workout:
-                start_time = last_workout.get("start_time")
-                end_time = last_workout.get("end_time")
-                if start_time and end_time:
-                    try:
-                        start_dt = datetime.fromisoformat(
-                            start_time.replace("Z", "+00:00")
-                        )
-                        end_dt = datetime.fromisoformat(end_time.replace("Z", "+00:00"))
-                        duration = end_dt - start_dt
-                        workout_duration_minutes = round(duration.total_seconds() / 60, 1)
-                    except (ValueError, AttributeError):
-                        pass
+    def _serve_stale(self, err: HevyApiError) -> bool:
+        """Decide whether to keep the last good data through a failed refresh.
 
-            # Build per-exercise data
-            exercise_data = {}
-            for workout in workouts:
-                for exercise in workout.get("exercises", []):
-                    exercise_title = exercise.get("title", "").lower()
-                    if not exercise_title:
-                        continue
+        Entities keep their state through an outage instead of going
+        unavailable, up to STALE_DATA_MAX_HOURS. Auth errors are never
+        papered over, since they need the user to act.
 
-                    sets = exercise.get("sets", [])
-                    template_id = exercise.get("exercise_template_id")
-
-                    # Convert sets
-                    sets_converted = []
-                    total_reps = 0
-                    total_duration = 0
-                    total_distance_meters = 0
-                    last_weight = None
-
-                    for set_data in sets:
-                        weight = self._convert_weight(set_data.get("weight_kg"))
-                        reps = set_data.get("reps")
-                        duration = set_data.get("duration_seconds")
-                        distance = self._convert_distance(set_data.get("distance_meters"))
-
-                        sets_converted.append(
-                            {
-                                "type": set_data.get("type", "normal"),
-                                "weight": weight,
-                                "weight_unit": self._get_weight_unit(),
-                                "reps": reps,
-                                "duration_seconds": duration,
-                                "distance": distance,
-                                "distance_unit": self._get_distance_unit(),
-                            }
-                        )
+        Args:
+            err: Why the refresh failed
 
-                        if weight:
-                            last_weight = weight
-                        if reps:
-                            total_reps += reps
-                        if duration:
-                            total_duration += duration
-                        if set_data.get("distance_meters") is not None:
-                            total_distance_meters += set_data["distance_meters"]
-
-                    # Only update if this is the most recent workout for this exercise
-                    if exercise_title not in exercise_data:
-                        pr_data = self._exercise_prs.get(exercise_title, {})
-                        pr_weight = (
-                            self._convert_weight(pr_data.get("weight_kg"))
-                            if pr_data.get("weight_kg")
-                            else None
-                        )
+        Returns:
+            True if the current data should be returned as is
+        """
+        first_failure = self.last_refresh_error is None
+        self.last_refresh_error = str(err)
+        if (
+            isinstance(err, HevyAuthError)
+            or self.data is None
+            or self.data_fetched_at is None
+            or dt_util.utcnow() - self.data_fetched_at
+            > timedelta(hours=STALE_DATA_MAX_HOURS)
+        ):
+            return False
+        if first_failure:
+            _LOGGER.warning(
+                "Hevy API unavailable, keeping data from %s: %s",
+                self.data_fetched_at.isoformat(),
+                err,
+            )
+        return True
 
-                        distance_pr_data = self._exercise_distance_prs.get(exercise_title, {})
-                        pr_distance = (
-                            self._convert_distance(distance_pr_data.get("distance_meters"))
-                            if distance_pr_data.get("distance_meters")
-                            else None
-                        )
+    def _build_data(
+        self, workouts: list[dict[str, Any]], workout_count: int
+    ) -> dict[str, Any]:
+        """Derive the sensor data from the workout history window.
 
-                        total_distance = self._convert_distance(total_distance_meters)
-
-                        exercise_data[exercise_title] = {
-                            "display_name": exercise.get("title", "Unknown"),
-                            "last_workout_date": workout.get("start_time"),
-                            "last_workout_sets": sets_converted,
-                            "weight": last_weight,
-                            "weight_unit": self._get_weight_unit(),
-                            "total_reps": total_reps if total_reps > 0 else None,
-                            "total_sets": len(sets),
-                            "exercise_template_id": template_id,
-                            "notes": exercise.get("notes"),
-                            "personal_record_weight": pr_weight,
-                            "personal_record_reps": pr_data.get("reps"),
-                            "best_set": self._get_best_set_string(sets),
-                            "total_duration_seconds": (
-                                total_duration if total_duration > 0 else None
-                            ),
-                            "total_distance": total_distance if total_distance_meters > 0 else None,
-                            "distance_unit": self._get_distance_unit() if total_distance_meters > 0 else None,
-                            "personal_record_distance": pr_distance,
-                            "personal_record_distance_unit": self._get_distance_unit() if pr_distance else None,
-                        }
+        Args:
+            workouts: Workouts in the refresh window, most recent first
+            workout_count: Total number of workouts on the account
 
-            # Inject weekly distance into per-exercise data
-            weekly_distance_data = self._calculate_weekly_distance()
-            exercise_breakdown = weekly_distance_data.get("exercise_breakdown", {})
-            distance_unit = weekly_distance_data.get("distance_unit")
-            for title, weekly_dist in exercise_breakdown.items():
-                key = title.lower()
-                if key in exercise_data:
-                    exercise_data[key]["weekly_distance"] = weekly_dist
-                    exercise_data[key]["weekly_distance_unit"] = distance_unit
-
-            # Build deduplicated, sorted list of workout dates (YYYY-MM-DD)
-            workout_dates = set()
-            for workout in workouts:
-                start_time = workout.get("start_time")
-                if start_time:
-                    try:
-                        dt = datetime.fromisoformat(
-                            start_time.replace("Z", "+00:00")
-                        )
-                        workout_dates.add(
-                            dt_util.as_local(dt).strftime("%Y-%m-%d")
-                        )
-                    except (ValueError, AttributeError):
-                        continue
-            workout_dates_sorted = sorted(workout_dates)
+        Returns:
+            Dict containing all processed workout data
+        """
+        # Process data for sensors
+        self.views.prune(workouts)
+        last_workout = workouts[0] if workouts else None
+        now = dt_util.now()
 
-            # Build workout_summaries dict keyed by date string
-            workout_summaries: dict[str, dict[str, Any]] = {}
-            for workout in workouts:
-                start_time = workout.get("start_time")
-                end_time = workout.get("end_time")
-                if not start_time:
-                    continue
+        # Calculate weekly workout count
+        week_ago = now - timedelta(days=7)
+        weekly_count = 0
+        for workout in workouts:
+            start_time = workout.get("start_time")
+            if start_time:
                 try:
                     workout_dt = datetime.fromisoformat(
                         start_time.replace("Z", "+00:00")
                     )
-                    date_key = dt_util.as_local(workout_dt).strftime("%Y-%m-%d")
+                    if workout_dt > week_ago:
+                        weekly_count += 1
                 except (ValueError, AttributeError):
                     continue
 
-                # Skip if we already have an entry for this date (first = most recent)
-                if date_key in workout_summaries:
+        # Check if worked out today
+        worked_out_today = False
+        if last_workout:
+            start_time = last_workout.get("start_time")
+            if start_time:
+                try:
+                    workout_dt = datetime.fromisoformat(
+                        start_time.replace("Z", "+00:00")
+                    )
+                    worked_out_today = (
+                        dt_util.as_local(workout_dt).date() == now.date()
+                    )
+                except (ValueError, AttributeError):
+                    pass
+
+        # Converted exercises of the last workout, shared with the
+        # per-exercise data and the day summaries below
+        exercises_summary = (
+            self.views.exercises(last_workout) if last_workout else ()
+        )
+
+        # Calculate workout duration
+        workout_duration_minutes = None
+        if last_workout:
+            start_time = last_workout.get("start_time")
+            end_time = last_workout.get("end_time")
+            if start_time and end_time:
+                try:
+                    start_dt = datetime.fromisoformat(
+                        start_time.replace("Z", "+00:00")
+                    )
+                    end_dt = datetime.fromisoformat(end_time.replace("Z", "+00:00"))
+                    duration = end_dt - start_dt
+                    workout_duration_minutes = round(duration.total_seconds() / 60, 1)
+                except (ValueError, AttributeError):
+                    pass
+
+        weekly_distance_data = self._calculate_weekly_distance()
+        weekly_distances = {
+            title.lower(): distance
+            for title, distance in weekly_distance_data.get(
+                "exercise_breakdown", {}
+            ).items()
+        }
+
+        # Build per-exercise data from the most recent workout with each
+        exercise_data: dict[str, ReadOnlyDict[str, Any]] = {}
+        for workout in workouts:
+            for exercise, view in zip(
+                workout.get("exercises") or [],
+                self.views.exercises(workout),
+                strict=True,
+            ):
+                exercise_title = (exercise.get("title") or "").lower()
+                if not exercise_title or exercise_title in exercise_data:
                     continue
 
-                # Calculate duration
-                duration_minutes = None
-                if end_time:
-                    try:
-                        end_dt = datetime.fromisoformat(
-                            end_time.replace("Z", "+00:00")
-                        )
-                        duration_minutes = round(
-                            (end_dt - workout_dt).total_seconds() / 60, 1
-                        )
-                    except (ValueError, AttributeError):
-                        pass
+                pr_data = self._exercise_prs.get(exercise_title, {})
+                pr_weight = (
+                    self._convert_weight(pr_data.get("weight_kg"))
+                    if pr_data.get("weight_kg")
+                    else None
+                )
 
-                # Build exercises list
-                summary_exercises: list[dict[str, Any]] = []
-                for exercise in workout.get("exercises", []):
-                    sets = exercise.get("sets", [])
-                    sets_converted = []
-                    total_reps = 0
-
-                    for set_data in sets:
-                        weight = self._convert_weight(set_data.get("weight_kg"))
-                        reps = set_data.get("reps")
-                        distance = self._convert_distance(set_data.get("distance_meters"))
-                        sets_converted.append({
-                            "type": set_data.get("type", "normal"),
-                            "weight": weight,
-                            "weight_unit": self._get_weight_unit(),
-                            "reps": reps,
-                            "distance": distance,
-                            "distance_unit": self._get_distance_unit(),
-                        })
-                        if reps:
-                            total_reps += reps
-
-                    summary_exercises.append({
-                        "name": exercise.get("title", "Unknown"),
-                        "sets": sets_converted,
-                        "best_set": self._get_best_set_string(sets),
-                        "total_reps": total_reps if total_reps > 0 else None,
-                        "notes": exercise.get("notes"),
-                    })
+                distance_pr_data = self._exercise_distance_prs.get(exercise_title, {})
+                pr_distance = (
+                    self._convert_distance(distance_pr_data.get("distance_meters"))
+                    if distance_pr_data.get("distance_meters")
+                    else None
+                )
 
-                workout_summaries[date_key] = {
-                    "title": workout.get("title", "Untitled"),
-                    "duration_minutes": duration_minutes,
-                    "total_volume": self._calculate_total_volume(workout),
-                    "total_volume_unit": self._get_weight_unit(),
-                    "exercise_count": len(summary_exercises),
-                    "exercises": summary_exercises,
+                sets = view["sets"]
+                entry = {
+                    "display_name": view["name"],
+                    "last_workout_date": workout.get("start_time"),
+                    "last_workout_sets": sets,
+                    "weight": next(
+                        (s["weight"] for s in reversed(sets) if s["weight"]), None
+                    ),
+                    "weight_unit": self._get_weight_unit(),
+                    "total_reps": view["total_reps"],
+                    "total_sets": len(sets),
+                    "exercise_template_id": exercise.get("exercise_template_id"),
+                    "notes": view["notes"],
+                    "personal_record_weight": pr_weight,
+                    "personal_record_reps": pr_data.get("reps"),
+                    "best_set": view["best_set"],
+                    "total_duration_seconds": view["total_duration_seconds"],
+                    "total_distance": view["total_distance"],
+                    "distance_unit": view["distance_unit"],
+                    "personal_record_distance": pr_distance,
+                    "personal_record_distance_unit": self._get_distance_unit() if pr_distance else None,
                 }
+                if exercise_title in weekly_distances:
+                    entry["weekly_distance"] = weekly_distances[exercise_title]
+                    entry["weekly_distance_unit"] = weekly_distance_data.get(
+                        "distance_unit"
+                    )
+                exercise_data[exercise_title] = ReadOnlyDict(entry)
 
-            return {
-                "workout_count": workout_count,
-                "last_workout": last_workout,
-                "last_workout_date": (
-                    last_workout.get("start_time") if last_workout else None
-                ),
-                "last_workout_title": (
-                    last_workout.get("title") if last_workout else None
-                ),
-                "workout_duration_minutes": workout_duration_minutes,
-                "total_volume": (
-                    self._calculate_total_volume(last_workout) if last_workout else 0
-                ),
-                "total_volume_unit": self._get_weight_unit(),
-                "exercises_summary": exercises_summary,
-                "weekly_workout_count": weekly_count,
-                "worked_out_today": worked_out_today,
-                "worked_out_this_week": weekly_count > 0,
-                "current_streak": self._calculate_current_streak(workouts),
-                "exercise_data": exercise_data,
-                "workouts": workouts,
-                "routine_data": self._detect_next_workout(),
-                "muscle_group_data": self._aggregate_muscle_groups(),
-                "weekly_muscle_volume": self._calculate_weekly_muscle_volume(),
-                "weekly_distance": weekly_distance_data,
-                "workout_dates": workout_dates_sorted,
-                "workout_summaries": workout_summaries,
-            }
+        # Build deduplicated, sorted list of workout dates (YYYY-MM-DD)
+        workout_dates = set()
+        for workout in workouts:
+            start_time = workout.get("start_time")
+            if start_time:
+                try:
+                    dt = datetime.fromisoformat(
+                        start_time.replace("Z", "+00:00")
+                    )
+                    workout_dates.add(
+                        dt_util.as_local(dt).strftime("%Y-%m-%d")
+                    )
+                except (ValueError, AttributeError):
+                    continue
+        workout_dates_sorted = sorted(workout_dates)
 
-        except HevyApiError as err:
-            raise UpdateFailed(f"Error communicating with Hevy API: {err}") from err
+        # Build workout_summaries dict keyed by date string
+        workout_summaries: dict[str, ReadOnlyDict[str, Any]] = {}
+        for workout in workouts:
+            start_time = workout.get("start_time")
+            if not start_time:
+                continue
+            try:
+                workout_dt = datetime.fromisoformat(
+                    start_time.replace("Z", "+00:00")
+                )
+                date_key = dt_util.as_local(workout_dt).strftime("%Y-%m-%d")
+            except (ValueError, AttributeError):
+                continue
+
+            # Skip if we already have an entry for this date (first = most recent)
+            if date_key not in workout_summaries:
+                workout_summaries[date_key] = self.views.summary(workout)
+
+        return {
+            "workout_count": workout_count,
+            "last_workout": last_workout,
+            "last_workout_date": (
+                last_workout.get("start_time") if last_workout else None
+            ),
+            "last_workout_title": (
+                last_workout.get("title") if last_workout else None
+            ),
+            "workout_duration_minutes": workout_duration_minutes,
+            "total_volume": (
+                self._calculate_total_volume(last_workout) if last_workout else 0
+            ),
+            "total_volume_unit": self._get_weight_unit(),
+            "exercises_summary": exercises_summary,
+            "weekly_workout_count": weekly_count,
+            "worked_out_today": worked_out_today,
+            "worked_out_this_week": weekly_count > 0,
+            "current_streak": self._calculate_current_streak(workouts),
+            "exercise_data": exercise_data,
+            "workouts": workouts,
+            "routine_data": self._detect_next_workout(),
+            "training_pattern": self._learn_training_pattern(),
+            "muscle_group_data": self._aggregate_muscle_groups(),
+            "weekly_muscle_volume": self._calculate_weekly_muscle_volume(),
+            "weekly_distance": weekly_distance_data,
+            "workout_dates": workout_dates_sorted,
+            "workout_summaries": workout_summaries,
+        }
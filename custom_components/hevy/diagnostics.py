@@ -0,0 +1,136 @@
+"""Diagnostics support for Hevy Workout Tracker."""
+from __future__ import annotations
+
+import sys
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.json import json_bytes
+
+from .const import ATTR_DETAIL_OMITTED, CONF_API_KEY, DOMAIN
+from .coordinator import HevyDataUpdateCoordinator
+
+TO_REDACT = {CONF_API_KEY}
+
+# Largest entity attribute payloads listed
+ATTRIBUTE_PAYLOADS_SHOWN = 10
+
+
+def approximate_size(obj: Any) -> int:
+    """Estimate the memory held by a JSON-like object graph, in bytes.
+
+    Sums sys.getsizeof over every container and leaf reachable from obj,
+    counting shared objects once. Other objects are not followed.
+
+    Args:
+        obj: Root of the object graph
+
+    Returns:
+        Approximate size in bytes
+    """
+    seen: set[int] = set()
+    pending = [obj]
+    total = 0
+    while pending:
+        item = pending.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        total += sys.getsizeof(item)
+        if isinstance(item, dict):
+            pending.extend(item.keys())
+            pending.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            pending.extend(item)
+    return total
+
+
+def _attribute_payloads(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> list[dict[str, Any]]:
+    """Return the entry's entities with the largest serialized attributes."""
+    registry = er.async_get(hass)
+    payloads = []
+    for entity in er.async_entries_for_config_entry(registry, entry.entry_id):
+        if (state := hass.states.get(entity.entity_id)) is None:
+            continue
+        payloads.append(
+            {
+                "entity_id": entity.entity_id,
+                "bytes": len(json_bytes(state.attributes)),
+                "omitted": list(state.attributes.get(ATTR_DETAIL_OMITTED, ())),
+            }
+        )
+    payloads.sort(key=lambda payload: payload["bytes"], reverse=True)
+    return payloads[:ATTRIBUTE_PAYLOADS_SHOWN]
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry.
+
+    Covers the data held in memory, the API client's request, cache,
+    and latency counters, and how long the last refresh spent in each
+    stage, so slowdowns can be diagnosed from a download.
+
+    Args:
+        hass: Home Assistant instance
+        entry: Config entry
+
+    Returns:
+        Diagnostics with the API key redacted
+    """
+    coordinator: HevyDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    workouts = coordinator._workout_history
+    responses = coordinator.responses
+
+    return {
+        "entry": {
+            "data": async_redact_data(entry.data, TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "refresh": {
+            "last_update_success": coordinator.last_update_success,
+            "data_fetched_at": (
+                coordinator.data_fetched_at.isoformat()
+                if coordinator.data_fetched_at
+                else None
+            ),
+            "last_error": coordinator.last_refresh_error,
+            "update_interval_seconds": (
+                coordinator.update_interval.total_seconds()
+                if coordinator.update_interval
+                else None
+            ),
+            "stage_ms": coordinator.last_refresh_timings,
+        },
+        "history": {
+            "workouts": len(workouts),
+            "sets": sum(
+                len(exercise.get("sets") or [])
+                for workout in workouts
+                for exercise in workout.get("exercises") or []
+            ),
+            "older_pages_cached": coordinator.history.cached_pages,
+            "distinct_converted_sets": coordinator.views.shared_sets,
+            "exercise_templates": len(coordinator.exercise_templates),
+            "routines": len(coordinator.routines),
+        },
+        "memory_bytes": {
+            "data": approximate_size(coordinator.data),
+            "workout_history": approximate_size(workouts),
+            "exercise_templates": approximate_size(coordinator.exercise_templates),
+            "routines": approximate_size(coordinator.routines),
+        },
+        "response_cache": {
+            "entries": len(responses),
+            "hits": responses.hits,
+            "misses": responses.misses,
+        },
+        "api": coordinator.client.stats,
+        "largest_attribute_payloads": _attribute_payloads(hass, entry),
+    }
@@ -0,0 +1,195 @@
+"""Streaming export of the full workout history to CSV or JSONL."""
+from __future__ import annotations
+
+import csv
+import logging
+import os
+from collections.abc import Iterator
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.json import json_dumps
+
+from .const import EVENT_EXPORT_PROGRESS, EXPORT_DIR
+
+if TYPE_CHECKING:
+    from .coordinator import HevyDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+EXPORT_FORMAT_CSV = "csv"
+EXPORT_FORMAT_JSONL = "jsonl"
+EXPORT_FORMATS = [EXPORT_FORMAT_CSV, EXPORT_FORMAT_JSONL]
+
+# One row per set, in API units so the export is lossless
+CSV_COLUMNS = [
+    "workout_id",
+    "workout_title",
+    "start_time",
+    "end_time",
+    "exercise_index",
+    "exercise_title",
+    "exercise_template_id",
+    "exercise_notes",
+    "set_index",
+    "set_type",
+    "weight_kg",
+    "reps",
+    "distance_meters",
+    "duration_seconds",
+    "rpe",
+]
+
+
+def _set_rows(workout: dict[str, Any]) -> Iterator[list[Any]]:
+    """Yield one CSV row per set of a workout."""
+    for exercise_index, exercise in enumerate(workout.get("exercises") or []):
+        for set_index, set_data in enumerate(exercise.get("sets") or []):
+            yield [
+                workout.get("id"),
+                workout.get("title"),
+                workout.get("start_time"),
+                workout.get("end_time"),
+                exercise_index,
+                exercise.get("title"),
+                exercise.get("exercise_template_id"),
+                exercise.get("notes"),
+                set_index,
+                set_data.get("type"),
+                set_data.get("weight_kg"),
+                set_data.get("reps"),
+                set_data.get("distance_meters"),
+                set_data.get("duration_seconds"),
+                set_data.get("rpe"),
+            ]
+
+
+class _ExportFile:
+    """Export file written through a temporary name and renamed on success.
+
+    Every method does blocking file I/O and runs in the executor.
+    """
+
+    def __init__(self, path: Path, export_format: str) -> None:
+        self._path = path
+        self._partial = path.with_name(f"{path.name}.part")
+        self._format = export_format
+        self._file: IO[str] | None = None
+        self._writer: Any = None
+
+    def open(self) -> None:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = self._partial.open("w", encoding="utf-8", newline="")
+        if self._format == EXPORT_FORMAT_CSV:
+            self._writer = csv.writer(self._file)
+            self._writer.writerow(CSV_COLUMNS)
+
+    def write(self, workouts: list[dict[str, Any]]) -> int:
+        """Append workouts and return the number of sets written."""
+        sets = 0
+        for workout in workouts:
+            if self._format == EXPORT_FORMAT_CSV:
+                for row in _set_rows(workout):
+                    self._writer.writerow(row)
+                    sets += 1
+            else:
+                self._file.write(f"{json_dumps(workout)}\n")
+                sets += sum(
+                    len(exercise.get("sets") or [])
+                    for exercise in workout.get("exercises") or []
+                )
+        return sets
+
+    def commit(self) -> None:
+        if self._file is not None:
+            self._file.close()
+        os.replace(self._partial, self._path)
+
+    def abort(self) -> None:
+        if self._file is not None:
+            self._file.close()
+        self._partial.unlink(missing_ok=True)
+
+
+async def async_export_history(
+    hass: HomeAssistant,
+    coordinator: HevyDataUpdateCoordinator,
+    config_entry_id: str,
+    export_format: str,
+    filename: str,
+) -> dict[str, Any]:
+    """Write the full workout history to a file, one page at a time.
+
+    Only one page of workouts is held in memory at once, file writes run
+    in the executor, and a progress event is fired after every page.
+
+    Args:
+        hass: Home Assistant instance
+        coordinator: Coordinator for the config entry
+        config_entry_id: Config entry ID, included in progress events
+        export_format: "csv" (one row per set) or "jsonl" (one workout per line)
+        filename: File name inside the export directory
+
+    Returns:
+        Path written and the number of workouts and sets exported
+
+    Raises:
+        HevyApiError: If a page fetch fails
+        OSError: If the file cannot be written
+    """
+    path = Path(hass.config.path(EXPORT_DIR, filename))
+    export = _ExportFile(path, export_format)
+    await hass.async_add_executor_job(export.open)
+
+    workouts_written = 0
+    sets_written = 0
+    page_count = 0
+    # Workouts logged mid-export shift page boundaries by a few items, so
+    # drop anything already written as part of the previous page
+    previous_ids: set[str] = set()
+    pages = coordinator.history.async_iter_pages()
+    try:
+        async for number, page_count, workouts in pages:
+            fresh = [w for w in workouts if w.get("id") not in previous_ids]
+            previous_ids = {w.get("id") for w in workouts}
+            sets_written += await hass.async_add_executor_job(export.write, fresh)
+            workouts_written += len(fresh)
+            hass.bus.async_fire(
+                EVENT_EXPORT_PROGRESS,
+                {
+                    "config_entry_id": config_entry_id,
+                    "path": str(path),
+                    "page": number,
+                    "page_count": page_count,
+                    "workouts": workouts_written,
+                    "sets": sets_written,
+                    "done": False,
+                },
+            )
+    except BaseException:
+        await hass.async_add_executor_job(export.abort)
+        raise
+
+    await hass.async_add_executor_job(export.commit)
+    hass.bus.async_fire(
+        EVENT_EXPORT_PROGRESS,
+        {
+            "config_entry_id": config_entry_id,
+            "path": str(path),
+            "page": page_count,
+            "page_count": page_count,
+            "workouts": workouts_written,
+            "sets": sets_written,
+            "done": True,
+        },
+    )
+    _LOGGER.info(
+        "Exported %d workouts (%d sets) to %s", workouts_written, sets_written, path
+    )
+    return {
+        "path": str(path),
+        "format": export_format,
+        "workouts": workouts_written,
+        "sets": sets_written,
+    }
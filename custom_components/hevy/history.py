@@ -0,0 +1,208 @@
+"""Workout history beyond the coordinator's refresh window."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from datetime import datetime
+from typing import Any
+
+from .api import HevyApiClient
+from .const import HISTORY_MAX_CACHED_PAGES, WORKOUT_PAGE_SIZE
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def parse_start_time(workout: dict[str, Any]) -> datetime | None:
+    """Parse a workout's start_time.
+
+    Args:
+        workout: Raw workout dict from the Hevy API
+
+    Returns:
+        Timezone-aware datetime, or None if missing or invalid
+    """
+    start_time = workout.get("start_time")
+    if not start_time:
+        return None
+    try:
+        return datetime.fromisoformat(start_time.replace("Z", "+00:00"))
+    except (ValueError, AttributeError):
+        return None
+
+
+class _WorkoutPage:
+    """One cached page of the /workouts endpoint (most recent first)."""
+
+    __slots__ = ("oldest", "workouts")
+
+    def __init__(self, workouts: list[dict[str, Any]]) -> None:
+        """Initialize the page.
+
+        Args:
+            workouts: Workouts on this page, most recent first
+        """
+        self.workouts = workouts
+        starts = [dt for dt in map(parse_start_time, workouts) if dt is not None]
+        self.oldest: datetime | None = min(starts) if starts else None
+
+
+class HevyWorkoutHistory:
+    """Lazily fetched, LRU-bounded cache of /workouts pages.
+
+    The API lists workouts most recent first, so page numbers are ordered
+    by time. A range query bisects over page numbers to find the first page
+    reaching back into the range, then walks forward until the range start
+    is covered. Every page fetched (including the ones the coordinator
+    fetches on refresh) is cached, so browsing old months costs a handful
+    of requests the first time and none afterwards.
+    """
+
+    def __init__(
+        self,
+        client: HevyApiClient,
+        max_pages: int = HISTORY_MAX_CACHED_PAGES,
+    ) -> None:
+        """Initialize the history store.
+
+        Args:
+            client: Hevy API client
+            max_pages: Maximum number of pages kept in the cache
+        """
+        self._client = client
+        self._max_pages = max_pages
+        self._pages: OrderedDict[int, _WorkoutPage] = OrderedDict()
+        self._page_count: int | None = None
+        self._workout_count: int | None = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def cached_pages(self) -> int:
+        """Return the number of pages currently cached."""
+        return len(self._pages)
+
+    def set_workout_count(self, workout_count: int) -> None:
+        """Drop cached pages if the total workout count has changed.
+
+        A new or deleted workout shifts every page boundary, so pages cached
+        under a different count can no longer be trusted.
+
+        Args:
+            workout_count: Total workout count reported by the API
+        """
+        if self._workout_count is not None and workout_count != self._workout_count:
+            self._pages.clear()
+            self._page_count = None
+        self._workout_count = workout_count
+
+    def add_page(self, page: int, data: dict[str, Any]) -> None:
+        """Cache a /workouts page response.
+
+        Args:
+            page: Page number (1-indexed)
+            data: Raw response from HevyApiClient.get_workouts
+        """
+        self._page_count = data.get("page_count", self._page_count or 1)
+        self._pages[page] = _WorkoutPage(data.get("workouts") or [])
+        self._pages.move_to_end(page)
+        while len(self._pages) > self._max_pages:
+            self._pages.popitem(last=False)
+
+    async def _async_get_page(self, page: int) -> _WorkoutPage:
+        cached = self._pages.get(page)
+        if cached is not None:
+            self._pages.move_to_end(page)
+            return cached
+        _LOGGER.debug("Fetching workout history page %d", page)
+        data = await self._client.get_workouts(page=page, page_size=WORKOUT_PAGE_SIZE)
+        self.add_page(page, data)
+        return self._pages[page]
+
+    async def _async_find_first_page(self, end: datetime) -> int:
+        """Find the first page holding a workout that started before end."""
+        if self._page_count is None:
+            await self._async_get_page(1)
+        lo, hi = 1, self._page_count or 1
+
+        # Narrow the search with what is already cached before fetching
+        for number, page in self._pages.items():
+            if page.oldest is None or page.oldest < end:
+                hi = min(hi, number)
+            else:
+                lo = max(lo, number + 1)
+        lo = min(lo, hi)
+
+        while lo < hi:
+            mid = (lo + hi) // 2
+            page = await self._async_get_page(mid)
+            if page.oldest is None or page.oldest < end:
+                hi = mid
+            else:
+                lo = mid + 1
+        return lo
+
+    async def async_workouts_between(
+        self, start: datetime, end: datetime
+    ) -> list[dict[str, Any]]:
+        """Return workouts that started in [start, end), most recent first.
+
+        Args:
+            start: Start of the range (inclusive)
+            end: End of the range (exclusive)
+
+        Returns:
+            List of raw workout dicts
+
+        Raises:
+            HevyApiError: If a page fetch fails
+        """
+        async with self._lock:
+            number = await self._async_find_first_page(end)
+            workouts: list[dict[str, Any]] = []
+            while True:
+                page = await self._async_get_page(number)
+                for workout in page.workouts:
+                    workout_dt = parse_start_time(workout)
+                    if workout_dt is not None and start <= workout_dt < end:
+                        workouts.append(workout)
+                if (
+                    page.oldest is None
+                    or page.oldest < start
+                    or number >= (self._page_count or 1)
+                ):
+                    break
+                number += 1
+            return workouts
+
+    async def async_iter_pages(
+        self,
+    ) -> AsyncIterator[tuple[int, int, list[dict[str, Any]]]]:
+        """Walk every /workouts page, most recent first.
+
+        Cached pages are reused, but pages fetched here are not added to
+        the cache, so a full walk over years of history neither holds it
+        all in memory nor evicts the pages the calendar is using.
+
+        Yields:
+            (page number, page count, workouts on the page)
+
+        Raises:
+            HevyApiError: If a page fetch fails
+        """
+        number = 1
+        while True:
+            cached = self._pages.get(number)
+            if cached is not None:
+                workouts = cached.workouts
+            else:
+                data = await self._client.get_workouts(
+                    page=number, page_size=WORKOUT_PAGE_SIZE
+                )
+                workouts = data.get("workouts") or []
+                self._page_count = data.get("page_count", self._page_count or 1)
+            page_count = self._page_count or 1
+            yield number, page_count, workouts
+            if not workouts or number >= page_count:
+                return
+            number += 1
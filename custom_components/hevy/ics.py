@@ -0,0 +1,223 @@
+"""iCalendar (.ics) feed of Hevy workouts."""
+from __future__ import annotations
+
+import hashlib
+import logging
+from datetime import datetime, timedelta, timezone
+from http import HTTPStatus
+from typing import Any
+
+from aiohttp import web
+from homeassistant.components.calendar import CalendarEvent
+from homeassistant.components.http import KEY_HASS, HomeAssistantView
+
+from .api import HevyApiError
+from .calendar import _workout_to_event
+from .const import DOMAIN, ICS_FEED_DAYS
+from .coordinator import HevyDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/calendar; charset=utf-8"
+PRODID = "-//DisplacedForest//Hevy Workout Tracker//EN"
+MAX_LINE_OCTETS = 75
+EVENTS_PER_CHUNK = 20
+
+
+def _escape(text: str) -> str:
+    """Escape a TEXT property value (RFC 5545 section 3.3.11)."""
+    return (
+        text.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def _fold(line: str) -> str:
+    """Fold a content line to 75 octets, without splitting a UTF-8 sequence."""
+    if len(line.encode()) <= MAX_LINE_OCTETS:
+        return line + "\r\n"
+    parts: list[str] = []
+    current = ""
+    size = 0
+    for char in line:
+        char_size = len(char.encode())
+        if size + char_size > MAX_LINE_OCTETS:
+            parts.append(current)
+            # Continuation lines start with a space, which counts toward 75
+            current = " "
+            size = 1
+        current += char
+        size += char_size
+    parts.append(current)
+    return "\r\n".join(parts) + "\r\n"
+
+
+def _format_dt(value: datetime) -> str:
+    return value.astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def _vevent(event: CalendarEvent, workout: dict[str, Any]) -> str:
+    """Render one workout event as a VEVENT block.
+
+    DTSTAMP uses the workout's own timestamps rather than the request time,
+    so an unchanged workout always renders to the same bytes.
+    """
+    stamp = event.start
+    updated_at = workout.get("updated_at")
+    if updated_at:
+        try:
+            stamp = datetime.fromisoformat(updated_at.replace("Z", "+00:00"))
+        except (ValueError, AttributeError):
+            pass
+
+    lines = [
+        "BEGIN:VEVENT",
+        f"UID:{event.uid}@{DOMAIN}",
+        f"DTSTAMP:{_format_dt(stamp)}",
+        f"DTSTART:{_format_dt(event.start)}",
+        f"DTEND:{_format_dt(event.end)}",
+        f"SUMMARY:{_escape(event.summary)}",
+    ]
+    if event.description:
+        lines.append(f"DESCRIPTION:{_escape(event.description)}")
+    lines.append("END:VEVENT")
+    return "".join(_fold(line) for line in lines)
+
+
+def feed_etag(
+    entry_id: str,
+    coordinator: HevyDataUpdateCoordinator,
+    feed_start: datetime | None,
+    workouts: list[dict[str, Any]],
+) -> str:
+    """Return the ETag for an entry's feed, derived from what it contains.
+
+    Hashes the workouts' identities and edit times rather than a counter,
+    so the tag survives a restart only if the feed is unchanged and moves
+    when the rolling window does.
+
+    Args:
+        entry_id: Config entry ID
+        coordinator: Coordinator serving the feed
+        feed_start: Start of the feed's window, or None if unbounded
+        workouts: Workouts the feed renders
+
+    Returns:
+        Quoted ETag header value
+    """
+    digest = hashlib.md5(
+        f"{entry_id}:{coordinator.unit_system}:"
+        f"{feed_start.isoformat() if feed_start else ''}".encode()
+    )
+    for workout in workouts:
+        digest.update(
+            "|".join(
+                str(workout.get(key))
+                for key in ("id", "updated_at", "start_time", "end_time", "title")
+            ).encode()
+        )
+    return f'"{digest.hexdigest()[:16]}"'
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Return whether an If-None-Match header lists etag (RFC 9110 13.1.2).
+
+    The comparison is weak: a W/ prefix on either side is ignored.
+    """
+    etag = etag.removeprefix("W/")
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+class HevyCalendarFeedView(HomeAssistantView):
+    """Serve a config entry's workouts as an iCalendar feed."""
+
+    url = "/api/hevy/{entry_id}/workouts.ics"
+    name = "api:hevy:workouts_ics"
+    requires_auth = True
+
+    async def get(self, request: web.Request, entry_id: str) -> web.StreamResponse:
+        """Stream the feed, or answer 304 if the client's copy is current.
+
+        Args:
+            request: Incoming HTTP request
+            entry_id: Config entry ID from the URL
+
+        Returns:
+            Streamed .ics response, or an empty 304/404/503 response
+        """
+        hass = request.app[KEY_HASS]
+        coordinator: HevyDataUpdateCoordinator | None = hass.data.get(
+            DOMAIN, {}
+        ).get(entry_id)
+        if not isinstance(coordinator, HevyDataUpdateCoordinator):
+            return web.Response(status=HTTPStatus.NOT_FOUND)
+
+        workouts: list[dict[str, Any]] = list(
+            (coordinator.data or {}).get("workouts", [])
+        )
+        window_start = coordinator.window_start
+        feed_start: datetime | None = None
+        if window_start is not None:
+            feed_start = window_start - timedelta(days=ICS_FEED_DAYS)
+            # Fetch the older pages (usually cached) before the ETag, which
+            # covers them, and before any bytes go out, so an API failure
+            # becomes a clean 503 rather than a truncated feed a client
+            # would cache.
+            try:
+                workouts.extend(
+                    await coordinator.history.async_workouts_between(
+                        feed_start, window_start
+                    )
+                )
+            except HevyApiError as err:
+                _LOGGER.warning("Failed to fetch workouts for the .ics feed: %s", err)
+                return web.Response(status=HTTPStatus.SERVICE_UNAVAILABLE)
+
+        etag = feed_etag(entry_id, coordinator, feed_start, workouts)
+        if _etag_matches(request.headers.get("If-None-Match", ""), etag):
+            return web.Response(status=HTTPStatus.NOT_MODIFIED, headers={"ETag": etag})
+
+        response = web.StreamResponse(
+            headers={
+                "Content-Type": CONTENT_TYPE,
+                "ETag": etag,
+                "Cache-Control": "private, no-cache",
+            }
+        )
+        await response.prepare(request)
+        await response.write(
+            (
+                "BEGIN:VCALENDAR\r\n"
+                "VERSION:2.0\r\n"
+                f"PRODID:{PRODID}\r\n"
+                "CALSCALE:GREGORIAN\r\n"
+                "X-WR-CALNAME:Hevy workouts\r\n"
+            ).encode()
+        )
+
+        seen: set[str] = set()
+        chunk: list[str] = []
+        for workout in workouts:
+            workout_id = workout.get("id")
+            if workout_id in seen:
+                continue
+            event = _workout_to_event(workout, coordinator)
+            if event is None or not event.uid:
+                continue
+            seen.add(workout_id)
+            chunk.append(_vevent(event, workout))
+            if len(chunk) >= EVENTS_PER_CHUNK:
+                await response.write("".join(chunk).encode())
+                chunk = []
+
+        chunk.append("END:VCALENDAR\r\n")
+        await response.write("".join(chunk).encode())
+        await response.write_eof()
+        return response
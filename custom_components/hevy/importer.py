@@ -0,0 +1,564 @@
+"""Bulk import of workouts from CSV exports of other trackers."""
+from __future__ import annotations
+
+import asyncio
+import csv
+import logging
+import re
+from collections.abc import AsyncIterator
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .api import HevyApiError, HevyAuthError, HevyRequestError
+from .const import (
+    DOMAIN,
+    IMPORT_CONCURRENCY,
+    IMPORT_DIR,
+    IMPORT_READ_ROWS,
+    IMPORT_STORAGE_VERSION,
+    KG_TO_LBS,
+    METERS_TO_KM,
+    METERS_TO_MILES,
+    UNIT_SYSTEM_METRIC,
+    WORKOUT_EVENT_PAGE_SIZE,
+)
+from .history import parse_start_time
+from .outbox import unwrap_created_workout
+
+if TYPE_CHECKING:
+    from .coordinator import HevyDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_IMPORT_TITLE = "Imported workout"
+MAX_UNRESOLVED_LISTED = 10
+MAX_IMPORT_ERRORS = 20
+
+# Header (lowercased) -> field. Covers Strong and FitNotes exports as well
+# as the CSV written by export_history, so an export can be re-imported.
+# Columns without a unit in their name are in the integration's unit system,
+# except a distance with a "Distance Unit" column next to it (FitNotes).
+_COLUMNS = {
+    "date": "start",
+    "start_time": "start",
+    "end_time": "end",
+    "workout name": "workout",
+    "workout_title": "workout",
+    "duration": "duration",
+    "exercise name": "exercise",
+    "exercise": "exercise",
+    "exercise_title": "exercise",
+    "exercise_template_id": "template_id",
+    "set order": "set_order",
+    "set_type": "set_type",
+    "weight": "weight",
+    "weight_kg": "weight_kg",
+    "weight (kg)": "weight_kg",
+    "weight (kgs)": "weight_kg",
+    "weight (lbs)": "weight_lbs",
+    "reps": "reps",
+    "distance": "distance",
+    "distance_meters": "distance_meters",
+    "distance unit": "distance_unit",
+    "seconds": "seconds",
+    "time": "seconds",
+    "duration_seconds": "seconds",
+    "rpe": "rpe",
+    "notes": "notes",
+    "exercise_notes": "notes",
+}
+_REQUIRED_FIELDS = ("start", "exercise")
+
+# Strong marks warm-up, drop, and failure sets in its set order column
+_SET_ORDER_TYPES = {"w": "warmup", "d": "dropset", "f": "failure"}
+_SET_TYPES = {"warmup", "normal", "failure", "dropset"}
+# ...and writes rest periods as extra rows that carry no set
+_REST_TIMER = "rest timer"
+
+_DURATION_RE = re.compile(r"(\d+)\s*([hms])")
+_DURATION_UNITS = {"h": 3600, "m": 60, "s": 1}
+
+# Distance unit names -> meters
+_DISTANCE_UNITS = {
+    "m": 1,
+    "km": 1000,
+    "mi": 1609.344,
+    "ft": 0.3048,
+    "yd": 0.9144,
+}
+
+# Time given to a set without a duration when a date-only workout's end has
+# to be estimated, so it doesn't end the moment it starts
+_ESTIMATED_SET_SECONDS = 90
+
+
+def _number(value: str | None) -> float | None:
+    """Parse a CSV cell as a number, treating blanks and zero as missing."""
+    if not value:
+        return None
+    try:
+        number = float(value.replace(",", "."))
+    except ValueError:
+        return None
+    return number or None
+
+
+def _duration_seconds(value: str | None) -> int:
+    """Parse a duration like "1h 5m", "45m", or a plain number of seconds."""
+    if not value:
+        return 0
+    number = _number(value)
+    if number is not None:
+        return int(number)
+    return sum(
+        int(amount) * _DURATION_UNITS[unit]
+        for amount, unit in _DURATION_RE.findall(value.lower())
+    )
+
+
+def _set_seconds(value: str | None) -> float | None:
+    """Parse a set's time, as seconds or as FitNotes' "h:mm:ss" or "mm:ss"."""
+    if value and ":" in value:
+        seconds = 0.0
+        try:
+            for part in value.split(":"):
+                seconds = seconds * 60 + float(part)
+        except ValueError:
+            return None
+        return seconds or None
+    return _number(value)
+
+
+def _parse_time(value: str | None) -> datetime | None:
+    """Parse a row's date or date-time as an aware datetime."""
+    if not value:
+        return None
+    parsed = dt_util.parse_datetime(value)
+    if parsed is None:
+        day = dt_util.parse_date(value)
+        return dt_util.start_of_local_day(day) if day else None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=dt_util.DEFAULT_TIME_ZONE)
+    return parsed
+
+
+def _workout_key(start: datetime, title: str) -> str:
+    """Checkpoint key identifying an imported workout."""
+    return f"{dt_util.as_utc(start).isoformat()}|{title}"
+
+
+async def _async_settle_uncertain(
+    coordinator: HevyDataUpdateCoordinator, checkpoint: dict[str, Any]
+) -> None:
+    """Resolve workouts whose POST may have gone through before it failed.
+
+    Hevy records an event for every workout created, whatever its start
+    time, so the events since the earliest uncertain POST show which of
+    them exist. Those are checkpointed as imported; the rest are posted
+    again.
+
+    Args:
+        coordinator: Coordinator for the config entry
+        checkpoint: Import checkpoint, updated in place
+
+    Raises:
+        HevyApiError: If the events cannot be fetched; nothing is reposted
+    """
+    uncertain: dict[str, str] = checkpoint["uncertain"]
+    since = min(dt_util.parse_datetime(at) for at in uncertain.values())
+    page, page_count = 1, 1
+    while page <= page_count and uncertain:
+        data = await coordinator.client.get_workout_events(
+            page=page,
+            page_size=WORKOUT_EVENT_PAGE_SIZE,
+            since=since - timedelta(minutes=1),
+        )
+        page_count = data.get("page_count") or 1
+        for event in data.get("events") or []:
+            workout = event.get("workout")
+            if not workout or (start := parse_start_time(workout)) is None:
+                continue
+            key = _workout_key(start, workout.get("title") or "")
+            if uncertain.pop(key, None) is not None:
+                checkpoint["imported"][key] = workout.get("id")
+        page += 1
+    uncertain.clear()
+
+
+class _CsvReader:
+    """CSV file read in batches of rows with fields mapped to _COLUMNS.
+
+    Every method does blocking file I/O and runs in the executor.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._file: IO[str] | None = None
+        self._reader: Any = None
+        self._fields: dict[str, int] = {}
+
+    def open(self) -> None:
+        self._file = self._path.open(encoding="utf-8-sig", newline="")
+        sample = self._file.read(4096)
+        self._file.seek(0)
+        try:
+            dialect: Any = csv.Sniffer().sniff(sample, delimiters=",;\t")
+        except csv.Error:
+            dialect = csv.excel
+        self._reader = csv.reader(self._file, dialect)
+        header = next(self._reader, [])
+        self._fields = {}
+        for index, name in enumerate(header):
+            field = _COLUMNS.get(name.strip().lower())
+            if field is not None:
+                self._fields.setdefault(field, index)
+        missing = [field for field in _REQUIRED_FIELDS if field not in self._fields]
+        if missing:
+            self.close()
+            raise ValueError(f"CSV has no column for {', '.join(missing)}")
+
+    def read(self) -> list[dict[str, str]]:
+        """Read the next batch of rows; an empty list means end of file."""
+        rows: list[dict[str, str]] = []
+        for raw in self._reader:
+            if not any(cell.strip() for cell in raw):
+                continue
+            rows.append({
+                field: raw[index].strip() if index < len(raw) else ""
+                for field, index in self._fields.items()
+            })
+            if len(rows) == IMPORT_READ_ROWS:
+                break
+        return rows
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class _WorkoutImport:
+    """One run of import_workouts over a CSV file."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        coordinator: HevyDataUpdateCoordinator,
+        path: Path,
+        exercise_map: dict[str, str],
+        is_private: bool,
+    ) -> None:
+        self._hass = hass
+        self._coordinator = coordinator
+        self._path = path
+        self._exercise_map = {
+            name.strip().lower(): target for name, target in exercise_map.items()
+        }
+        self._is_private = is_private
+        metric = coordinator.unit_system == UNIT_SYSTEM_METRIC
+        # Factors from each weight and distance column to kg and meters
+        self._to_kg = {
+            "weight": 1 if metric else 1 / KG_TO_LBS,
+            "weight_kg": 1,
+            "weight_lbs": 1 / KG_TO_LBS,
+        }
+        self._to_meters = {
+            "distance": 1 / METERS_TO_KM if metric else 1 / METERS_TO_MILES,
+            "distance_meters": 1,
+        }
+        self._template_ids: dict[str, str] = {}
+
+    async def _async_rows(self) -> AsyncIterator[dict[str, str]]:
+        """Stream the file's rows, one executor job per batch."""
+        reader = _CsvReader(self._path)
+        await self._hass.async_add_executor_job(reader.open)
+        try:
+            while rows := await self._hass.async_add_executor_job(reader.read):
+                for row in rows:
+                    yield row
+        finally:
+            await self._hass.async_add_executor_job(reader.close)
+
+    def _resolve_target(self, target: str) -> str | None:
+        """Resolve an exercise_map value, a template ID or an exercise title."""
+        if target in self._coordinator.exercise_templates:
+            return target
+        return self._coordinator.exercise_index.find(target)
+
+    async def async_resolve_exercises(self) -> None:
+        """Resolve every exercise in the file before anything is posted.
+
+        Raises:
+            ServiceValidationError: If any exercise cannot be resolved
+        """
+        templates = self._coordinator.exercise_templates
+        index = self._coordinator.exercise_index
+        # Lowercased name -> name as listed in the error, with a suggestion
+        unresolved: dict[str, str] = {}
+        async for row in self._async_rows():
+            name = row["exercise"]
+            key = name.lower()
+            if not name or key in self._template_ids or key in unresolved:
+                continue
+            template_id: str | None = None
+            if key in self._exercise_map:
+                template_id = self._resolve_target(self._exercise_map[key])
+            elif row.get("template_id") in templates:
+                template_id = row["template_id"]
+            else:
+                template_id = index.find(name)
+            if template_id is not None:
+                self._template_ids[key] = template_id
+                continue
+            matches = index.search(name)
+            unresolved[key] = (
+                f"{name} (did you mean {templates[matches[0][0]].get('title')}?)"
+                if matches
+                else name
+            )
+
+        if unresolved:
+            listed = list(unresolved.values())[:MAX_UNRESOLVED_LISTED]
+            more = len(unresolved) - len(listed)
+            raise ServiceValidationError(
+                f"{len(unresolved)} exercises are not in the Hevy catalog: "
+                f"{', '.join(listed)}{f' and {more} more' if more else ''}. "
+                "Map them to Hevy exercises with exercise_map"
+            )
+
+    def _build_set(self, row: dict[str, str]) -> dict[str, Any] | None:
+        """Build an API set from a row, or None for rows without a set."""
+        if row.get("set_order", "").lower() == _REST_TIMER:
+            return None
+        weight_kg = None
+        for field, factor in self._to_kg.items():
+            value = _number(row.get(field))
+            if value is not None:
+                weight_kg = round(value * factor, 2)
+                break
+        distance_meters = None
+        for field, factor in self._to_meters.items():
+            value = _number(row.get(field))
+            if value is not None:
+                if field == "distance" and row.get("distance_unit"):
+                    factor = _DISTANCE_UNITS.get(row["distance_unit"].lower(), factor)
+                distance_meters = round(value * factor)
+                break
+        reps = _number(row.get("reps"))
+        seconds = _set_seconds(row.get("seconds"))
+        if weight_kg is None and reps is None and distance_meters is None and (
+            seconds is None
+        ):
+            return None
+
+        set_type = "normal"
+        if row.get("set_type", "").lower() in _SET_TYPES:
+            set_type = row["set_type"].lower()
+        elif row.get("set_order", "").lower() in _SET_ORDER_TYPES:
+            set_type = _SET_ORDER_TYPES[row["set_order"].lower()]
+
+        return {
+            "type": set_type,
+            "weight_kg": weight_kg,
+            "reps": int(reps) if reps is not None else None,
+            "distance_meters": distance_meters,
+            "duration_seconds": int(seconds) if seconds is not None else None,
+            "rpe": _number(row.get("rpe")),
+        }
+
+    def _build_workout(
+        self, start: datetime, rows: list[dict[str, str]]
+    ) -> dict[str, Any] | None:
+        """Build a create_workout payload from one workout's rows."""
+        exercises: list[dict[str, Any]] = []
+        for row in rows:
+            set_payload = self._build_set(row)
+            if set_payload is None:
+                continue
+            template_id = self._template_ids[row["exercise"].lower()]
+            if not exercises or exercises[-1]["exercise_template_id"] != template_id:
+                exercises.append({
+                    "exercise_template_id": template_id,
+                    "notes": row.get("notes") or None,
+                    "sets": [],
+                })
+            exercises[-1]["sets"].append(set_payload)
+        if not exercises:
+            return None
+
+        first = rows[0]
+        end = _parse_time(first.get("end"))
+        if end is None:
+            end = start + timedelta(seconds=_duration_seconds(first.get("duration")))
+        if end <= start:
+            # Date-only exports (FitNotes) have no workout length; add up
+            # the sets instead of posting a workout that takes no time
+            end = start + timedelta(
+                seconds=sum(
+                    set_payload["duration_seconds"] or _ESTIMATED_SET_SECONDS
+                    for exercise in exercises
+                    for set_payload in exercise["sets"]
+                )
+            )
+        return {
+            "title": first.get("workout") or DEFAULT_IMPORT_TITLE,
+            "is_private": self._is_private,
+            "start_time": start.isoformat(),
+            "end_time": end.isoformat(),
+            "exercises": exercises,
+        }
+
+    async def async_workouts(self) -> AsyncIterator[tuple[str, dict[str, Any]]]:
+        """Group consecutive rows with the same start and title into workouts.
+
+        Yields:
+            (checkpoint key, create_workout payload) pairs
+        """
+        current: tuple[datetime, str] | None = None
+        rows: list[dict[str, str]] = []
+        async for row in self._async_rows():
+            start = _parse_time(row["start"])
+            if start is None or not row["exercise"]:
+                continue
+            group = (start, row.get("workout", ""))
+            if group != current:
+                if current is not None and (
+                    workout := self._build_workout(current[0], rows)
+                ):
+                    yield _workout_key(current[0], workout["title"]), workout
+                current, rows = group, []
+            rows.append(row)
+        if current is not None and (workout := self._build_workout(current[0], rows)):
+            yield _workout_key(current[0], workout["title"]), workout
+
+
+async def async_import_workouts(
+    hass: HomeAssistant,
+    coordinator: HevyDataUpdateCoordinator,
+    config_entry_id: str,
+    filename: str,
+    exercise_map: dict[str, str],
+    is_private: bool = False,
+) -> dict[str, Any]:
+    """Import workouts from a CSV file in the imports directory.
+
+    The file is streamed twice: once to resolve every exercise name, so a
+    missing mapping fails the import before anything is posted, and once
+    to post workouts a few at a time. Each posted workout is recorded in a
+    per-entry checkpoint, so an interrupted or partly failed import can be
+    run again and only posts what is missing. A POST that failed without
+    Hevy rejecting it is recorded as uncertain, and the next run checks
+    whether it created the workout before posting it again.
+
+    Args:
+        hass: Home Assistant instance
+        coordinator: Coordinator for the config entry
+        config_entry_id: Config entry ID, used for the checkpoint store
+        filename: CSV file name inside IMPORT_DIR
+        exercise_map: Source exercise name to Hevy title or template ID
+        is_private: Whether imported workouts are private
+
+    Returns:
+        Counts of imported, skipped, failed, and uncertain workouts, with
+        the errors
+
+    Raises:
+        ServiceValidationError: If the file is unusable or an exercise cannot
+            be resolved
+        HevyAuthError: If Hevy rejects the API key
+        OSError: If the file cannot be read
+    """
+    path = Path(hass.config.path(IMPORT_DIR, filename))
+    run = _WorkoutImport(hass, coordinator, path, exercise_map, is_private)
+    try:
+        await run.async_resolve_exercises()
+    except ValueError as err:
+        raise ServiceValidationError(str(err)) from err
+
+    store: Store[dict[str, Any]] = Store(
+        hass, IMPORT_STORAGE_VERSION, f"{DOMAIN}.{config_entry_id}.imports"
+    )
+    checkpoint = await store.async_load() or {"imported": {}}
+    checkpoint.setdefault("uncertain", {})
+    if checkpoint["uncertain"]:
+        await _async_settle_uncertain(coordinator, checkpoint)
+        await store.async_save(checkpoint)
+    imported: dict[str, str | None] = checkpoint["imported"]
+    # Checkpoint key -> when a POST that may have created it was sent
+    uncertain: dict[str, str] = checkpoint["uncertain"]
+
+    semaphore = asyncio.Semaphore(IMPORT_CONCURRENCY)
+    pending: set[asyncio.Task[None]] = set()
+    errors: list[dict[str, Any]] = []
+    counts = {"imported": 0, "skipped": 0, "failed": 0, "uncertain": 0}
+    auth_error: HevyAuthError | None = None
+
+    async def _create(key: str, workout: dict[str, Any]) -> None:
+        nonlocal auth_error
+        sent_at = dt_util.utcnow().isoformat()
+        try:
+            created = await coordinator.client.create_workout({"workout": workout})
+        except HevyAuthError as err:
+            auth_error = err
+            return
+        except HevyApiError as err:
+            if isinstance(err, HevyRequestError):
+                counts["failed"] += 1
+            else:
+                # Timed out, lost, or failing server side: it may exist at
+                # Hevy, so the next run checks before posting it again
+                counts["uncertain"] += 1
+                uncertain[key] = sent_at
+                await store.async_save(checkpoint)
+            if len(errors) < MAX_IMPORT_ERRORS:
+                errors.append({
+                    "start_time": workout["start_time"],
+                    "title": workout["title"],
+                    "error": str(err),
+                })
+            return
+        finally:
+            semaphore.release()
+        imported[key] = unwrap_created_workout(created).get("id")
+        counts["imported"] += 1
+        await store.async_save(checkpoint)
+
+    try:
+        async for key, workout in run.async_workouts():
+            if key in imported:
+                counts["skipped"] += 1
+                continue
+            # Waiting here keeps at most IMPORT_CONCURRENCY workouts in
+            # flight, so the file is never read far ahead of the API
+            await semaphore.acquire()
+            if auth_error is not None:
+                break
+            task = hass.async_create_task(_create(key, workout))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+    finally:
+        if pending:
+            await asyncio.gather(*pending)
+
+    _LOGGER.info(
+        "Imported %d workouts from %s (%d already imported, %d failed, "
+        "%d uncertain)",
+        counts["imported"],
+        path,
+        counts["skipped"],
+        counts["failed"],
+        counts["uncertain"],
+    )
+    if counts["imported"]:
+        # Imports are mostly older than the refresh window, so one refresh
+        # is cheaper than ingesting every created workout locally
+        await coordinator.async_request_refresh()
+    if auth_error is not None:
+        raise auth_error
+    return {**counts, "errors": errors}
@@ -0,0 +1,136 @@
+"""Incremental decoding of a JSON object's array member from a byte stream."""
+from __future__ import annotations
+
+import codecs
+import json
+from collections.abc import AsyncIterable, AsyncIterator
+from typing import Any
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+# Characters a number can continue with after a prefix that decodes on its own
+_NUMBER_CONTINUATION = frozenset(".eE+-")
+
+
+class _StreamBuffer:
+    """Decoded text of a byte stream, holding only what is not consumed yet."""
+
+    def __init__(self, chunks: AsyncIterable[bytes]) -> None:
+        self._chunks = chunks.__aiter__()
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self.text = ""
+        self.pos = 0
+        self.eof = False
+
+    async def fill(self) -> bool:
+        """Append the next chunk, dropping consumed text.
+
+        Returns:
+            False once the stream is exhausted
+        """
+        if self.eof:
+            return False
+        try:
+            chunk = await anext(self._chunks)
+        except StopAsyncIteration:
+            self.eof = True
+            tail = self._utf8.decode(b"", final=True)
+        else:
+            tail = self._utf8.decode(chunk)
+        self.text = self.text[self.pos :] + tail
+        self.pos = 0
+        return True
+
+    async def peek(self) -> str:
+        """Skip whitespace and return the next character, or "" at the end."""
+        while True:
+            while self.pos < len(self.text) and self.text[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            if not await self.fill():
+                return ""
+
+    async def value(self) -> Any:
+        """Decode the JSON value at the current position.
+
+        Raises:
+            ValueError: If the stream does not hold a valid value here
+        """
+        await self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.text, self.pos)
+            except json.JSONDecodeError:
+                if await self.fill():
+                    continue
+                raise
+            # A number (or anything) ending at the buffer's end may continue
+            # in the next chunk, and so may one cut after "12." or "1e-"
+            if (
+                _NUMBER_CONTINUATION.issuperset(self.text[end:])
+                and await self.fill()
+            ):
+                continue
+            self.pos = end
+            return value
+
+
+async def iter_array_items(
+    chunks: AsyncIterable[bytes], key: str, meta: dict[str, Any]
+) -> AsyncIterator[Any]:
+    """Yield the items of one array member of a top-level JSON object.
+
+    Items are decoded one at a time as their bytes arrive, so at most one
+    item and one chunk of text are held at once. The object's other
+    members are decoded into meta as they are passed; members after the
+    array are only seen if iteration runs to the end.
+
+    Args:
+        chunks: Raw response body chunks
+        key: Name of the array member to stream
+        meta: Receives the object's other members
+
+    Yields:
+        Each decoded array item, in order
+
+    Raises:
+        ValueError: If the body is not a JSON object or is truncated
+    """
+    buffer = _StreamBuffer(chunks)
+    if await buffer.peek() != "{":
+        raise ValueError("Expected a JSON object")
+    buffer.pos += 1
+
+    while True:
+        char = await buffer.peek()
+        if char == "}":
+            buffer.pos += 1
+            return
+        if char == ",":
+            buffer.pos += 1
+            continue
+        if char != '"':
+            raise ValueError("Unexpected end of JSON object")
+
+        name = await buffer.value()
+        if await buffer.peek() != ":":
+            raise ValueError(f"Expected ':' after {name!r}")
+        buffer.pos += 1
+
+        if name != key or await buffer.peek() != "[":
+            meta[name] = await buffer.value()
+            continue
+
+        buffer.pos += 1
+        while True:
+            char = await buffer.peek()
+            if char == "]":
+                buffer.pos += 1
+                break
+            if char == ",":
+                buffer.pos += 1
+                continue
+            if not char:
+                raise ValueError("Unexpected end of JSON array")
+            yield await buffer.value()
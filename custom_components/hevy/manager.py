@@ -0,0 +1,99 @@
+"""API clients and request budget shared by all Hevy config entries."""
+from __future__ import annotations
+
+from datetime import timedelta
+from itertools import count
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .api import HevyApiClient
+from .breaker import HevyCircuitBreaker
+from .const import (
+    API_MAX_CONCURRENT,
+    API_RATE_BURST,
+    API_RATE_LIMIT,
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_MAX_RESET_SECONDS,
+    BREAKER_RESET_SECONDS,
+    DATA_CLIENT_MANAGER,
+)
+from .scheduler import RequestScheduler
+
+# Golden ratio conjugate: each new slot lands in the widest gap left
+# between the earlier ones, however many entries there end up being
+_STAGGER_STEP = 0.618033988749895
+
+
+class HevyClientManager:
+    """Hand out API clients that share one session, scheduler, and breaker.
+
+    With several accounts configured, every entry's requests draw from
+    the same rate budget and in-flight cap, and each entry gets a slot
+    that spreads its polls across the interval instead of lining them
+    up with the others. An outage is detected once for all accounts,
+    and a single probe checks for recovery.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the manager.
+
+        Args:
+            hass: Home Assistant instance
+        """
+        self._session = async_get_clientsession(hass)
+        self.scheduler = RequestScheduler(
+            API_RATE_LIMIT, API_RATE_BURST, API_MAX_CONCURRENT
+        )
+        self.breaker = HevyCircuitBreaker(
+            BREAKER_FAILURE_THRESHOLD, BREAKER_RESET_SECONDS, BREAKER_MAX_RESET_SECONDS
+        )
+        # Entry ID -> stagger slot, reused once its entry unloads
+        self._slots: dict[str, int] = {}
+
+    @property
+    def entry_count(self) -> int:
+        return len(self._slots)
+
+    @callback
+    def async_get_client(self, entry_id: str, api_key: str) -> HevyApiClient:
+        """Create the API client for a config entry and assign its slot."""
+        if entry_id not in self._slots:
+            taken = set(self._slots.values())
+            self._slots[entry_id] = next(slot for slot in count() if slot not in taken)
+        return HevyApiClient(api_key, self._session, self.scheduler, self.breaker)
+
+    def poll_offset(self, entry_id: str, update_interval: timedelta) -> timedelta:
+        """Return how far to shift an entry's polls within its interval.
+
+        The first entry is not shifted; later ones are spread out by the
+        golden ratio, so the offsets stay apart as entries are added.
+        """
+        fraction = (self._slots.get(entry_id, 0) * _STAGGER_STEP) % 1
+        return timedelta(seconds=round(update_interval.total_seconds() * fraction))
+
+    @callback
+    def async_release(self, entry_id: str) -> None:
+        """Free the slot of an unloaded config entry."""
+        self._slots.pop(entry_id, None)
+
+
+@callback
+def async_get_client_manager(hass: HomeAssistant) -> HevyClientManager:
+    """Return the shared client manager, creating it on first use."""
+    manager: HevyClientManager | None = hass.data.get(DATA_CLIENT_MANAGER)
+    if manager is None:
+        manager = hass.data[DATA_CLIENT_MANAGER] = HevyClientManager(hass)
+    return manager
+
+
+@callback
+def async_release_client(hass: HomeAssistant, entry_id: str) -> None:
+    """Release an entry's client, dropping the manager after the last one."""
+    manager: HevyClientManager | None = hass.data.get(DATA_CLIENT_MANAGER)
+    if manager is None:
+        return
+    manager.async_release(entry_id)
+    if not manager.entry_count:
+        manager.scheduler.close()
+        hass.data.pop(DATA_CLIENT_MANAGER)
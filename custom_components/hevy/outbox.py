@@ -0,0 +1,323 @@
+"""Persisted write-behind queue for workouts logged through the integration."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
+from uuid import uuid4
+
+from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .api import HevyApiError, HevyAuthError, HevyConnectionError, HevyRequestError
+from .const import (
+    DOMAIN,
+    EVENT_WORKOUT_REJECTED,
+    OUTBOX_RETRY_BASE_SECONDS,
+    OUTBOX_RETRY_MAX_SECONDS,
+    OUTBOX_STORAGE_VERSION,
+    WORKOUT_PAGE_SIZE,
+)
+from .history import parse_start_time
+from .scheduler import RequestPriority, request_priority
+
+if TYPE_CHECKING:
+    from .coordinator import HevyDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+PENDING_ID_PREFIX = "pending_"
+
+
+def unwrap_created_workout(created: dict[str, Any] | None) -> dict[str, Any]:
+    """Unwrap the created workout from a create_workout response.
+
+    Args:
+        created: Raw create_workout response
+
+    Returns:
+        The created workout, or an empty dict if the response had none
+    """
+    result = created.get("workout", created) if created else {}
+    if isinstance(result, list):
+        result = result[0] if result else {}
+    return result
+
+
+def _retry_delay(attempts: int) -> float:
+    """Exponential backoff for an item that has failed attempts times."""
+    return min(
+        OUTBOX_RETRY_BASE_SECONDS * 2 ** max(attempts - 1, 0),
+        OUTBOX_RETRY_MAX_SECONDS,
+    )
+
+
+class HevyWorkoutOutbox:
+    """Durable queue of workouts waiting to be posted to Hevy.
+
+    Items are written to storage before the caller gets a response, and a
+    background worker posts them with per-item exponential backoff, so one
+    workout that keeps failing never holds up the others. While queued,
+    each item appears in the coordinator's history as a pending workout.
+
+    Only failures that may pass are retried: timeouts, connection errors,
+    429 and 5xx. An item Hevy rejects (4xx or an auth error) is dropped
+    and a hevy_workout_rejected event carries its payload. Hevy has no
+    idempotency keys, so after a timeout the POST may already have been
+    created; such items are first looked up among the latest workouts by
+    title and start time, and only posted again if they are not there.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        coordinator: HevyDataUpdateCoordinator,
+        entry_id: str,
+    ) -> None:
+        """Initialize the outbox.
+
+        Args:
+            hass: Home Assistant instance
+            coordinator: Coordinator that ingests sent workouts
+            entry_id: Config entry the queue belongs to
+        """
+        self._hass = hass
+        self._coordinator = coordinator
+        self._store: Store[dict[str, Any]] = Store(
+            hass, OUTBOX_STORAGE_VERSION, f"{DOMAIN}.{entry_id}.outbox"
+        )
+        self._items: list[dict[str, Any]] = []
+        self._lock = asyncio.Lock()
+        self._task: asyncio.Task[None] | None = None
+        self._unsub_retry: CALLBACK_TYPE | None = None
+
+    @property
+    def items(self) -> list[dict[str, Any]]:
+        """Queued items, oldest first."""
+        return list(self._items)
+
+    @property
+    def oldest_queued_at(self) -> datetime | None:
+        """When the oldest queued item was accepted."""
+        if not self._items:
+            return None
+        return dt_util.parse_datetime(self._items[0]["queued_at"])
+
+    def pending_workouts(self) -> list[dict[str, Any]]:
+        """Queued workouts shaped like API workouts, flagged as pending.
+
+        Returns:
+            One workout dict per queued item
+        """
+        return [
+            {
+                **item["workout"],
+                "id": f"{PENDING_ID_PREFIX}{item['id']}",
+                "pending": True,
+            }
+            for item in self._items
+        ]
+
+    async def async_load(self) -> None:
+        """Load queued items from storage."""
+        data = await self._store.async_load()
+        self._items = data["items"] if data else []
+        _LOGGER.debug("Loaded %d queued workouts", len(self._items))
+
+    @callback
+    def async_start(self) -> None:
+        """Start sending items loaded from storage."""
+        if self._items:
+            self._async_schedule_process()
+
+    async def async_enqueue(
+        self, workout: dict[str, Any], maybe_sent: bool = False
+    ) -> dict[str, Any]:
+        """Durably queue a workout payload for sending.
+
+        Args:
+            workout: create_workout payload (without the "workout" wrapper)
+            maybe_sent: An earlier POST of it timed out or lost the
+                connection, so Hevy may have created it already
+
+        Returns:
+            The queued item
+        """
+        now = dt_util.utcnow().isoformat()
+        item = {
+            "id": uuid4().hex,
+            "queued_at": now,
+            "attempts": 0,
+            "next_attempt_at": now,
+            "last_error": None,
+            "maybe_sent": maybe_sent,
+            "workout": workout,
+        }
+        self._items.append(item)
+        await self._store.async_save({"items": self._items})
+        self._coordinator.async_add_workout(
+            {**workout, "id": f"{PENDING_ID_PREFIX}{item['id']}", "pending": True}
+        )
+        self._async_schedule_process()
+        return item
+
+    @callback
+    def _async_retry_due(self, _now: datetime) -> None:
+        """Retry timer fired."""
+        self._unsub_retry = None
+        self._async_schedule_process()
+
+    @callback
+    def _async_schedule_process(self) -> None:
+        """Start a send run unless one is already in progress."""
+        if self._task is None or self._task.done():
+            self._task = self._hass.async_create_background_task(
+                self.async_process(), f"{DOMAIN} outbox"
+            )
+
+    async def _async_find_created(
+        self, workout: dict[str, Any]
+    ) -> dict[str, Any] | None:
+        """Find a workout an earlier, timed-out POST already created.
+
+        Args:
+            workout: create_workout payload
+
+        Returns:
+            The matching workout among the latest ones on Hevy, or None
+        """
+        start = parse_start_time(workout)
+        data = await self._coordinator.client.get_workouts(
+            page=1, page_size=WORKOUT_PAGE_SIZE
+        )
+        for candidate in data.get("workouts") or []:
+            if (
+                candidate.get("title") == workout.get("title")
+                and parse_start_time(candidate) == start
+            ):
+                return candidate
+        return None
+
+    async def _async_send(self, item: dict[str, Any]) -> dict[str, Any]:
+        """Post an item, unless an earlier attempt already created it.
+
+        Returns:
+            The created workout
+        """
+        with request_priority(RequestPriority.BACKGROUND):
+            if item.get("maybe_sent"):
+                existing = await self._async_find_created(item["workout"])
+                if existing is not None:
+                    _LOGGER.debug("Queued workout %s was already created", item["id"])
+                    return existing
+            created = await self._coordinator.client.create_workout(
+                {"workout": item["workout"]}
+            )
+        return unwrap_created_workout(created)
+
+    @callback
+    def _async_reject(self, item: dict[str, Any], err: HevyApiError) -> None:
+        """Drop an item Hevy will never accept and report it."""
+        self._items.remove(item)
+        workout = item["workout"]
+        _LOGGER.error(
+            "Hevy rejected queued workout %s (%s), dropping it: %s",
+            workout.get("title"),
+            workout.get("start_time"),
+            err,
+        )
+        self._hass.bus.async_fire(
+            EVENT_WORKOUT_REJECTED,
+            {"queue_id": item["id"], "error": str(err), "workout": workout},
+        )
+
+    async def async_process(self) -> None:
+        """Send every item that is due, then schedule the next retry."""
+        async with self._lock:
+            now = dt_util.utcnow()
+            changed = False
+            rejected = False
+            for item in list(self._items):
+                next_attempt = dt_util.parse_datetime(item["next_attempt_at"])
+                if next_attempt is not None and next_attempt > now:
+                    continue
+                try:
+                    result = await self._async_send(item)
+                except asyncio.CancelledError:
+                    # Stopped mid-send; the POST may already be out, so
+                    # look for it before sending again. The delayed save
+                    # is flushed by the store's final write on shutdown.
+                    item["maybe_sent"] = True
+                    self._store.async_delay_save(lambda: {"items": self._items}, 0)
+                    raise
+                except (HevyAuthError, HevyRequestError) as err:
+                    self._async_reject(item, err)
+                    rejected = True
+                except HevyApiError as err:
+                    item["attempts"] += 1
+                    item["last_error"] = str(err)
+                    # Stays set: any earlier timeout may have created it
+                    item["maybe_sent"] = item.get("maybe_sent", False) or isinstance(
+                        err, HevyConnectionError
+                    )
+                    item["next_attempt_at"] = (
+                        now + timedelta(seconds=_retry_delay(item["attempts"]))
+                    ).isoformat()
+                    _LOGGER.debug(
+                        "Queued workout %s failed (attempt %d): %s",
+                        item["id"],
+                        item["attempts"],
+                        err,
+                    )
+                else:
+                    self._items.remove(item)
+                    _LOGGER.debug(
+                        "Sent queued workout %s as %s", item["id"], result.get("id")
+                    )
+                    if not self._coordinator.async_add_workout(
+                        result, replaces=f"{PENDING_ID_PREFIX}{item['id']}"
+                    ):
+                        await self._coordinator.async_request_refresh()
+                # Save as each item settles, so a restart partway through
+                # the queue doesn't post the ones already sent again
+                await self._store.async_save({"items": self._items})
+                changed = True
+
+            if changed:
+                self._coordinator.async_update_listeners()
+            if rejected:
+                # Rebuilding the window drops the rejected pending workouts
+                await self._coordinator.async_request_refresh()
+
+            self._async_schedule_retry()
+
+    @callback
+    def _async_schedule_retry(self) -> None:
+        """Wake up again when the earliest remaining item is due."""
+        if self._unsub_retry is not None:
+            self._unsub_retry()
+            self._unsub_retry = None
+        if not self._items:
+            return
+        due = min(
+            dt_util.parse_datetime(item["next_attempt_at"]) or dt_util.utcnow()
+            for item in self._items
+        )
+        delay = max((due - dt_util.utcnow()).total_seconds(), 0)
+        self._unsub_retry = async_call_later(
+            self._hass,
+            delay,
+            HassJob(self._async_retry_due, cancel_on_shutdown=True),
+        )
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop retrying; queued items stay in storage for the next start."""
+        if self._unsub_retry is not None:
+            self._unsub_retry()
+            self._unsub_retry = None
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
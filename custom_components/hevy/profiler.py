@@ -0,0 +1,163 @@
+"""On-demand CPU and allocation profiling of one coordinator refresh."""
+from __future__ import annotations
+
+import cProfile
+import logging
+import pstats
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util import dt as dt_util
+
+from .const import PROFILE_DIR
+
+if TYPE_CHECKING:
+    from .coordinator import HevyDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# Frames kept per allocation site
+TRACEMALLOC_FRAMES = 10
+
+# cProfile allows one active profiler per interpreter
+_PROFILE_LOCK = threading.Lock()
+
+
+def _top_functions(profile: cProfile.Profile, top: int) -> list[dict[str, Any]]:
+    """Return the functions with the most cumulative time."""
+    stats = pstats.Stats(profile).sort_stats(pstats.SortKey.CUMULATIVE)
+    functions = []
+    for func in stats.fcn_list[:top]:
+        _, calls, total, cumulative, _ = stats.stats[func]
+        filename, line, name = func
+        functions.append(
+            {
+                "function": f"{filename}:{line}({name})",
+                "calls": calls,
+                "total_ms": round(total * 1000, 2),
+                "cumulative_ms": round(cumulative * 1000, 2),
+            }
+        )
+    return functions
+
+
+def _top_allocations(
+    snapshot: tracemalloc.Snapshot, top: int
+) -> list[tracemalloc.Statistic]:
+    """Return the allocation sites holding the most memory."""
+    snapshot = snapshot.filter_traces(
+        (
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*"),
+        )
+    )
+    return snapshot.statistics("traceback")[:top]
+
+
+def _write_results(
+    profile: cProfile.Profile,
+    snapshot: tracemalloc.Snapshot,
+    stats_path: Path,
+    allocations_path: Path,
+    top: int,
+) -> tuple[list[dict[str, Any]], list[tracemalloc.Statistic]]:
+    """Write the pstats file and allocation report.
+
+    Does blocking file I/O and CPU-heavy grouping, and runs in the executor.
+
+    Returns:
+        The top functions and the top allocation sites
+    """
+    allocations = _top_allocations(snapshot, top)
+    stats_path.parent.mkdir(parents=True, exist_ok=True)
+    profile.dump_stats(stats_path)
+    with allocations_path.open("w", encoding="utf-8") as file:
+        for stat in allocations:
+            file.write(
+                f"{stat.size / 1024:.1f} KiB in {stat.count} blocks\n"
+                + "\n".join(f"  {line}" for line in stat.traceback.format())
+                + "\n\n"
+            )
+    return _top_functions(profile, top), allocations
+
+
+async def async_profile_refresh(
+    hass: HomeAssistant,
+    coordinator: HevyDataUpdateCoordinator,
+    top: int,
+) -> dict[str, Any]:
+    """Run one refresh under cProfile and tracemalloc and save the results.
+
+    The refresh is a real one: the API is called and entities update. The
+    profiler sees everything the event loop runs meanwhile, so other
+    integrations' work can show up too; the refresh stage timings in the
+    response only cover this coordinator.
+
+    Args:
+        hass: Home Assistant instance
+        coordinator: Coordinator to refresh
+        top: Number of functions and allocation sites to report
+
+    Returns:
+        Paths written, wall time, refresh outcome and stage timings, peak
+        traced memory, and the top functions and allocation sites
+
+    Raises:
+        HomeAssistantError: If a profile is already running
+        OSError: If the results cannot be written
+    """
+    if not _PROFILE_LOCK.acquire(blocking=False):
+        raise HomeAssistantError("A refresh profile is already running")
+
+    stamp = dt_util.now().strftime("%Y%m%d_%H%M%S")
+    stats_path = Path(hass.config.path(PROFILE_DIR, f"refresh_{stamp}.pstats"))
+    allocations_path = stats_path.with_name(f"refresh_{stamp}_allocations.txt")
+
+    # Leave tracemalloc running if someone else started it
+    was_tracing = tracemalloc.is_tracing()
+    profile = cProfile.Profile()
+    try:
+        if not was_tracing:
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+        tracemalloc.reset_peak()
+        started = time.perf_counter()
+        profile.enable()
+        try:
+            await coordinator.async_refresh()
+        finally:
+            profile.disable()
+            elapsed = time.perf_counter() - started
+            _, peak = tracemalloc.get_traced_memory()
+            snapshot = tracemalloc.take_snapshot()
+            if not was_tracing:
+                tracemalloc.stop()
+
+        functions, allocations = await hass.async_add_executor_job(
+            _write_results, profile, snapshot, stats_path, allocations_path, top
+        )
+    finally:
+        _PROFILE_LOCK.release()
+
+    _LOGGER.info("Wrote refresh profile to %s", stats_path)
+    return {
+        "stats_path": str(stats_path),
+        "allocations_path": str(allocations_path),
+        "wall_ms": round(elapsed * 1000, 1),
+        "success": coordinator.last_update_success,
+        "stage_ms": coordinator.last_refresh_timings,
+        "peak_traced_kib": round(peak / 1024, 1),
+        "functions": functions,
+        "allocations": [
+            {
+                "location": str(stat.traceback[0]),
+                "size_kib": round(stat.size / 1024, 1),
+                "blocks": stat.count,
+            }
+            for stat in allocations
+        ],
+    }
@@ -0,0 +1,307 @@
+"""Day-level rollups of workout history for ad-hoc aggregation queries."""
+from __future__ import annotations
+
+import logging
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.util import dt as dt_util
+
+from .const import WORKING_SET_TYPES
+from .history import parse_start_time
+
+if TYPE_CHECKING:
+    from .coordinator import HevyDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+GROUP_EXERCISE = "exercise"
+GROUP_TEMPLATE = "template"
+GROUP_MUSCLE_GROUP = "muscle_group"
+GROUP_DAY = "day"
+GROUP_WEEK = "week"
+GROUP_MONTH = "month"
+GROUP_BY_OPTIONS = [
+    GROUP_EXERCISE,
+    GROUP_TEMPLATE,
+    GROUP_MUSCLE_GROUP,
+    GROUP_DAY,
+    GROUP_WEEK,
+    GROUP_MONTH,
+]
+
+METRIC_VOLUME = "volume"
+METRIC_SETS = "sets"
+METRIC_REPS = "reps"
+METRIC_DISTANCE = "distance"
+METRIC_DURATION = "duration"
+METRIC_E1RM = "e1rm"
+METRIC_OPTIONS = [
+    METRIC_VOLUME,
+    METRIC_SETS,
+    METRIC_REPS,
+    METRIC_DISTANCE,
+    METRIC_DURATION,
+    METRIC_E1RM,
+]
+
+# Summed across rows; e1RM is the best value instead
+_SUMMED_METRICS = ("volume", "sets", "reps", "distance_meters", "duration_seconds")
+
+
+def estimated_one_rep_max(weight: float, reps: int) -> float:
+    """Epley estimate of a one-rep max.
+
+    Args:
+        weight: Weight lifted
+        reps: Reps completed
+
+    Returns:
+        Estimated one-rep max in the same unit as weight
+    """
+    if reps <= 1:
+        return weight
+    return weight * (1 + reps / 30)
+
+
+def _empty_metrics() -> dict[str, float]:
+    return {metric: 0 for metric in (*_SUMMED_METRICS, "e1rm")}
+
+
+class HevyRollupStore:
+    """Per-day, per-exercise metric rollups over the workout history.
+
+    Each workout is rolled up once into (local day, exercise) rows, and
+    rows are merged into day buckets kept in date order. A query bisects
+    to the requested days and folds only those buckets, so the cost is
+    proportional to the days in range, not the sets in them. The refresh
+    window is re-synced when the coordinator's data version changes;
+    older days are rolled up from the history store the first time a
+    query reaches back to them.
+    """
+
+    def __init__(self, coordinator: HevyDataUpdateCoordinator) -> None:
+        """Initialize the store.
+
+        Args:
+            coordinator: Coordinator providing workouts and unit conversion
+        """
+        self._coordinator = coordinator
+        # workout id -> (day, {exercise key: metrics})
+        self._workouts: dict[str, tuple[date, dict[str, dict[str, float]]]] = {}
+        self._day_workouts: dict[date, set[str]] = defaultdict(set)
+        self._days: dict[date, dict[str, dict[str, float]]] = {}
+        self._sorted_days: list[date] = []
+        # exercise key -> (title, template id)
+        self._exercises: dict[str, tuple[str, str | None]] = {}
+        self._version: int | None = None
+        self._workout_count: int | None = None
+        self._covered_from: datetime | None = None
+
+    def _rollup_workout(
+        self, workout: dict[str, Any]
+    ) -> dict[str, dict[str, float]]:
+        """Roll one workout up into per-exercise metrics."""
+        convert_weight = self._coordinator._convert_weight
+        rows: dict[str, dict[str, float]] = {}
+        for exercise in workout.get("exercises") or []:
+            template_id = exercise.get("exercise_template_id")
+            title = exercise.get("title") or ""
+            key = template_id or f"title:{title.lower()}"
+            self._exercises[key] = (title, template_id)
+            metrics = rows.setdefault(key, _empty_metrics())
+            for set_data in exercise.get("sets") or []:
+                # Warmups are left out, as in the weekly muscle volume sensor
+                if set_data.get("type", "normal") not in WORKING_SET_TYPES:
+                    continue
+                metrics["sets"] += 1
+                reps = set_data.get("reps") or 0
+                metrics["reps"] += reps
+                weight = convert_weight(set_data.get("weight_kg"))
+                if weight and reps:
+                    metrics["volume"] += weight * reps
+                    metrics["e1rm"] = max(
+                        metrics["e1rm"], estimated_one_rep_max(weight, reps)
+                    )
+                metrics["distance_meters"] += set_data.get("distance_meters") or 0
+                metrics["duration_seconds"] += set_data.get("duration_seconds") or 0
+        return rows
+
+    def _rebuild_day(self, day: date) -> None:
+        """Merge the rollups of every workout on a day into its bucket."""
+        bucket: dict[str, dict[str, float]] = {}
+        for workout_id in self._day_workouts.get(day, ()):
+            for key, metrics in self._workouts[workout_id][1].items():
+                merged = bucket.setdefault(key, _empty_metrics())
+                for metric in _SUMMED_METRICS:
+                    merged[metric] += metrics[metric]
+                merged["e1rm"] = max(merged["e1rm"], metrics["e1rm"])
+
+        index = bisect_left(self._sorted_days, day)
+        present = index < len(self._sorted_days) and self._sorted_days[index] == day
+        if bucket:
+            self._days[day] = bucket
+            if not present:
+                self._sorted_days.insert(index, day)
+        else:
+            self._days.pop(day, None)
+            self._day_workouts.pop(day, None)
+            if present:
+                del self._sorted_days[index]
+
+    def _add_workouts(self, workouts: list[dict[str, Any]]) -> set[date]:
+        """Roll up workouts, replacing earlier rollups with the same ID."""
+        dirty: set[date] = set()
+        for workout in workouts:
+            workout_id = workout.get("id")
+            start = parse_start_time(workout)
+            if not workout_id or start is None:
+                continue
+            dirty.update(self._remove_workout(workout_id))
+            day = dt_util.as_local(start).date()
+            self._workouts[workout_id] = (day, self._rollup_workout(workout))
+            self._day_workouts[day].add(workout_id)
+            dirty.add(day)
+        return dirty
+
+    def _remove_workout(self, workout_id: str) -> set[date]:
+        previous = self._workouts.pop(workout_id, None)
+        if previous is None:
+            return set()
+        self._day_workouts[previous[0]].discard(workout_id)
+        return {previous[0]}
+
+    def _reset(self) -> None:
+        self._workouts.clear()
+        self._day_workouts.clear()
+        self._days.clear()
+        self._sorted_days.clear()
+        self._covered_from = None
+
+    def _sync_window(self) -> None:
+        """Bring the refresh window's rollups up to date."""
+        coordinator = self._coordinator
+        if self._version == coordinator.data_version:
+            return
+
+        # A changed total means older workouts may have been added or
+        # deleted, so rollups from the history store can't be trusted
+        if self._workout_count != coordinator._workout_count:
+            self._reset()
+        self._workout_count = coordinator._workout_count
+        self._version = coordinator.data_version
+
+        window_start = coordinator.window_start
+        current = {w.get("id") for w in coordinator._workout_history}
+        dirty: set[date] = set()
+        for workout_id, (day, _) in list(self._workouts.items()):
+            if workout_id in current:
+                continue
+            start = dt_util.start_of_local_day(day)
+            if window_start is None or start >= window_start:
+                dirty.update(self._remove_workout(workout_id))
+
+        dirty.update(
+            self._add_workouts(
+                [w for w in coordinator._workout_history if not w.get("pending")]
+            )
+        )
+        for day in dirty:
+            self._rebuild_day(day)
+
+        if self._covered_from is None or (
+            window_start is not None and window_start < self._covered_from
+        ):
+            self._covered_from = window_start
+
+    async def async_ensure(self, start: datetime) -> None:
+        """Make sure rollups cover everything from start onwards.
+
+        Args:
+            start: Earliest moment the caller needs
+
+        Raises:
+            HevyApiError: If older history cannot be fetched
+        """
+        self._sync_window()
+        covered_from = self._covered_from
+        if covered_from is None or start >= covered_from:
+            return
+
+        older = await self._coordinator.history.async_workouts_between(
+            start, covered_from
+        )
+        for day in self._add_workouts(older):
+            self._rebuild_day(day)
+        self._covered_from = start
+        _LOGGER.debug("Rolled up %d older workouts back to %s", len(older), start)
+
+    def query(
+        self,
+        start: date,
+        end: date,
+        group_by: list[str],
+        metrics: list[str],
+    ) -> list[dict[str, Any]]:
+        """Aggregate rollups over an inclusive range of local days.
+
+        Args:
+            start: First day of the range
+            end: Last day of the range
+            group_by: Dimensions to group rows by, in order
+            metrics: Metrics to return for each group
+
+        Returns:
+            One dict per group with the group values and requested metrics,
+            sorted by group values
+        """
+        templates = self._coordinator.exercise_templates
+        groups: dict[tuple[Any, ...], dict[str, float]] = {}
+
+        first = bisect_left(self._sorted_days, start)
+        last = bisect_right(self._sorted_days, end)
+        for day in self._sorted_days[first:last]:
+            iso_year, iso_week, _ = day.isocalendar()
+            for key, row in self._days[day].items():
+                title, template_id = self._exercises[key]
+                values = {
+                    GROUP_EXERCISE: title,
+                    GROUP_TEMPLATE: template_id,
+                    GROUP_MUSCLE_GROUP: (
+                        templates.get(template_id or "", {}).get("muscle_group")
+                        or "other"
+                    ),
+                    GROUP_DAY: day.isoformat(),
+                    GROUP_WEEK: f"{iso_year}-W{iso_week:02d}",
+                    GROUP_MONTH: f"{day.year}-{day.month:02d}",
+                }
+                group_key = tuple(values[dimension] for dimension in group_by)
+                merged = groups.setdefault(group_key, _empty_metrics())
+                for metric in _SUMMED_METRICS:
+                    merged[metric] += row[metric]
+                merged["e1rm"] = max(merged["e1rm"], row["e1rm"])
+
+        coordinator = self._coordinator
+        results: list[dict[str, Any]] = []
+        for group_key in sorted(groups, key=lambda k: tuple(str(v) for v in k)):
+            merged = groups[group_key]
+            result: dict[str, Any] = dict(zip(group_by, group_key, strict=True))
+            for metric in metrics:
+                if metric == METRIC_VOLUME:
+                    result[metric] = round(merged["volume"], 1)
+                elif metric == METRIC_SETS:
+                    result[metric] = int(merged["sets"])
+                elif metric == METRIC_REPS:
+                    result[metric] = int(merged["reps"])
+                elif metric == METRIC_DISTANCE:
+                    result[metric] = coordinator._convert_distance(
+                        merged["distance_meters"]
+                    )
+                elif metric == METRIC_DURATION:
+                    result[metric] = int(merged["duration_seconds"])
+                elif metric == METRIC_E1RM:
+                    result[metric] = round(merged["e1rm"], 1) or None
+            results.append(result)
+        return results
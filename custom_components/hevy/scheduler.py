@@ -0,0 +1,233 @@
+"""Prioritized, rate-limited scheduling of Hevy API requests."""
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from enum import IntEnum
+from typing import Any
+
+from homeassistant.helpers.typing import UNDEFINED, UndefinedType
+
+
+class RequestPriority(IntEnum):
+    """Scheduling class of an API request, most urgent first."""
+
+    INTERACTIVE = 0  # Service calls and calendar views someone is waiting on
+    REFRESH = 1      # Scheduled coordinator polls
+    BACKGROUND = 2   # Catalog revalidation, outbox retries, import and export
+
+
+# Share of grants each class gets while all of them have requests waiting
+PRIORITY_WEIGHTS = {
+    RequestPriority.INTERACTIVE: 8,
+    RequestPriority.REFRESH: 4,
+    RequestPriority.BACKGROUND: 1,
+}
+
+# Seconds from queueing to response before a request is given up on.
+# Background work has no deadline, it just waits its turn. Writes opt out
+# with deadline=None whatever their class: a POST abandoned mid-flight
+# may still have been created, so only API_TIMEOUT bounds it.
+DEFAULT_DEADLINES: dict[RequestPriority, float | None] = {
+    RequestPriority.INTERACTIVE: 15.0,
+    RequestPriority.REFRESH: 60.0,
+    RequestPriority.BACKGROUND: None,
+}
+
+_REQUEST_CLASS: ContextVar[tuple[RequestPriority, float | None]] = ContextVar(
+    "hevy_request_class",
+    default=(RequestPriority.REFRESH, DEFAULT_DEADLINES[RequestPriority.REFRESH]),
+)
+
+
+@contextmanager
+def request_priority(
+    priority: RequestPriority,
+    deadline: float | None | UndefinedType = UNDEFINED,
+) -> Iterator[None]:
+    """Run the API requests made inside the block at a priority.
+
+    The setting follows the current task and any task started from it,
+    so wrapping a service handler covers every request it fans out to.
+
+    Args:
+        priority: Scheduling class for the requests
+        deadline: Seconds each request may take from queueing to response,
+            instead of the class default; None for no deadline
+    """
+    if deadline is UNDEFINED:
+        deadline = DEFAULT_DEADLINES[priority]
+    token = _REQUEST_CLASS.set((priority, deadline))
+    try:
+        yield
+    finally:
+        _REQUEST_CLASS.reset(token)
+
+
+def current_request_class() -> tuple[RequestPriority, float | None]:
+    """Return the priority and deadline for requests made right now."""
+    return _REQUEST_CLASS.get()
+
+
+class RequestScheduler:
+    """Admit API requests under a rate limit, weighted by priority.
+
+    Requests wait in one FIFO queue per priority. Each grant takes a
+    token from a bucket refilled at the rate limit and one of a fixed
+    number of in-flight slots. Queues are served by stride scheduling:
+    every class has a pass value that advances by 1/weight per grant,
+    and the waiting class with the lowest pass goes next. An interactive
+    request therefore jumps a queue of background ones straight away,
+    while background work still gets its share under sustained load.
+    A class that was idle joins at the current pass, so it cannot bank
+    credit while it has nothing to send.
+    """
+
+    def __init__(self, rate: float, burst: int, max_concurrent: int) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            rate: Requests per second admitted on average
+            burst: Requests that may be admitted back to back
+            max_concurrent: Requests allowed in flight at once
+        """
+        self._rate = rate
+        self._burst = burst
+        self._max_concurrent = max_concurrent
+        self._tokens = float(burst)
+        self._refilled_at: float | None = None
+        self._in_flight = 0
+        self._queues: dict[RequestPriority, deque[asyncio.Future[None]]] = {
+            priority: deque() for priority in RequestPriority
+        }
+        self._pass = {priority: 0.0 for priority in RequestPriority}
+        self._virtual_time = 0.0
+        self._timer: asyncio.TimerHandle | None = None
+        self._granted = {priority: 0 for priority in RequestPriority}
+        self._max_wait = {priority: 0.0 for priority in RequestPriority}
+        self._dropped = 0
+        self._throttled = 0
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Requests in flight, dropped, and granted and waiting per class.
+
+        Dropped requests were abandoned while still queued, almost always
+        because their deadline passed.
+        """
+        return {
+            "in_flight": self._in_flight,
+            "dropped": self._dropped,
+            "throttled": self._throttled,
+            "classes": {
+                priority.name.lower(): {
+                    "granted": self._granted[priority],
+                    "waiting": sum(
+                        1 for waiter in self._queues[priority] if not waiter.done()
+                    ),
+                    "max_wait": round(self._max_wait[priority], 3),
+                }
+                for priority in RequestPriority
+            },
+        }
+
+    @asynccontextmanager
+    async def slot(self, priority: RequestPriority) -> AsyncIterator[None]:
+        """Wait for a turn to send a request, and hold it for the block.
+
+        Cancelling the wait (for example by a deadline) removes the
+        request from its queue without taking a token.
+        """
+        loop = asyncio.get_running_loop()
+        waiter: asyncio.Future[None] = loop.create_future()
+        queued_at = loop.time()
+        queue = self._queues[priority]
+        if not any(not queued.done() for queued in queue):
+            self._pass[priority] = max(self._pass[priority], self._virtual_time)
+        queue.append(waiter)
+        self._dispatch()
+
+        try:
+            await waiter
+        except BaseException:
+            if waiter.done() and not waiter.cancelled():
+                # Granted in the same loop iteration as the cancellation
+                self._release()
+            else:
+                waiter.cancel()
+                self._dropped += 1
+            raise
+
+        self._max_wait[priority] = max(
+            self._max_wait[priority], loop.time() - queued_at
+        )
+        try:
+            yield
+        finally:
+            self._release()
+
+    def throttle(self, seconds: float) -> None:
+        """Admit nothing for a while, after the API answered 429."""
+        now = asyncio.get_running_loop().time()
+        self._throttled += 1
+        self._tokens = 0.0
+        self._refilled_at = max(self._refilled_at or now, now + seconds)
+
+    def close(self) -> None:
+        """Cancel the pending dispatch timer."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _release(self) -> None:
+        self._in_flight -= 1
+        self._dispatch()
+
+    def _refill(self, now: float) -> None:
+        if self._refilled_at is None:
+            self._refilled_at = now
+        elapsed = now - self._refilled_at
+        if elapsed > 0:
+            self._tokens = min(self._burst, self._tokens + elapsed * self._rate)
+            self._refilled_at = now
+
+    def _next_priority(self) -> RequestPriority | None:
+        """Return the waiting class with the lowest pass, if any."""
+        waiting = []
+        for priority, queue in self._queues.items():
+            while queue and queue[0].done():
+                queue.popleft()
+            if queue:
+                waiting.append(priority)
+        if not waiting:
+            return None
+        return min(waiting, key=lambda priority: (self._pass[priority], priority))
+
+    def _dispatch(self) -> None:
+        """Grant as many waiting requests as slots and tokens allow."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        loop = asyncio.get_running_loop()
+        while self._in_flight < self._max_concurrent:
+            if (priority := self._next_priority()) is None:
+                return
+            now = loop.time()
+            self._refill(now)
+            if self._tokens < 1:
+                # Also covers a throttle, which moves the refill time ahead
+                delay = (1 - self._tokens) / self._rate + max(
+                    0.0, (self._refilled_at or now) - now
+                )
+                self._timer = loop.call_later(delay, self._dispatch)
+                return
+
+            self._tokens -= 1
+            self._in_flight += 1
+            self._granted[priority] += 1
+            self._virtual_time = self._pass[priority]
+            self._pass[priority] += 1 / PRIORITY_WEIGHTS[priority]
+            self._queues[priority].popleft().set_result(None)
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import hashlib
 import logging
+from abc import ABC, abstractmethod
 from datetime import datetime
 from typing import Any
 
@@ -12,19 +13,29 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.const import PERCENTAGE, EntityCategory
+from homeassistant.core import HomeAssistant, ServiceCall, SupportsResponse
+from homeassistant.helpers import entity_platform
+from homeassistant.helpers.entity import DeviceInfo, Entity
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.json import json_bytes
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
 
 from .const import (
+    ATTR_DETAIL_OMITTED,
     CONF_API_KEY,
+    CONF_ATTRIBUTE_BUDGET,
+    DEFAULT_ATTRIBUTE_BUDGET,
     DOMAIN,
+    SENSOR_API_CACHE_HIT_RATE,
     SENSOR_CURRENT_STREAK,
+    SENSOR_LAST_SYNC,
     SENSOR_LAST_WORKOUT_DATE,
     SENSOR_LAST_WORKOUT_SUMMARY,
     SENSOR_MUSCLE_GROUP_SUMMARY,
     SENSOR_NEXT_WORKOUT,
+    SENSOR_QUEUED_WORKOUTS,
     SENSOR_WEEKLY_DISTANCE,
     SENSOR_WEEKLY_MUSCLE_VOLUME,
     SENSOR_WEEKLY_WORKOUT_COUNT,
@@ -34,6 +45,8 @@ from .coordinator import HevyDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+SERVICE_GET_ATTRIBUTE_DETAIL = "get_attribute_detail"
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -62,7 +75,11 @@ async def async_setup_entry(
         HevyWeeklyMuscleVolumeSensor(coordinator, entry),
         HevyWeeklyDistanceSensor(coordinator, entry),
         HevyNextWorkoutSensor(coordinator, entry),
+        HevyApiCacheHitRateSensor(coordinator, entry),
+        HevyLastSyncSensor(coordinator, entry),
     ]
+    if coordinator.outbox is not None:
+        entities.append(HevyQueuedWorkoutsSensor(coordinator, entry))
 
     # Create per-exercise sensors dynamically
     if coordinator.data:
@@ -100,6 +117,41 @@ async def async_setup_entry(
 
     coordinator.async_add_listener(_add_new_exercise_sensors)
 
+    platform = entity_platform.async_get_current_platform()
+    platform.async_register_entity_service(
+        SERVICE_GET_ATTRIBUTE_DETAIL,
+        {},
+        _async_get_attribute_detail,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+
+async def _async_get_attribute_detail(
+    entity: Entity, call: ServiceCall
+) -> dict[str, Any]:
+    """Return an entity's full attributes, including any left out of its state.
+
+    Args:
+        entity: Targeted Hevy entity
+        call: Service call
+
+    Returns:
+        The full attributes, their serialized size in bytes, and which
+        of them the state currently leaves out
+    """
+    if isinstance(entity, HevyDetailAttributesMixin):
+        attributes = entity.detail_attributes
+    else:
+        attributes = entity.extra_state_attributes or {}
+    state = entity.hass.states.get(entity.entity_id)
+    return {
+        "attributes": attributes,
+        "bytes": len(json_bytes(attributes)),
+        "omitted": list(state.attributes.get(ATTR_DETAIL_OMITTED, ()))
+        if state
+        else [],
+    }
+
 
 def get_device_info(entry: ConfigEntry) -> DeviceInfo:
     """Get device info for grouping entities.
@@ -122,6 +174,108 @@ def get_device_info(entry: ConfigEntry) -> DeviceInfo:
     )
 
 
+def fit_attributes(
+    attributes: dict[str, Any], detail_keys: tuple[str, ...], budget: int
+) -> tuple[dict[str, Any], list[str]]:
+    """Leave detail attributes out until the rest fits the budget.
+
+    Args:
+        attributes: Full attributes
+        detail_keys: Keys that may be left out, in the order they go
+        budget: Maximum serialized size in bytes, 0 for no limit
+
+    Returns:
+        The attributes to write and the keys left out
+    """
+    size = len(json_bytes(attributes))
+    if not budget or size <= budget:
+        return attributes, []
+
+    fitted = dict(attributes)
+    omitted: list[str] = []
+    for key in detail_keys:
+        if key not in fitted:
+            continue
+        # Key, colon, comma, and quotes
+        size -= len(json_bytes(fitted.pop(key))) + len(key) + 4
+        omitted.append(key)
+        if size <= budget:
+            break
+    if not omitted:
+        return attributes, []
+    fitted[ATTR_DETAIL_OMITTED] = omitted
+    return fitted, omitted
+
+
+class HevyDetailAttributesMixin(ABC):
+    """Keep a sensor's state attributes within the entry's size budget.
+
+    Every attribute is serialized into each state change and pushed to
+    every open frontend, so bulky ones (a month of workout summaries,
+    per-exercise breakdowns) are capped. Sensors build their attributes
+    in detail_attributes and list the bulky keys in _detail_keys. When
+    the attributes serialize to more than the budget, those keys are left
+    out in order until the rest fits, and detail_omitted names them. The
+    full attributes stay available from hevy.get_attribute_detail.
+
+    The attributes are measured once per _detail_source, so state writes
+    between coordinator updates leave out the same keys without
+    serializing everything again.
+    """
+
+    coordinator: HevyDataUpdateCoordinator
+    entity_id: str
+    _entry: ConfigEntry
+    _detail_keys: tuple[str, ...] = ()
+    # Source object and the keys left out of the attributes built from it
+    _detail_fit: tuple[Any, list[str]] | None = None
+
+    @property
+    @abstractmethod
+    def detail_attributes(self) -> dict[str, Any]:
+        """Return all attributes, regardless of size."""
+
+    @property
+    def _detail_source(self) -> Any:
+        """Return what detail_attributes is built from, or None to always measure."""
+        return self.coordinator.data
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the attributes that fit the budget."""
+        budget = self._entry.options.get(
+            CONF_ATTRIBUTE_BUDGET, DEFAULT_ATTRIBUTE_BUDGET
+        )
+        attributes = self.detail_attributes
+        source = self._detail_source
+        if (
+            source is not None
+            and self._detail_fit is not None
+            and self._detail_fit[0] is source
+        ):
+            omitted = self._detail_fit[1]
+            if not omitted:
+                return attributes
+            fitted = {
+                key: value for key, value in attributes.items() if key not in omitted
+            }
+            fitted[ATTR_DETAIL_OMITTED] = omitted
+            return fitted
+
+        attributes, omitted = fit_attributes(
+            attributes, self._detail_keys, budget * 1024
+        )
+        self._detail_fit = (source, omitted) if source is not None else None
+        if omitted:
+            _LOGGER.debug(
+                "Leaving %s out of %s to stay within %d KiB",
+                ", ".join(omitted),
+                self.entity_id,
+                budget,
+            )
+        return attributes
+
+
 class HevyBaseSensor(CoordinatorEntity[HevyDataUpdateCoordinator], SensorEntity):
     """Base class for Hevy sensors."""
 
@@ -171,12 +325,13 @@ class HevyWorkoutCountSensor(HevyBaseSensor):
         return self.coordinator.data.get("workout_count")
 
 
-class HevyLastWorkoutDateSensor(HevyBaseSensor):
+class HevyLastWorkoutDateSensor(HevyDetailAttributesMixin, HevyBaseSensor):
     """Sensor for last workout date."""
 
     _attr_icon = "mdi:calendar-clock"
     _attr_device_class = "timestamp"
     _unrecorded_attributes = frozenset({"workout_dates", "workout_summaries"})
+    _detail_keys = ("workout_summaries", "workout_dates")
 
     def __init__(
         self, coordinator: HevyDataUpdateCoordinator, entry: ConfigEntry
@@ -201,7 +356,7 @@ class HevyLastWorkoutDateSensor(HevyBaseSensor):
             return None
 
     @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def detail_attributes(self) -> dict[str, Any]:
         """Return additional attributes."""
         if not self.coordinator.data:
             return {}
@@ -214,10 +369,11 @@ class HevyLastWorkoutDateSensor(HevyBaseSensor):
         }
 
 
-class HevyLastWorkoutSummarySensor(HevyBaseSensor):
+class HevyLastWorkoutSummarySensor(HevyDetailAttributesMixin, HevyBaseSensor):
     """Sensor for last workout summary."""
 
     _attr_icon = "mdi:notebook"
+    _detail_keys = ("exercises",)
 
     def __init__(
         self, coordinator: HevyDataUpdateCoordinator, entry: ConfigEntry
@@ -234,7 +390,7 @@ class HevyLastWorkoutSummarySensor(HevyBaseSensor):
         return self.coordinator.data.get("last_workout_title") or "No workouts"
 
     @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def detail_attributes(self) -> dict[str, Any]:
         """Return additional attributes."""
         if not self.coordinator.data:
             return {}
@@ -354,10 +510,15 @@ class HevyWorkedOutThisWeekBinarySensor(
         return self.coordinator.data.get("worked_out_this_week", False)
 
 
-class HevyExerciseSensor(CoordinatorEntity[HevyDataUpdateCoordinator], SensorEntity):
+class HevyExerciseSensor(
+    HevyDetailAttributesMixin,
+    CoordinatorEntity[HevyDataUpdateCoordinator],
+    SensorEntity,
+):
     """Sensor for individual exercise tracking."""
 
     _attr_has_entity_name = True
+    _detail_keys = ("last_workout_sets",)
 
     def __init__(
         self,
@@ -415,7 +576,7 @@ class HevyExerciseSensor(CoordinatorEntity[HevyDataUpdateCoordinator], SensorEnt
         return self._get_exercise_data() is not None
 
     @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def detail_attributes(self) -> dict[str, Any]:
         """Return additional attributes."""
         exercise_data = self._get_exercise_data()
         if not exercise_data:
@@ -507,11 +668,12 @@ class HevyMuscleGroupSummarySensor(HevyBaseSensor):
         }
 
 
-class HevyWeeklyMuscleVolumeSensor(HevyBaseSensor):
+class HevyWeeklyMuscleVolumeSensor(HevyDetailAttributesMixin, HevyBaseSensor):
     """Sensor for weekly volume per muscle group."""
 
     _attr_icon = "mdi:chart-bar"
     _attr_state_class = SensorStateClass.MEASUREMENT
+    _detail_keys = ("exercise_breakdown", "muscle_groups")
 
     def __init__(
         self, coordinator: HevyDataUpdateCoordinator, entry: ConfigEntry
@@ -529,7 +691,7 @@ class HevyWeeklyMuscleVolumeSensor(HevyBaseSensor):
         return volume_data.get("total_volume", 0)
 
     @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def detail_attributes(self) -> dict[str, Any]:
         """Return volume breakdown attributes."""
         if not self.coordinator.data:
             return {}
@@ -544,11 +706,12 @@ class HevyWeeklyMuscleVolumeSensor(HevyBaseSensor):
         }
 
 
-class HevyWeeklyDistanceSensor(HevyBaseSensor):
+class HevyWeeklyDistanceSensor(HevyDetailAttributesMixin, HevyBaseSensor):
     """Sensor for weekly distance across cardio exercises."""
 
     _attr_icon = "mdi:map-marker-distance"
     _attr_state_class = SensorStateClass.MEASUREMENT
+    _detail_keys = ("exercise_breakdown",)
 
     def __init__(
         self, coordinator: HevyDataUpdateCoordinator, entry: ConfigEntry
@@ -574,7 +737,7 @@ class HevyWeeklyDistanceSensor(HevyBaseSensor):
         return distance_data.get("distance_unit")
 
     @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def detail_attributes(self) -> dict[str, Any]:
         """Return distance breakdown attributes."""
         if not self.coordinator.data:
             return {}
@@ -622,3 +785,128 @@ class HevyNextWorkoutSensor(HevyBaseSensor):
             "rotation_total": routine_data.get("rotation_total"),
             "exercises_preview": routine_data.get("exercises_preview", []),
         }
+
+
+class HevyQueuedWorkoutsSensor(HevyDetailAttributesMixin, HevyBaseSensor):
+    """Sensor for workouts waiting in the outbox to be posted to Hevy."""
+
+    _attr_icon = "mdi:tray-full"
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _detail_keys = ("workouts",)
+
+    def __init__(
+        self, coordinator: HevyDataUpdateCoordinator, entry: ConfigEntry
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry, SENSOR_QUEUED_WORKOUTS)
+        self._attr_name = "Queued workouts"
+
+    @property
+    def available(self) -> bool:
+        """The queue is local, so it stays available when Hevy is not."""
+        return self.coordinator.outbox is not None
+
+    @property
+    def native_value(self) -> int | None:
+        """Return the number of queued workouts."""
+        if self.coordinator.outbox is None:
+            return None
+        return len(self.coordinator.outbox.items)
+
+    @property
+    def _detail_source(self) -> Any:
+        """The queue changes without new coordinator data; measure each time."""
+        return None
+
+    @property
+    def detail_attributes(self) -> dict[str, Any]:
+        """Return the oldest item's age and each queued workout."""
+        outbox = self.coordinator.outbox
+        if outbox is None:
+            return {}
+        oldest = outbox.oldest_queued_at
+        return {
+            "oldest_queued_at": oldest.isoformat() if oldest else None,
+            "oldest_age_minutes": (
+                round((dt_util.utcnow() - oldest).total_seconds() / 60, 1)
+                if oldest
+                else None
+            ),
+            "workouts": [
+                {
+                    "title": item["workout"].get("title"),
+                    "queued_at": item["queued_at"],
+                    "attempts": item["attempts"],
+                    "last_error": item["last_error"],
+                }
+                for item in outbox.items
+            ],
+        }
+
+
+class HevyApiCacheHitRateSensor(HevyBaseSensor):
+    """Diagnostic sensor for how often conditional API requests hit the cache."""
+
+    _attr_icon = "mdi:cached"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_native_unit_of_measurement = PERCENTAGE
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(
+        self, coordinator: HevyDataUpdateCoordinator, entry: ConfigEntry
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry, SENSOR_API_CACHE_HIT_RATE)
+        self._attr_name = "API cache hit rate"
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the share of conditional requests that were cache hits."""
+        return self.coordinator.client.stats["hit_rate"]
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the raw request and transfer counters."""
+        stats = self.coordinator.client.stats
+        return {key: value for key, value in stats.items() if key != "hit_rate"}
+
+
+class HevyLastSyncSensor(HevyBaseSensor):
+    """Diagnostic sensor for when the data was last fetched successfully."""
+
+    _attr_icon = "mdi:cloud-sync"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_device_class = "timestamp"
+
+    def __init__(
+        self, coordinator: HevyDataUpdateCoordinator, entry: ConfigEntry
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry, SENSOR_LAST_SYNC)
+        self._attr_name = "Last successful sync"
+
+    @property
+    def available(self) -> bool:
+        """Stay available during outages, which is when this matters."""
+        return True
+
+    @property
+    def native_value(self) -> datetime | None:
+        """Return when the data was last fetched successfully."""
+        return self.coordinator.data_fetched_at
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return whether the data is stale, how old it is, and why."""
+        fetched_at = self.coordinator.data_fetched_at
+        stale = self.coordinator.last_refresh_error is not None
+        return {
+            "stale": stale,
+            "stale_minutes": (
+                round((dt_util.utcnow() - fetched_at).total_seconds() / 60, 1)
+                if stale and fetched_at
+                else 0
+            ),
+            "last_error": self.coordinator.last_refresh_error,
+            "api_state": self.coordinator.client.stats["breaker"]["state"],
+        }
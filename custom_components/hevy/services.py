@@ -1,6 +1,8 @@
 """Service handlers for the Hevy Workout Tracker integration."""
 from __future__ import annotations
 
+import asyncio
+import base64
 import logging
 from datetime import datetime, timedelta
 from typing import Any
@@ -12,31 +14,58 @@ from homeassistant.core import (
     ServiceResponse,
     SupportsResponse,
 )
-from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.exceptions import (
+    HomeAssistantError,
+    ServiceValidationError,
+    Unauthorized,
+    UnknownUser,
+)
 from homeassistant.helpers import config_validation as cv
 from homeassistant.util import dt as dt_util
 
-from .api import HevyApiError
+from .api import HevyApiError, HevyAuthError, HevyConnectionError, HevyRequestError
 from .const import (
     DOMAIN,
+    IMPORT_DIR,
     KG_TO_LBS,
     METERS_TO_KM,
     METERS_TO_MILES,
+    PROFILE_TOP_DEFAULT,
     UNIT_SYSTEM_METRIC,
 )
 from .coordinator import HevyDataUpdateCoordinator
+from .export import EXPORT_FORMAT_CSV, EXPORT_FORMATS, async_export_history
+from .history import parse_start_time
+from .importer import async_import_workouts
+from .outbox import HevyWorkoutOutbox, unwrap_created_workout
+from .profiler import async_profile_refresh
+from .rollups import GROUP_BY_OPTIONS, METRIC_OPTIONS, METRIC_SETS, METRIC_VOLUME
+from .scheduler import RequestPriority, request_priority
 
 _LOGGER = logging.getLogger(__name__)
 
 SERVICE_GET_WORKOUT_HISTORY = "get_workout_history"
 SERVICE_LOG_WORKOUT = "log_workout"
+SERVICE_LOG_WORKOUTS = "log_workouts"
 SERVICE_GET_EXERCISE_CATALOG = "get_exercise_catalog"
 SERVICE_GET_ROUTINES = "get_routines"
+SERVICE_SEARCH_EXERCISES = "search_exercises"
+SERVICE_QUERY = "query"
+SERVICE_EXPORT_HISTORY = "export_history"
+SERVICE_IMPORT_WORKOUTS = "import_workouts"
+SERVICE_PROFILE_REFRESH = "profile_refresh"
 
 SET_TYPES = ["warmup", "normal", "failure", "dropset"]
 RPE_VALUES = [6.0, 7.0, 7.5, 8.0, 8.5, 9.0, 9.5, 10.0]
 MEASUREMENT_FIELDS = ("weight", "reps", "duration_seconds", "distance")
 MAX_NAME_SUGGESTIONS = 3
+DEFAULT_HISTORY_PAGE_SIZE = 20
+MAX_HISTORY_PAGE_SIZE = 100
+MAX_BATCH_WORKOUTS = 50
+BATCH_CONCURRENCY = 3  # Parallel creates per log_workouts call
+DEFAULT_SEARCH_LIMIT = 20
+MAX_SEARCH_LIMIT = 100
+MAX_QUERY_DAYS = 3650
 
 WORKOUT_HISTORY_SCHEMA = vol.Schema(
     {
@@ -44,6 +73,12 @@ WORKOUT_HISTORY_SCHEMA = vol.Schema(
         vol.Optional("days", default=30): vol.All(
             vol.Coerce(int), vol.Range(min=1, max=90)
         ),
+        vol.Optional("limit", default=DEFAULT_HISTORY_PAGE_SIZE): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=MAX_HISTORY_PAGE_SIZE)
+        ),
+        vol.Optional("cursor"): cv.string,
+        vol.Optional("summary_only", default=False): cv.boolean,
+        vol.Optional("include_sets", default=True): cv.boolean,
     }
 )
 
@@ -54,6 +89,70 @@ CONFIG_ENTRY_ONLY_SCHEMA = vol.Schema(
     }
 )
 
+SEARCH_EXERCISES_SCHEMA = vol.Schema(
+    {
+        vol.Required("config_entry_id"): cv.string,
+        vol.Optional("query"): cv.string,
+        vol.Optional("muscle_group"): cv.string,
+        vol.Optional("equipment"): cv.string,
+        vol.Optional("type"): cv.string,
+        vol.Optional("limit", default=DEFAULT_SEARCH_LIMIT): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=MAX_SEARCH_LIMIT)
+        ),
+        vol.Optional("offset", default=0): vol.All(
+            vol.Coerce(int), vol.Range(min=0)
+        ),
+    }
+)
+
+QUERY_SCHEMA = vol.Schema(
+    {
+        vol.Required("config_entry_id"): cv.string,
+        vol.Required("group_by"): vol.All(
+            cv.ensure_list, vol.Length(min=1, max=3), [vol.In(GROUP_BY_OPTIONS)]
+        ),
+        vol.Optional("metrics", default=[METRIC_VOLUME, METRIC_SETS]): vol.All(
+            cv.ensure_list, vol.Length(min=1), [vol.In(METRIC_OPTIONS)]
+        ),
+        vol.Exclusive("days", "range"): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=MAX_QUERY_DAYS)
+        ),
+        vol.Exclusive("start_date", "range"): cv.date,
+        vol.Optional("end_date"): cv.date,
+    }
+)
+
+EXPORT_HISTORY_SCHEMA = vol.Schema(
+    {
+        vol.Required("config_entry_id"): cv.string,
+        vol.Optional("format", default=EXPORT_FORMAT_CSV): vol.In(EXPORT_FORMATS),
+        vol.Optional("filename"): vol.All(
+            cv.string, vol.Match(r"^[\w-][\w.-]*$", msg="Invalid file name")
+        ),
+    }
+)
+
+IMPORT_WORKOUTS_SCHEMA = vol.Schema(
+    {
+        vol.Required("config_entry_id"): cv.string,
+        # A CSV file directly inside IMPORT_DIR; no paths
+        vol.Required("filename"): vol.All(
+            cv.string, vol.Match(r"^[\w-][\w.-]*\.csv$", msg="Invalid file name")
+        ),
+        vol.Optional("exercise_map", default={}): {cv.string: cv.string},
+        vol.Optional("is_private", default=False): cv.boolean,
+    }
+)
+
+PROFILE_REFRESH_SCHEMA = vol.Schema(
+    {
+        vol.Required("config_entry_id"): cv.string,
+        vol.Optional("top", default=PROFILE_TOP_DEFAULT): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=200)
+        ),
+    }
+)
+
 
 def _set_has_measurement(value: dict[str, Any]) -> dict[str, Any]:
     if not any(value.get(field) is not None for field in MEASUREMENT_FIELDS):
@@ -90,20 +189,34 @@ EXERCISE_SCHEMA = vol.Schema(
     }
 )
 
+WORKOUT_FIELDS = {
+    vol.Required("title"): cv.string,
+    vol.Required("exercises"): vol.All(
+        cv.ensure_list, vol.Length(min=1), [EXERCISE_SCHEMA]
+    ),
+    vol.Optional("start_time"): cv.datetime,
+    vol.Optional("end_time"): cv.datetime,
+    vol.Optional("duration_minutes"): vol.All(vol.Coerce(int), vol.Range(min=1)),
+    vol.Optional("description"): cv.string,
+    vol.Optional("is_private", default=False): cv.boolean,
+}
+
 LOG_WORKOUT_SCHEMA = vol.Schema(
     {
         vol.Required("config_entry_id"): cv.string,
-        vol.Required("title"): cv.string,
-        vol.Required("exercises"): vol.All(
-            cv.ensure_list, vol.Length(min=1), [EXERCISE_SCHEMA]
-        ),
-        vol.Optional("start_time"): cv.datetime,
-        vol.Optional("end_time"): cv.datetime,
-        vol.Optional("duration_minutes"): vol.All(
-            vol.Coerce(int), vol.Range(min=1)
+        vol.Optional("queue", default=False): cv.boolean,
+        **WORKOUT_FIELDS,
+    }
+)
+
+LOG_WORKOUTS_SCHEMA = vol.Schema(
+    {
+        vol.Required("config_entry_id"): cv.string,
+        vol.Required("workouts"): vol.All(
+            cv.ensure_list,
+            vol.Length(min=1, max=MAX_BATCH_WORKOUTS),
+            [vol.Schema(WORKOUT_FIELDS)],
         ),
-        vol.Optional("description"): cv.string,
-        vol.Optional("is_private", default=False): cv.boolean,
     }
 )
 
@@ -157,147 +270,310 @@ def _resolve_template_id(
     raise HomeAssistantError(message)
 
 
+def _build_workout_payload(
+    coordinator: HevyDataUpdateCoordinator,
+    data: dict[str, Any],
+    template_ids: dict[str, str],
+) -> dict[str, Any]:
+    """Build the create_workout payload for one validated workout.
+
+    Args:
+        coordinator: Coordinator for the config entry
+        data: Validated workout fields (title, exercises, times, ...)
+        template_ids: Exercise name to template ID memo, shared across a batch
+
+    Returns:
+        Workout payload in API units
+
+    Raises:
+        HomeAssistantError: If an exercise name is not in the catalog
+    """
+    exercises_payload: list[dict[str, Any]] = []
+    for exercise in data["exercises"]:
+        name = exercise["name"]
+        if name not in template_ids:
+            template_ids[name] = _resolve_template_id(coordinator, name)
+        template_id = template_ids[name]
+
+        sets_payload: list[dict[str, Any]] = []
+        for set_data in exercise["sets"]:
+            sets_payload.append({
+                "type": set_data["type"],
+                "weight_kg": _to_kg(coordinator, set_data.get("weight")),
+                "reps": set_data.get("reps"),
+                "distance_meters": _to_meters(
+                    coordinator, set_data.get("distance")
+                ),
+                "duration_seconds": set_data.get("duration_seconds"),
+                "rpe": set_data.get("rpe"),
+            })
+
+        exercises_payload.append({
+            "exercise_template_id": template_id,
+            "notes": exercise.get("notes"),
+            "sets": sets_payload,
+        })
+
+    end_time = data.get("end_time") or dt_util.now()
+    start_time = data.get("start_time")
+    if start_time is None:
+        duration_minutes = data.get("duration_minutes")
+        start_time = (
+            end_time - timedelta(minutes=duration_minutes)
+            if duration_minutes
+            else end_time
+        )
+
+    workout: dict[str, Any] = {"title": data["title"]}
+    description = data.get("description")
+    if description is not None:
+        workout["description"] = description
+    workout["is_private"] = data["is_private"]
+    workout["start_time"] = start_time.isoformat()
+    workout["end_time"] = end_time.isoformat()
+    workout["exercises"] = exercises_payload
+    return workout
+
+
+async def _queue_workout(
+    outbox: HevyWorkoutOutbox, workout: dict[str, Any], maybe_sent: bool = False
+) -> dict[str, Any]:
+    """Queue a workout payload and build the log_workout response for it."""
+    item = await outbox.async_enqueue(workout, maybe_sent)
+    return {
+        "workout_id": None,
+        "title": workout["title"],
+        "queued": True,
+        "queue_id": item["id"],
+    }
+
+
+def _encode_cursor(start: datetime, workout_id: str) -> str:
+    """Encode a history position as an opaque cursor string."""
+    raw = f"{start.isoformat()}|{workout_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, str]:
+    """Decode a cursor from a previous get_workout_history response.
+
+    Raises:
+        ServiceValidationError: If the cursor is malformed
+    """
+    try:
+        start, workout_id = (
+            base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+        )
+        start_dt = datetime.fromisoformat(start)
+    except (ValueError, UnicodeDecodeError) as err:
+        raise ServiceValidationError(f"Invalid cursor: {cursor}") from err
+    # Cursors we issue are always timezone-aware; a naive one cannot be
+    # compared with workout start times
+    if start_dt.tzinfo is None:
+        raise ServiceValidationError(f"Invalid cursor: {cursor}")
+    return start_dt, workout_id
+
+
+def _workout_duration_minutes(workout: dict[str, Any]) -> float | None:
+    start_time = workout.get("start_time")
+    end_time = workout.get("end_time")
+    if not start_time or not end_time:
+        return None
+    try:
+        start_dt = datetime.fromisoformat(start_time.replace("Z", "+00:00"))
+        end_dt = datetime.fromisoformat(end_time.replace("Z", "+00:00"))
+    except (ValueError, AttributeError):
+        return None
+    return round((end_dt - start_dt).total_seconds() / 60, 1)
+
+
+def _history_summary(
+    coordinator: HevyDataUpdateCoordinator,
+    dated: list[tuple[datetime, str, dict[str, Any]]],
+) -> dict[str, Any]:
+    """Summarize every workout in the requested range, whatever the page."""
+    total_volume = 0.0
+    total_duration = 0.0
+    workout_days: list[str] = []
+
+    for workout_dt, _, workout in dated:
+        duration_minutes = _workout_duration_minutes(workout)
+        if duration_minutes is not None:
+            total_duration += duration_minutes
+
+        day_str = dt_util.as_local(workout_dt).strftime("%Y-%m-%d")
+        if day_str not in workout_days:
+            workout_days.append(day_str)
+
+        total_volume += coordinator._calculate_total_volume(workout)
+
+    num_workouts = len(dated)
+    return {
+        "total_workouts": num_workouts,
+        "total_volume": round(total_volume, 1),
+        "workout_days": workout_days,
+        "avg_duration_minutes": (
+            round(total_duration / num_workouts, 1) if num_workouts > 0 else 0
+        ),
+        "avg_volume_per_workout": (
+            round(total_volume / num_workouts, 1) if num_workouts > 0 else 0
+        ),
+    }
+
+
+def _workout_history_entry(
+    coordinator: HevyDataUpdateCoordinator,
+    workout: dict[str, Any],
+    include_sets: bool,
+) -> dict[str, Any]:
+    """Build the enriched response entry for one workout."""
+    start_time = workout.get("start_time")
+
+    # Collect muscle groups from exercises
+    muscle_groups: list[str] = []
+    seen_groups: set[str] = set()
+
+    # Build exercises array
+    exercises_response: list[dict[str, Any]] = []
+    for exercise in workout.get("exercises", []):
+        template_id = exercise.get("exercise_template_id")
+        muscle_group = None
+        if template_id and template_id in coordinator.exercise_templates:
+            template = coordinator.exercise_templates[template_id]
+            muscle_group = template.get("muscle_group")
+            if muscle_group and muscle_group not in seen_groups:
+                muscle_groups.append(muscle_group)
+                seen_groups.add(muscle_group)
+
+        sets = exercise.get("sets", [])
+        ex_total_reps = sum(set_data.get("reps") or 0 for set_data in sets)
+        exercise_response: dict[str, Any] = {
+            "name": exercise.get("title", "Unknown"),
+            "muscle_group": muscle_group,
+        }
+        if include_sets:
+            exercise_response["sets"] = [
+                {
+                    "type": set_data.get("type", "normal"),
+                    "weight": coordinator._convert_weight(set_data.get("weight_kg")),
+                    "weight_unit": coordinator._get_weight_unit(),
+                    "reps": set_data.get("reps"),
+                    "duration_seconds": set_data.get("duration_seconds"),
+                }
+                for set_data in sets
+            ]
+        exercise_response["best_set"] = coordinator._get_best_set_string(sets)
+        exercise_response["total_reps"] = ex_total_reps if ex_total_reps > 0 else None
+        exercise_response["notes"] = exercise.get("notes")
+        exercises_response.append(exercise_response)
+
+    return {
+        "id": workout.get("id"),
+        "title": workout.get("title"),
+        "date": start_time,
+        "start_time": start_time,
+        "end_time": workout.get("end_time"),
+        "duration_minutes": _workout_duration_minutes(workout),
+        "total_volume": coordinator._calculate_total_volume(workout),
+        "routine_id": workout.get("routine_id"),
+        "pending": workout.get("pending", False),
+        "muscle_groups": muscle_groups,
+        "exercises": exercises_response,
+    }
+
+
+async def _build_workout_history(
+    coordinator: HevyDataUpdateCoordinator, data: dict[str, Any]
+) -> dict[str, Any]:
+    """Build a get_workout_history response.
+
+    Args:
+        coordinator: Coordinator for the requested config entry
+        data: Validated service call data
+
+    Returns:
+        Service response dict
+
+    Raises:
+        ServiceValidationError: If the cursor is malformed
+        HomeAssistantError: If older history cannot be fetched
+    """
+    days = data.get("days", 30)
+    after = _decode_cursor(data["cursor"]) if "cursor" in data else None
+    cutoff = dt_util.now() - timedelta(days=days)
+
+    # The refresh window covers the common case; older ranges come from
+    # the history store, which fetches only the pages it is missing
+    window_start = coordinator.window_start
+    if window_start is not None and cutoff < window_start:
+        try:
+            source = await coordinator.history.async_workouts_between(
+                cutoff, dt_util.now() + timedelta(days=1)
+            )
+        except HevyApiError as err:
+            raise HomeAssistantError(str(err)) from err
+    else:
+        source = coordinator._workout_history
+
+    # Filter workout history to requested window, newest first
+    dated: list[tuple[datetime, str, dict[str, Any]]] = []
+    for workout in source:
+        workout_dt = parse_start_time(workout)
+        if workout_dt is not None and workout_dt > cutoff:
+            dated.append((workout_dt, workout.get("id") or "", workout))
+    dated.sort(key=lambda item: (item[0], item[1]), reverse=True)
+
+    summary = _history_summary(coordinator, dated)
+    if data["summary_only"]:
+        return {"summary": summary}
+
+    if after is not None:
+        dated = [item for item in dated if (item[0], item[1]) < after]
+    page = dated[: data["limit"]]
+    has_more = len(dated) > len(page)
+
+    include_sets = data["include_sets"]
+    return {
+        "summary": summary,
+        "workouts": [
+            _workout_history_entry(coordinator, workout, include_sets)
+            for _, _, workout in page
+        ],
+        "next_cursor": (
+            _encode_cursor(page[-1][0], page[-1][1]) if page and has_more else None
+        ),
+    }
+
+
 def async_register_services(hass: HomeAssistant) -> None:
     """Register Hevy services."""
 
     async def handle_get_workout_history(call: ServiceCall) -> ServiceResponse:
         """Handle the get_workout_history service call."""
-        days = call.data.get("days", 30)
         config_entry_id = call.data["config_entry_id"]
 
         if config_entry_id not in hass.data.get(DOMAIN, {}):
             raise ServiceValidationError(f"Config entry {config_entry_id} not found")
 
         coordinator: HevyDataUpdateCoordinator = hass.data[DOMAIN][config_entry_id]
-        cutoff = dt_util.now() - timedelta(days=days)
-
-        # Filter workout history to requested window
-        filtered_workouts: list[dict[str, Any]] = []
-        for workout in coordinator._workout_history:
-            start_time = workout.get("start_time")
-            if start_time:
-                try:
-                    workout_dt = datetime.fromisoformat(
-                        start_time.replace("Z", "+00:00")
-                    )
-                    if workout_dt > cutoff:
-                        filtered_workouts.append(workout)
-                except (ValueError, AttributeError):
-                    continue
-
-        # Build enriched response
-        workouts_response: list[dict[str, Any]] = []
-        total_volume = 0.0
-        total_duration = 0.0
-        workout_days: list[str] = []
-
-        for workout in filtered_workouts:
-            start_time = workout.get("start_time")
-            end_time = workout.get("end_time")
-            duration_minutes = None
-
-            if start_time and end_time:
-                try:
-                    start_dt = datetime.fromisoformat(
-                        start_time.replace("Z", "+00:00")
-                    )
-                    end_dt = datetime.fromisoformat(
-                        end_time.replace("Z", "+00:00")
-                    )
-                    duration_minutes = round(
-                        (end_dt - start_dt).total_seconds() / 60, 1
-                    )
-                    total_duration += duration_minutes
-                except (ValueError, AttributeError):
-                    pass
-
-            if start_time:
-                try:
-                    day_str = dt_util.as_local(
-                        datetime.fromisoformat(
-                            start_time.replace("Z", "+00:00")
-                        )
-                    ).strftime("%Y-%m-%d")
-                    if day_str not in workout_days:
-                        workout_days.append(day_str)
-                except (ValueError, AttributeError):
-                    pass
-
-            workout_volume = coordinator._calculate_total_volume(workout)
-            total_volume += workout_volume
-
-            # Collect muscle groups from exercises
-            muscle_groups: list[str] = []
-            seen_groups: set[str] = set()
-
-            # Build exercises array
-            exercises_response: list[dict[str, Any]] = []
-            for exercise in workout.get("exercises", []):
-                template_id = exercise.get("exercise_template_id")
-                muscle_group = None
-                if template_id and template_id in coordinator.exercise_templates:
-                    template = coordinator.exercise_templates[template_id]
-                    muscle_group = template.get("muscle_group")
-                    if muscle_group and muscle_group not in seen_groups:
-                        muscle_groups.append(muscle_group)
-                        seen_groups.add(muscle_group)
-
-                sets = exercise.get("sets", [])
-                sets_converted: list[dict[str, Any]] = []
-                ex_total_reps = 0
-
-                for set_data in sets:
-                    weight = coordinator._convert_weight(set_data.get("weight_kg"))
-                    reps = set_data.get("reps")
-                    sets_converted.append({
-                        "type": set_data.get("type", "normal"),
-                        "weight": weight,
-                        "weight_unit": coordinator._get_weight_unit(),
-                        "reps": reps,
-                        "duration_seconds": set_data.get("duration_seconds"),
-                    })
-                    if reps:
-                        ex_total_reps += reps
-
-                exercises_response.append({
-                    "name": exercise.get("title", "Unknown"),
-                    "muscle_group": muscle_group,
-                    "sets": sets_converted,
-                    "best_set": coordinator._get_best_set_string(sets),
-                    "total_reps": ex_total_reps if ex_total_reps > 0 else None,
-                    "notes": exercise.get("notes"),
-                })
-
-            workouts_response.append({
-                "id": workout.get("id"),
-                "title": workout.get("title"),
-                "date": start_time,
-                "start_time": start_time,
-                "end_time": end_time,
-                "duration_minutes": duration_minutes,
-                "total_volume": workout_volume,
-                "routine_id": workout.get("routine_id"),
-                "muscle_groups": muscle_groups,
-                "exercises": exercises_response,
-            })
-
-        num_workouts = len(workouts_response)
-        summary = {
-            "total_workouts": num_workouts,
-            "total_volume": round(total_volume, 1),
-            "workout_days": workout_days,
-            "avg_duration_minutes": (
-                round(total_duration / num_workouts, 1) if num_workouts > 0 else 0
-            ),
-            "avg_volume_per_workout": (
-                round(total_volume / num_workouts, 1) if num_workouts > 0 else 0
-            ),
-        }
+        cache_key = (
+            SERVICE_GET_WORKOUT_HISTORY,
+            config_entry_id,
+            call.data.get("days", 30),
+            coordinator.unit_system,
+            coordinator.data_version,
+            call.data["limit"],
+            call.data.get("cursor"),
+            call.data["summary_only"],
+            call.data["include_sets"],
+        )
+        if (response := coordinator.responses.get(cache_key)) is not None:
+            return response
 
-        return {
-            "summary": summary,
-            "workouts": workouts_response,
-        }
+        with request_priority(RequestPriority.INTERACTIVE):
+            response = await _build_workout_history(coordinator, call.data)
+        coordinator.responses.put(cache_key, response)
+        return response
 
     async def handle_log_workout(call: ServiceCall) -> ServiceResponse:
         """Handle the log_workout service call."""
@@ -308,65 +584,104 @@ def async_register_services(hass: HomeAssistant) -> None:
 
         coordinator: HevyDataUpdateCoordinator = hass.data[DOMAIN][config_entry_id]
 
-        exercises_payload: list[dict[str, Any]] = []
-        for exercise in call.data["exercises"]:
-            template_id = _resolve_template_id(coordinator, exercise["name"])
-
-            sets_payload: list[dict[str, Any]] = []
-            for set_data in exercise["sets"]:
-                sets_payload.append({
-                    "type": set_data["type"],
-                    "weight_kg": _to_kg(coordinator, set_data.get("weight")),
-                    "reps": set_data.get("reps"),
-                    "distance_meters": _to_meters(
-                        coordinator, set_data.get("distance")
-                    ),
-                    "duration_seconds": set_data.get("duration_seconds"),
-                    "rpe": set_data.get("rpe"),
-                })
-
-            exercises_payload.append({
-                "exercise_template_id": template_id,
-                "notes": exercise.get("notes"),
-                "sets": sets_payload,
-            })
-
-        end_time = call.data.get("end_time") or dt_util.now()
-        start_time = call.data.get("start_time")
-        if start_time is None:
-            duration_minutes = call.data.get("duration_minutes")
-            start_time = (
-                end_time - timedelta(minutes=duration_minutes)
-                if duration_minutes
-                else end_time
-            )
+        workout = _build_workout_payload(coordinator, call.data, {})
 
-        workout: dict[str, Any] = {"title": call.data["title"]}
-        description = call.data.get("description")
-        if description is not None:
-            workout["description"] = description
-        workout["is_private"] = call.data["is_private"]
-        workout["start_time"] = start_time.isoformat()
-        workout["end_time"] = end_time.isoformat()
-        workout["exercises"] = exercises_payload
+        if call.data["queue"]:
+            if coordinator.outbox is None:
+                raise HomeAssistantError("The workout queue is not available")
+            return await _queue_workout(coordinator.outbox, workout)
 
         try:
-            created = await coordinator.client.create_workout({"workout": workout})
-        except HevyApiError as err:
+            with request_priority(RequestPriority.INTERACTIVE, deadline=None):
+                created = await coordinator.client.create_workout(
+                    {"workout": workout}
+                )
+        except (HevyAuthError, HevyRequestError) as err:
+            # Retrying would be rejected the same way
             raise HomeAssistantError(str(err)) from err
+        except HevyApiError as err:
+            # Hevy is unreachable or failing; keep the workout rather than
+            # dropping it, and let the outbox retry in the background
+            if coordinator.outbox is None:
+                raise HomeAssistantError(str(err)) from err
+            _LOGGER.warning("Queued workout for retry: %s", err)
+            return await _queue_workout(
+                coordinator.outbox,
+                workout,
+                maybe_sent=isinstance(err, HevyConnectionError),
+            )
 
-        await coordinator.async_request_refresh()
-
-        result = created.get("workout", created) if created else {}
-        if isinstance(result, list):
-            result = result[0] if result else {}
+        result = unwrap_created_workout(created)
         _LOGGER.debug("Logged workout %s", result.get("id"))
 
+        # Sensors update from the created workout right away; a full
+        # refresh is only needed if Hevy's response was too sparse
+        if not coordinator.async_add_workout(result):
+            await coordinator.async_request_refresh()
+
         return {
             "workout_id": result.get("id"),
             "title": result.get("title"),
         }
 
+    async def handle_log_workouts(call: ServiceCall) -> ServiceResponse:
+        """Handle the log_workouts service call."""
+        config_entry_id = call.data["config_entry_id"]
+
+        if config_entry_id not in hass.data.get(DOMAIN, {}):
+            raise ServiceValidationError(f"Config entry {config_entry_id} not found")
+
+        coordinator: HevyDataUpdateCoordinator = hass.data[DOMAIN][config_entry_id]
+
+        # Build every payload before posting anything, so an unknown
+        # exercise name rejects the whole batch instead of half of it
+        template_ids: dict[str, str] = {}
+        payloads = [
+            _build_workout_payload(coordinator, workout_data, template_ids)
+            for workout_data in call.data["workouts"]
+        ]
+
+        semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+
+        async def _create(index: int, workout: dict[str, Any]) -> dict[str, Any]:
+            async with semaphore:
+                try:
+                    created = await coordinator.client.create_workout(
+                        {"workout": workout}
+                    )
+                except HevyApiError as err:
+                    return {
+                        "index": index,
+                        "title": workout["title"],
+                        "error": str(err),
+                    }
+            result = unwrap_created_workout(created)
+            created_workouts.append(result)
+            return {
+                "index": index,
+                "workout_id": result.get("id"),
+                "title": result.get("title"),
+            }
+
+        created_workouts: list[dict[str, Any]] = []
+        with request_priority(RequestPriority.INTERACTIVE, deadline=None):
+            results = await asyncio.gather(
+                *(_create(index, workout) for index, workout in enumerate(payloads))
+            )
+        logged = sum(1 for result in results if "error" not in result)
+        _LOGGER.debug("Logged %d of %d workouts", logged, len(results))
+
+        # One rebuild for the whole batch, and a refresh only if some
+        # created workout could not be ingested locally
+        if not coordinator.async_add_workouts(created_workouts):
+            await coordinator.async_request_refresh()
+
+        return {
+            "logged": logged,
+            "failed": len(results) - logged,
+            "results": list(results),
+        }
+
     async def handle_get_exercise_catalog(call: ServiceCall) -> ServiceResponse:
         config_entry_id = call.data["config_entry_id"]
 
@@ -390,7 +705,7 @@ def async_register_services(hass: HomeAssistant) -> None:
             "exercises": exercises,
         }
 
-    async def handle_get_routines(call: ServiceCall) -> ServiceResponse:
+    async def handle_search_exercises(call: ServiceCall) -> ServiceResponse:
         config_entry_id = call.data["config_entry_id"]
 
         if config_entry_id not in hass.data.get(DOMAIN, {}):
@@ -398,46 +713,150 @@ def async_register_services(hass: HomeAssistant) -> None:
 
         coordinator: HevyDataUpdateCoordinator = hass.data[DOMAIN][config_entry_id]
 
-        routines_response: list[dict[str, Any]] = []
-        for routine in coordinator.routines:
-            exercises_response: list[dict[str, Any]] = []
-            for exercise in routine.get("exercises", []):
-                sets_response: list[dict[str, Any]] = []
-                for set_data in exercise.get("sets", []):
-                    set_response: dict[str, Any] = {
-                        "type": set_data.get("type", "normal")
-                    }
-                    weight = coordinator._convert_weight(set_data.get("weight_kg"))
-                    if weight is not None:
-                        set_response["weight"] = weight
-                    if set_data.get("reps") is not None:
-                        set_response["reps"] = set_data["reps"]
-                    if set_data.get("duration_seconds") is not None:
-                        set_response["duration_seconds"] = set_data["duration_seconds"]
-                    distance = coordinator._convert_distance(
-                        set_data.get("distance_meters")
-                    )
-                    if distance is not None:
-                        set_response["distance"] = distance
-                    sets_response.append(set_response)
-
-                exercises_response.append({
-                    "name": exercise.get("name"),
-                    "exercise_template_id": exercise.get("exercise_template_id"),
-                    "sets": sets_response,
-                })
-
-            routines_response.append({
-                "id": routine.get("id"),
-                "title": routine.get("title"),
-                "exercises": exercises_response,
-            })
+        matches = coordinator.exercise_index.search(
+            call.data.get("query"),
+            muscle_group=call.data.get("muscle_group"),
+            equipment=call.data.get("equipment"),
+            exercise_type=call.data.get("type"),
+        )
+        offset = call.data["offset"]
+        end = offset + call.data["limit"]
+        templates = coordinator.exercise_templates
 
         return {
-            "count": len(routines_response),
-            "routines": routines_response,
+            "total": len(matches),
+            "exercises": [
+                {
+                    "id": template_id,
+                    "title": templates[template_id].get("title"),
+                    "muscle_group": templates[template_id].get("muscle_group"),
+                    "secondary_muscle_groups": templates[template_id].get(
+                        "secondary_muscle_groups", []
+                    ),
+                    "equipment": templates[template_id].get("equipment"),
+                    "type": templates[template_id].get("type"),
+                    "score": score,
+                }
+                for template_id, score in matches[offset:end]
+            ],
+            "next_offset": end if end < len(matches) else None,
         }
 
+    async def handle_query(call: ServiceCall) -> ServiceResponse:
+        config_entry_id = call.data["config_entry_id"]
+
+        if config_entry_id not in hass.data.get(DOMAIN, {}):
+            raise ServiceValidationError(f"Config entry {config_entry_id} not found")
+
+        coordinator: HevyDataUpdateCoordinator = hass.data[DOMAIN][config_entry_id]
+
+        end = call.data.get("end_date") or dt_util.now().date()
+        start = call.data.get("start_date") or end - timedelta(
+            days=call.data.get("days", 30) - 1
+        )
+        if start > end:
+            raise ServiceValidationError("start_date must not be after end_date")
+
+        try:
+            with request_priority(RequestPriority.INTERACTIVE):
+                await coordinator.rollups.async_ensure(
+                    dt_util.start_of_local_day(start)
+                )
+        except HevyApiError as err:
+            raise HomeAssistantError(str(err)) from err
+
+        return {
+            "start_date": start.isoformat(),
+            "end_date": end.isoformat(),
+            "weight_unit": coordinator._get_weight_unit(),
+            "distance_unit": coordinator._get_distance_unit(),
+            "rows": coordinator.rollups.query(
+                start, end, call.data["group_by"], call.data["metrics"]
+            ),
+        }
+
+    async def handle_export_history(call: ServiceCall) -> ServiceResponse:
+        config_entry_id = call.data["config_entry_id"]
+
+        if config_entry_id not in hass.data.get(DOMAIN, {}):
+            raise ServiceValidationError(f"Config entry {config_entry_id} not found")
+
+        coordinator: HevyDataUpdateCoordinator = hass.data[DOMAIN][config_entry_id]
+        export_format = call.data["format"]
+        filename = call.data.get("filename") or (
+            f"hevy_{dt_util.now().strftime('%Y%m%d_%H%M%S')}.{export_format}"
+        )
+
+        try:
+            with request_priority(RequestPriority.BACKGROUND):
+                return await async_export_history(
+                    hass, coordinator, config_entry_id, export_format, filename
+                )
+        except HevyApiError as err:
+            raise HomeAssistantError(str(err)) from err
+        except OSError as err:
+            raise HomeAssistantError(f"Could not write export: {err}") from err
+
+    async def handle_import_workouts(call: ServiceCall) -> ServiceResponse:
+        config_entry_id = call.data["config_entry_id"]
+
+        if config_entry_id not in hass.data.get(DOMAIN, {}):
+            raise ServiceValidationError(f"Config entry {config_entry_id} not found")
+
+        coordinator: HevyDataUpdateCoordinator = hass.data[DOMAIN][config_entry_id]
+
+        try:
+            with request_priority(RequestPriority.BACKGROUND):
+                return await async_import_workouts(
+                    hass,
+                    coordinator,
+                    config_entry_id,
+                    call.data["filename"],
+                    call.data["exercise_map"],
+                    call.data["is_private"],
+                )
+        except FileNotFoundError as err:
+            raise ServiceValidationError(
+                f"File {call.data['filename']} not found in {IMPORT_DIR}/"
+            ) from err
+        except HevyApiError as err:
+            raise HomeAssistantError(str(err)) from err
+        except OSError as err:
+            raise HomeAssistantError(f"Could not read import file: {err}") from err
+
+    async def handle_profile_refresh(call: ServiceCall) -> ServiceResponse:
+        config_entry_id = call.data["config_entry_id"]
+
+        if config_entry_id not in hass.data.get(DOMAIN, {}):
+            raise ServiceValidationError(f"Config entry {config_entry_id} not found")
+
+        # Profiles expose code paths and file locations, so admins only
+        if call.context.user_id:
+            user = await hass.auth.async_get_user(call.context.user_id)
+            if user is None:
+                raise UnknownUser(context=call.context, user_id=call.context.user_id)
+            if not user.is_admin:
+                raise Unauthorized(context=call.context)
+
+        coordinator: HevyDataUpdateCoordinator = hass.data[DOMAIN][config_entry_id]
+
+        try:
+            return await async_profile_refresh(hass, coordinator, call.data["top"])
+        except OSError as err:
+            raise HomeAssistantError(f"Could not write profile: {err}") from err
+
+    async def handle_get_routines(call: ServiceCall) -> ServiceResponse:
+        config_entry_id = call.data["config_entry_id"]
+
+        if config_entry_id not in hass.data.get(DOMAIN, {}):
+            raise ServiceValidationError(f"Config entry {config_entry_id} not found")
+
+        coordinator: HevyDataUpdateCoordinator = hass.data[DOMAIN][config_entry_id]
+
+        # The view is shared across calls, so the caller gets its own copy
+        view = coordinator.routines_view
+        return {**view, "routines": list(view["routines"])}
+
     if not hass.services.has_service(DOMAIN, SERVICE_GET_WORKOUT_HISTORY):
         hass.services.async_register(
             DOMAIN,
@@ -456,6 +875,15 @@ def async_register_services(hass: HomeAssistant) -> None:
             supports_response=SupportsResponse.OPTIONAL,
         )
 
+    if not hass.services.has_service(DOMAIN, SERVICE_LOG_WORKOUTS):
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_LOG_WORKOUTS,
+            handle_log_workouts,
+            schema=LOG_WORKOUTS_SCHEMA,
+            supports_response=SupportsResponse.OPTIONAL,
+        )
+
     if not hass.services.has_service(DOMAIN, SERVICE_GET_EXERCISE_CATALOG):
         hass.services.async_register(
             DOMAIN,
@@ -465,6 +893,51 @@ def async_register_services(hass: HomeAssistant) -> None:
             supports_response=SupportsResponse.ONLY,
         )
 
+    if not hass.services.has_service(DOMAIN, SERVICE_SEARCH_EXERCISES):
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_SEARCH_EXERCISES,
+            handle_search_exercises,
+            schema=SEARCH_EXERCISES_SCHEMA,
+            supports_response=SupportsResponse.ONLY,
+        )
+
+    if not hass.services.has_service(DOMAIN, SERVICE_QUERY):
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_QUERY,
+            handle_query,
+            schema=QUERY_SCHEMA,
+            supports_response=SupportsResponse.ONLY,
+        )
+
+    if not hass.services.has_service(DOMAIN, SERVICE_EXPORT_HISTORY):
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_EXPORT_HISTORY,
+            handle_export_history,
+            schema=EXPORT_HISTORY_SCHEMA,
+            supports_response=SupportsResponse.OPTIONAL,
+        )
+
+    if not hass.services.has_service(DOMAIN, SERVICE_IMPORT_WORKOUTS):
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_IMPORT_WORKOUTS,
+            handle_import_workouts,
+            schema=IMPORT_WORKOUTS_SCHEMA,
+            supports_response=SupportsResponse.OPTIONAL,
+        )
+
+    if not hass.services.has_service(DOMAIN, SERVICE_PROFILE_REFRESH):
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_PROFILE_REFRESH,
+            handle_profile_refresh,
+            schema=PROFILE_REFRESH_SCHEMA,
+            supports_response=SupportsResponse.OPTIONAL,
+        )
+
     if not hass.services.has_service(DOMAIN, SERVICE_GET_ROUTINES):
         hass.services.async_register(
             DOMAIN,
@@ -480,5 +953,11 @@ def async_unregister_services(hass: HomeAssistant) -> None:
     if not hass.data.get(DOMAIN):
         hass.services.async_remove(DOMAIN, SERVICE_GET_WORKOUT_HISTORY)
         hass.services.async_remove(DOMAIN, SERVICE_LOG_WORKOUT)
+        hass.services.async_remove(DOMAIN, SERVICE_LOG_WORKOUTS)
         hass.services.async_remove(DOMAIN, SERVICE_GET_EXERCISE_CATALOG)
         hass.services.async_remove(DOMAIN, SERVICE_GET_ROUTINES)
+        hass.services.async_remove(DOMAIN, SERVICE_SEARCH_EXERCISES)
+        hass.services.async_remove(DOMAIN, SERVICE_QUERY)
+        hass.services.async_remove(DOMAIN, SERVICE_EXPORT_HISTORY)
+        hass.services.async_remove(DOMAIN, SERVICE_IMPORT_WORKOUTS)
+        hass.services.async_remove(DOMAIN, SERVICE_PROFILE_REFRESH)
@@ -0,0 +1,254 @@
+"""Compact, shared views of workouts in the configured units."""
+from __future__ import annotations
+
+import sys
+from collections.abc import Iterable
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, NamedTuple
+from weakref import WeakValueDictionary
+
+from homeassistant.util.read_only_dict import ReadOnlyDict
+
+if TYPE_CHECKING:
+    from .coordinator import HevyDataUpdateCoordinator
+
+
+def intern_text(value: Any) -> Any:
+    """Intern a string so equal values share one object; pass others through."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class _WorkoutViews(NamedTuple):
+    """Views built from one workout, and the workout they came from."""
+
+    source: dict[str, Any]
+    exercises: tuple[ReadOnlyDict[str, Any], ...]
+    summary: ReadOnlyDict[str, Any] | None
+
+
+class HevyWorkoutViews:
+    """Converted exercise and workout summaries, built once per workout.
+
+    The raw workouts in the refresh window are the one canonical store.
+    Everything the sensors show per set or per exercise is derived from
+    them here on first use and kept until the workout changes or leaves
+    the window, so a refresh that brings in one new workout converts
+    only that one. The last workout summary and the per-exercise data
+    hand out the same objects instead of converting the same sets twice.
+    The per-day summaries keep their smaller layout (no durations or
+    distance totals), built from pooled sets of their own.
+
+    Views are read-only: sets are ReadOnlyDicts, identical sets (the
+    usual 3 x 5 at one weight) are a single shared object, sequences are
+    tuples, and exercise titles and set types are interned.
+    """
+
+    def __init__(self, coordinator: HevyDataUpdateCoordinator) -> None:
+        """Initialize the views.
+
+        Args:
+            coordinator: Coordinator providing unit conversion
+        """
+        self._coordinator = coordinator
+        # Workout ID -> views built from it
+        self._workouts: dict[str, _WorkoutViews] = {}
+        # Raw set values -> converted set; entries go when no view uses them
+        self._sets: WeakValueDictionary[tuple[Any, ...], ReadOnlyDict[str, Any]] = (
+            WeakValueDictionary()
+        )
+        # Same, for the sets of the per-day summaries
+        self._summary_sets: WeakValueDictionary[
+            tuple[Any, ...], ReadOnlyDict[str, Any]
+        ] = WeakValueDictionary()
+
+    def __len__(self) -> int:
+        return len(self._workouts)
+
+    @property
+    def shared_sets(self) -> int:
+        """Number of distinct converted sets currently held."""
+        return len(self._sets) + len(self._summary_sets)
+
+    def prune(self, workouts: Iterable[dict[str, Any]]) -> None:
+        """Drop the views of workouts that are no longer in the window.
+
+        Args:
+            workouts: Workouts in the refresh window
+        """
+        keep = {workout.get("id") for workout in workouts}
+        for workout_id in [w for w in self._workouts if w not in keep]:
+            del self._workouts[workout_id]
+
+    def exercises(self, workout: dict[str, Any]) -> tuple[ReadOnlyDict[str, Any], ...]:
+        """Return the converted exercises of a workout.
+
+        Args:
+            workout: Workout in API shape
+
+        Returns:
+            One view per exercise with name, sets, best_set, total_reps,
+            total_duration_seconds, total_distance, distance_unit, notes
+        """
+        return self._views(workout).exercises
+
+    def summary(self, workout: dict[str, Any]) -> ReadOnlyDict[str, Any]:
+        """Return the summary of a workout shown per day.
+
+        Args:
+            workout: Workout in API shape
+
+        Returns:
+            View with title, duration_minutes, total_volume,
+            total_volume_unit, exercise_count, and exercises (each with
+            name, sets, best_set, total_reps, notes)
+        """
+        views = self._views(workout)
+        if views.summary is None:
+            views = views._replace(summary=self._build_summary(workout, views.exercises))
+            if (workout_id := workout.get("id")) is not None:
+                self._workouts[workout_id] = views
+        return views.summary
+
+    def _views(self, workout: dict[str, Any]) -> _WorkoutViews:
+        workout_id = workout.get("id")
+        views = self._workouts.get(workout_id)
+        if views is not None:
+            if views.source is workout:
+                return views
+            # A refetched workout is a new dict; reuse views if it is unchanged
+            if views.source == workout:
+                views = self._workouts[workout_id] = views._replace(source=workout)
+                return views
+
+        views = _WorkoutViews(
+            workout,
+            tuple(
+                self._build_exercise(exercise)
+                for exercise in workout.get("exercises") or []
+            ),
+            None,
+        )
+        if workout_id is not None:
+            self._workouts[workout_id] = views
+        return views
+
+    def _convert_set(self, set_data: dict[str, Any]) -> ReadOnlyDict[str, Any]:
+        key = (
+            set_data.get("type", "normal"),
+            set_data.get("weight_kg"),
+            set_data.get("reps"),
+            set_data.get("duration_seconds"),
+            set_data.get("distance_meters"),
+        )
+        converted = self._sets.get(key)
+        if converted is None:
+            coordinator = self._coordinator
+            converted = self._sets[key] = ReadOnlyDict(
+                {
+                    "type": intern_text(key[0]),
+                    "weight": coordinator._convert_weight(key[1]),
+                    "weight_unit": coordinator._get_weight_unit(),
+                    "reps": key[2],
+                    "duration_seconds": key[3],
+                    "distance": coordinator._convert_distance(key[4]),
+                    "distance_unit": coordinator._get_distance_unit(),
+                }
+            )
+        return converted
+
+    def _convert_summary_set(self, set_data: dict[str, Any]) -> ReadOnlyDict[str, Any]:
+        key = (
+            set_data.get("type", "normal"),
+            set_data.get("weight_kg"),
+            set_data.get("reps"),
+            set_data.get("distance_meters"),
+        )
+        converted = self._summary_sets.get(key)
+        if converted is None:
+            coordinator = self._coordinator
+            converted = self._summary_sets[key] = ReadOnlyDict(
+                {
+                    "type": intern_text(key[0]),
+                    "weight": coordinator._convert_weight(key[1]),
+                    "weight_unit": coordinator._get_weight_unit(),
+                    "reps": key[2],
+                    "distance": coordinator._convert_distance(key[3]),
+                    "distance_unit": coordinator._get_distance_unit(),
+                }
+            )
+        return converted
+
+    def _build_exercise(self, exercise: dict[str, Any]) -> ReadOnlyDict[str, Any]:
+        coordinator = self._coordinator
+        raw_sets = exercise.get("sets") or []
+        total_reps = 0
+        total_duration = 0
+        total_distance_meters = 0
+        for set_data in raw_sets:
+            total_reps += set_data.get("reps") or 0
+            total_duration += set_data.get("duration_seconds") or 0
+            if set_data.get("distance_meters") is not None:
+                total_distance_meters += set_data["distance_meters"]
+
+        has_distance = total_distance_meters > 0
+        return ReadOnlyDict(
+            {
+                "name": intern_text(exercise.get("title") or "Unknown"),
+                "sets": tuple(self._convert_set(set_data) for set_data in raw_sets),
+                "best_set": coordinator._get_best_set_string(raw_sets),
+                "total_reps": total_reps if total_reps > 0 else None,
+                "total_duration_seconds": total_duration if total_duration > 0 else None,
+                "total_distance": (
+                    coordinator._convert_distance(total_distance_meters)
+                    if has_distance
+                    else None
+                ),
+                "distance_unit": (
+                    coordinator._get_distance_unit() if has_distance else None
+                ),
+                "notes": exercise.get("notes"),
+            }
+        )
+
+    def _build_summary(
+        self,
+        workout: dict[str, Any],
+        exercises: tuple[ReadOnlyDict[str, Any], ...],
+    ) -> ReadOnlyDict[str, Any]:
+        coordinator = self._coordinator
+        duration_minutes = None
+        try:
+            start_dt = datetime.fromisoformat(
+                workout["start_time"].replace("Z", "+00:00")
+            )
+            end_dt = datetime.fromisoformat(workout["end_time"].replace("Z", "+00:00"))
+            duration_minutes = round((end_dt - start_dt).total_seconds() / 60, 1)
+        except (KeyError, ValueError, AttributeError, TypeError):
+            pass
+
+        return ReadOnlyDict(
+            {
+                "title": workout.get("title", "Untitled"),
+                "duration_minutes": duration_minutes,
+                "total_volume": coordinator._calculate_total_volume(workout),
+                "total_volume_unit": coordinator._get_weight_unit(),
+                "exercise_count": len(exercises),
+                "exercises": tuple(
+                    ReadOnlyDict(
+                        {
+                            "name": view["name"],
+                            "sets": tuple(
+                                self._convert_summary_set(set_data)
+                                for set_data in exercise.get("sets") or []
+                            ),
+                            "best_set": view["best_set"],
+                            "total_reps": view["total_reps"],
+                            "notes": view["notes"],
+                        }
+                    )
+                    for exercise, view in zip(
+                        workout.get("exercises") or [], exercises, strict=True
+                    )
+                ),
+            }
+        )
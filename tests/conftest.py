@@ -79,6 +79,9 @@ def mock_client() -> MagicMock:
         return_value={"exercise_templates": [], "page_count": 1}
     )
     client.get_routines = AsyncMock(return_value=ROUTINES_RESPONSE)
+    client.get_routine_folders = AsyncMock(
+        return_value={"routine_folders": [], "page_count": 1}
+    )
     return client
 
 
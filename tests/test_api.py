@@ -0,0 +1,285 @@
+from __future__ import annotations
+
+import threading
+from datetime import datetime, timezone
+from http import HTTPStatus
+
+import pytest
+
+from custom_components.hevy import api
+from custom_components.hevy.api import (
+    HevyApiClient,
+    HevyApiError,
+    HevyAuthError,
+    HevyUnavailableError,
+)
+from custom_components.hevy.const import API_BASE_URL
+from custom_components.hevy.scheduler import RequestPriority, request_priority
+
+ROUTINES_URL = f"{API_BASE_URL}/routines"
+PARAMS = {"page": "1", "pageSize": "10"}
+BODY = {"routines": [{"id": "r1", "title": "Push Day"}], "page_count": 1}
+
+
+@pytest.fixture
+async def client(hass, aioclient_mock):
+    session = aioclient_mock.create_session(hass.loop)
+    yield HevyApiClient("key", session)
+    await session.close()
+
+
+def _respond(aioclient_mock, **kwargs):
+    aioclient_mock.clear_requests()
+    aioclient_mock.get(ROUTINES_URL, params=PARAMS, **kwargs)
+
+
+class TestConditionalRequests:
+    async def test_not_modified_returns_cached_body(
+        self, client, aioclient_mock
+    ) -> None:
+        _respond(aioclient_mock, json=BODY, headers={"ETag": '"v1"'})
+        first = await client.get_routines()
+        assert first == BODY
+
+        _respond(aioclient_mock, status=HTTPStatus.NOT_MODIFIED)
+        second = await client.get_routines()
+        assert second is first
+        headers = aioclient_mock.mock_calls[0][3]
+        assert headers["If-None-Match"] == '"v1"'
+
+        stats = client.stats
+        assert stats["conditional_requests"] == 2
+        assert stats["not_modified"] == 1
+        assert stats["hit_rate"] == 50.0
+
+    async def test_sends_last_modified(self, client, aioclient_mock) -> None:
+        last_modified = "Tue, 20 Oct 2026 10:00:00 GMT"
+        _respond(aioclient_mock, json=BODY, headers={"Last-Modified": last_modified})
+        await client.get_routines()
+
+        _respond(aioclient_mock, status=HTTPStatus.NOT_MODIFIED)
+        await client.get_routines()
+        headers = aioclient_mock.mock_calls[0][3]
+        assert headers["If-Modified-Since"] == last_modified
+        assert "If-None-Match" not in headers
+
+    async def test_identical_body_without_validators(
+        self, client, aioclient_mock
+    ) -> None:
+        _respond(aioclient_mock, json=BODY)
+        first = await client.get_routines()
+        _respond(aioclient_mock, json=BODY)
+        second = await client.get_routines()
+
+        assert second is first
+        assert client.stats["unchanged"] == 1
+        assert "If-None-Match" not in aioclient_mock.mock_calls[0][3]
+
+    async def test_changed_body_replaces_cache(self, client, aioclient_mock) -> None:
+        _respond(aioclient_mock, json=BODY)
+        first = await client.get_routines()
+        _respond(aioclient_mock, json={**BODY, "page_count": 2})
+        second = await client.get_routines()
+
+        assert second is not first
+        assert second["page_count"] == 2
+        assert client.stats["hit_rate"] == 0.0
+
+    async def test_pages_are_cached_separately(self, client, aioclient_mock) -> None:
+        _respond(aioclient_mock, json=BODY)
+        await client.get_routines()
+        aioclient_mock.get(
+            ROUTINES_URL, params={"page": "2", "pageSize": "10"}, json=BODY
+        )
+        await client.get_routines(page=2)
+        assert client.stats["unchanged"] == 0
+
+    async def test_not_modified_without_cache_is_an_error(
+        self, client, aioclient_mock
+    ) -> None:
+        aioclient_mock.get(
+            f"{API_BASE_URL}/workouts/count", status=HTTPStatus.NOT_MODIFIED
+        )
+        with pytest.raises(HevyApiError):
+            await client.get_workout_count()
+
+    async def test_counts_bytes_for_all_requests(
+        self, client, aioclient_mock
+    ) -> None:
+        aioclient_mock.get(
+            f"{API_BASE_URL}/workouts/count", text='{"workout_count": 12}'
+        )
+        assert await client.get_workout_count() == 12
+        stats = client.stats
+        assert stats["requests"] == 1
+        assert stats["bytes_received"] == len('{"workout_count": 12}')
+        assert stats["conditional_requests"] == 0
+        assert stats["hit_rate"] is None
+
+
+class TestTransport:
+    async def test_negotiates_compression(self, client, aioclient_mock) -> None:
+        aioclient_mock.get(f"{API_BASE_URL}/workouts/count", json={"workout_count": 1})
+        await client.get_workout_count()
+        headers = aioclient_mock.mock_calls[0][3]
+        assert "gzip" in headers["Accept-Encoding"]
+
+    async def test_records_bytes_per_endpoint(self, client, aioclient_mock) -> None:
+        body = '{"workout_count": 12}'
+        aioclient_mock.get(
+            f"{API_BASE_URL}/workouts/count",
+            text=body,
+            headers={"Content-Encoding": "gzip", "Content-Length": "9"},
+        )
+        await client.get_workout_count()
+        endpoint = client.stats["endpoints"]["/workouts/count"]
+        assert endpoint["requests"] == 1
+        assert endpoint["bytes_on_wire"] == 9
+        assert endpoint["bytes_decoded"] == len(body)
+        assert endpoint["max_latency_ms"] >= endpoint["avg_latency_ms"] >= 0
+
+    async def test_latency_recorded_for_failed_requests(
+        self, client, aioclient_mock
+    ) -> None:
+        aioclient_mock.get(
+            f"{API_BASE_URL}/workouts/count", status=HTTPStatus.BAD_REQUEST
+        )
+        with pytest.raises(HevyApiError):
+            await client.get_workout_count()
+        endpoint = client.stats["endpoints"]["/workouts/count"]
+        assert endpoint["requests"] == 0
+        assert endpoint["sent"] == 1
+        assert "avg_latency_ms" in endpoint
+
+    async def test_large_body_decoded_in_executor(
+        self, client, aioclient_mock, monkeypatch
+    ) -> None:
+        monkeypatch.setattr(api, "JSON_EXECUTOR_BYTES", 8)
+        decoded_in: list[bool] = []
+        loads = api.json_loads
+
+        def _loads(body):
+            decoded_in.append(threading.current_thread() is threading.main_thread())
+            return loads(body)
+
+        monkeypatch.setattr(api, "json_loads", _loads)
+        aioclient_mock.get(
+            f"{API_BASE_URL}/workouts/count", json={"workout_count": 12}
+        )
+        assert await client.get_workout_count() == 12
+        assert decoded_in == [False]
+
+    async def test_invalid_json(self, client, aioclient_mock) -> None:
+        aioclient_mock.get(f"{API_BASE_URL}/workouts/count", text="<html>")
+        with pytest.raises(HevyApiError, match="Invalid JSON"):
+            await client.get_workout_count()
+
+
+class TestStreamedWorkouts:
+    URL = f"{API_BASE_URL}/workouts"
+
+    async def test_stops_at_cutoff(self, client, aioclient_mock) -> None:
+        body = {
+            "page": 1,
+            "page_count": 4,
+            "workouts": [
+                {"id": "w3", "start_time": "2026-10-18T17:00:00Z"},
+                {"id": "w2", "start_time": "2026-10-10T17:00:00Z"},
+                {"id": "w1", "start_time": "2026-09-01T17:00:00Z"},
+            ],
+        }
+        aioclient_mock.get(self.URL, params=PARAMS, json=body)
+        page = await client.get_workouts(
+            stop_before=datetime(2026, 10, 1, tzinfo=timezone.utc)
+        )
+        assert [w["id"] for w in page["workouts"]] == ["w3", "w2"]
+        assert page["truncated"] is True
+        assert page["page_count"] == 4
+
+    async def test_whole_page_before_cutoff(self, client, aioclient_mock) -> None:
+        body = {
+            "page_count": 1,
+            "workouts": [{"id": "w1", "start_time": "2026-10-18T17:00:00Z"}],
+        }
+        aioclient_mock.get(self.URL, params=PARAMS, json=body)
+        page = await client.get_workouts(
+            stop_before=datetime(2026, 10, 1, tzinfo=timezone.utc)
+        )
+        assert page == {**body, "truncated": False}
+        assert client.stats["endpoints"]["/workouts"]["requests"] == 1
+
+    async def test_invalid_body(self, client, aioclient_mock) -> None:
+        aioclient_mock.get(self.URL, params=PARAMS, text='{"workouts": [')
+        with pytest.raises(HevyApiError, match="Invalid JSON"):
+            await client.get_workouts(
+                stop_before=datetime(2026, 10, 1, tzinfo=timezone.utc)
+            )
+
+    async def test_auth_error(self, client, aioclient_mock) -> None:
+        aioclient_mock.get(self.URL, params=PARAMS, status=HTTPStatus.UNAUTHORIZED)
+        with pytest.raises(HevyAuthError):
+            await client.get_workouts(
+                stop_before=datetime(2026, 10, 1, tzinfo=timezone.utc)
+            )
+
+
+class TestScheduling:
+    async def test_rate_limited_response_throttles(
+        self, client, aioclient_mock
+    ) -> None:
+        aioclient_mock.get(
+            f"{API_BASE_URL}/workouts/count",
+            status=HTTPStatus.TOO_MANY_REQUESTS,
+            headers={"Retry-After": "0"},
+        )
+        with pytest.raises(HevyApiError, match="Rate limited"):
+            await client.get_workout_count()
+        scheduler = client.stats["scheduler"]
+        assert scheduler["throttled"] == 1
+        assert scheduler["in_flight"] == 0
+
+    async def test_requests_use_context_priority(
+        self, client, aioclient_mock
+    ) -> None:
+        aioclient_mock.get(f"{API_BASE_URL}/workouts/count", json={"workout_count": 1})
+        with request_priority(RequestPriority.INTERACTIVE):
+            await client.get_workout_count()
+        await client.get_workout_count()
+        classes = client.stats["scheduler"]["classes"]
+        assert classes["interactive"]["granted"] == 1
+        assert classes["refresh"]["granted"] == 1
+
+
+class TestCircuitBreaker:
+    URL = f"{API_BASE_URL}/workouts/count"
+
+    async def test_fails_fast_while_open(self, client, aioclient_mock) -> None:
+        aioclient_mock.get(self.URL, status=HTTPStatus.BAD_GATEWAY)
+        for _ in range(3):
+            with pytest.raises(HevyApiError, match="502"):
+                await client.get_workout_count()
+        assert aioclient_mock.call_count == 3
+
+        with pytest.raises(HevyUnavailableError):
+            await client.get_workout_count()
+        assert aioclient_mock.call_count == 3
+        assert client.stats["breaker"]["state"] == "open"
+
+    async def test_client_errors_do_not_trip(self, client, aioclient_mock) -> None:
+        aioclient_mock.get(self.URL, status=HTTPStatus.UNAUTHORIZED)
+        for _ in range(4):
+            with pytest.raises(HevyAuthError):
+                await client.get_workout_count()
+        assert client.stats["breaker"]["state"] == "closed"
+
+    async def test_probe_closes_breaker(self, client, aioclient_mock, freezer) -> None:
+        aioclient_mock.get(self.URL, exc=TimeoutError())
+        for _ in range(3):
+            with pytest.raises(HevyApiError, match="timeout"):
+                await client.get_workout_count()
+
+        freezer.tick(61)
+        aioclient_mock.clear_requests()
+        aioclient_mock.get(self.URL, json={"workout_count": 3})
+        assert await client.get_workout_count() == 3
+        assert client.stats["breaker"]["state"] == "closed"
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import pytest
+
+from custom_components.hevy.breaker import (
+    BREAKER_CLOSED,
+    BREAKER_HALF_OPEN,
+    BREAKER_OPEN,
+    HevyCircuitBreaker,
+)
+
+
+@pytest.fixture
+def breaker(freezer):
+    return HevyCircuitBreaker(failure_threshold=3, reset_seconds=60, max_reset_seconds=200)
+
+
+def _fail(breaker, times=1):
+    for _ in range(times):
+        breaker.record(False, breaker.allow())
+
+
+class TestHevyCircuitBreaker:
+    def test_opens_after_consecutive_failures(self, breaker) -> None:
+        _fail(breaker, 2)
+        breaker.record(True, breaker.allow())
+        _fail(breaker, 2)
+        assert breaker.state == BREAKER_CLOSED
+
+        _fail(breaker)
+        assert breaker.state == BREAKER_OPEN
+        assert breaker.allow() is False
+        assert breaker.stats["rejected"] == 1
+        assert breaker.stats["trips"] == 1
+
+    def test_single_probe_when_half_open(self, breaker, freezer) -> None:
+        _fail(breaker, 3)
+        freezer.tick(61)
+        assert breaker.allow() is True
+        assert breaker.state == BREAKER_HALF_OPEN
+        # Only the probe goes out
+        assert breaker.allow() is False
+
+        breaker.record(True, True)
+        assert breaker.state == BREAKER_CLOSED
+        assert breaker.allow() is None
+
+    def test_failed_probe_doubles_open_period(self, breaker, freezer) -> None:
+        _fail(breaker, 3)
+        freezer.tick(61)
+        breaker.record(False, breaker.allow())
+        assert breaker.state == BREAKER_OPEN
+        assert breaker.retry_in == pytest.approx(120)
+
+        freezer.tick(121)
+        breaker.record(False, breaker.allow())
+        # Capped
+        assert breaker.retry_in == pytest.approx(200)
+
+    def test_abandoned_probe_lets_next_request_probe(self, breaker, freezer) -> None:
+        _fail(breaker, 3)
+        freezer.tick(61)
+        breaker.record(None, breaker.allow())
+        assert breaker.allow() is True
+
+    def test_abandoned_request_is_not_a_failure(self, breaker) -> None:
+        _fail(breaker, 2)
+        breaker.record(None, breaker.allow())
+        _fail(breaker)
+        assert breaker.state == BREAKER_OPEN
+        assert breaker.stats["consecutive_failures"] == 3
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from custom_components.hevy.cache import HevyResponseCache
+
+
+class TestResponseCache:
+    def test_counts_hits_and_misses(self) -> None:
+        cache = HevyResponseCache()
+        assert cache.get("a") is None
+        cache.put("a", {"value": 1})
+        assert cache.get("a") == {"value": 1}
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_evicts_least_recently_used(self) -> None:
+        cache = HevyResponseCache(max_entries=2)
+        cache.put("a", {})
+        cache.put("b", {})
+        cache.get("a")
+        cache.put("c", {})
+        assert cache.get("b") is None
+        assert cache.get("a") == {}
+        assert len(cache) == 2
+
+    def test_clear_keeps_counters(self) -> None:
+        cache = HevyResponseCache()
+        cache.put("a", {})
+        cache.get("a")
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.hits == 1
@@ -1,12 +1,15 @@
 """Tests for the Hevy calendar platform."""
 from __future__ import annotations
 
-from datetime import datetime, timedelta, timezone
-from unittest.mock import MagicMock
+from datetime import date, datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from homeassistant.util import dt as dt_util
 
+from custom_components.hevy.api import HevyApiError
 from custom_components.hevy.calendar import (
+    PROJECTION_MEMO_DAYS,
     HevyCalendarEntity,
     _build_event_description,
     _parse_dt,
@@ -31,6 +34,7 @@ def coordinator_imperial() -> MagicMock:
     """Return a mock coordinator with imperial unit system."""
     coord = MagicMock()
     coord.unit_system = UNIT_SYSTEM_IMPERIAL
+    coord.window_start = None
     coord._get_weight_unit.return_value = "lbs"
     # Imperial: 60 kg -> 132.5 lbs (60 * 2.20462 = 132.2772, rounded to 132.5)
     coord._convert_weight.side_effect = lambda kg: round(kg * 2.20462 * 2) / 2 if kg is not None else None
@@ -42,6 +46,7 @@ def coordinator_metric() -> MagicMock:
     """Return a mock coordinator with metric unit system."""
     coord = MagicMock()
     coord.unit_system = UNIT_SYSTEM_METRIC
+    coord.window_start = None
     coord._get_weight_unit.return_value = "kg"
     # Metric: round kg to nearest 0.5
     coord._convert_weight.side_effect = lambda kg: round(kg * 2) / 2 if kg is not None else None
@@ -386,3 +391,238 @@ class TestHevyCalendarEntityGetEvents:
         )
         assert len(events) == 1
         assert events[0].summary == "Push Day"
+
+
+@pytest.mark.asyncio
+class TestEventIndex:
+    """Tests for the per-data-version event index."""
+
+    async def test_events_reused_until_data_changes(
+        self, entity: HevyCalendarEntity, coordinator_with_data: MagicMock
+    ) -> None:
+        coordinator_with_data.data_version = 1
+        start = datetime(2026, 7, 1, tzinfo=timezone.utc)
+        end = datetime(2026, 8, 1, tzinfo=timezone.utc)
+
+        first = await entity.async_get_events(None, start, end)
+        second = await entity.async_get_events(None, start, end)
+        assert [a is b for a, b in zip(first, second, strict=True)] == [True] * 3
+        assert entity.event is first[-1]
+
+        workouts = coordinator_with_data.data["workouts"]
+        coordinator_with_data.data = {"workouts": workouts[:1]}
+        coordinator_with_data.data_version = 2
+        events = await entity.async_get_events(None, start, end)
+        assert [e.summary for e in events] == ["Push Day"]
+        assert events[0] is not first[-1]
+
+    async def test_long_event_before_range_is_found(
+        self, mock_entry: MagicMock, coordinator_imperial: MagicMock
+    ) -> None:
+        workouts = [
+            {
+                "id": "long",
+                "title": "Hike",
+                "start_time": "2026-07-10T06:00:00Z",
+                "end_time": "2026-07-11T06:00:00Z",
+            },
+            {
+                "id": "short",
+                "title": "Push Day",
+                "start_time": "2026-07-10T12:00:00Z",
+                "end_time": "2026-07-10T13:00:00Z",
+            },
+        ]
+        coordinator_imperial.data = {"workouts": workouts}
+        entity = HevyCalendarEntity(coordinator_imperial, mock_entry)
+        events = await entity.async_get_events(
+            None,
+            datetime(2026, 7, 10, 20, tzinfo=timezone.utc),
+            datetime(2026, 7, 12, tzinfo=timezone.utc),
+        )
+        assert [e.uid for e in events] == ["long"]
+
+
+@pytest.mark.asyncio
+class TestOlderHistory:
+    """Tests for ranges reaching back past the refresh window."""
+
+    async def test_older_range_served_from_history(
+        self, entity: HevyCalendarEntity, coordinator_with_data: MagicMock
+    ) -> None:
+        coordinator_with_data.window_start = datetime(2026, 7, 1, tzinfo=timezone.utc)
+        coordinator_with_data.history.async_workouts_between = AsyncMock(
+            return_value=[
+                {
+                    "id": "old",
+                    "title": "Last Year",
+                    "start_time": "2025-07-10T07:00:00Z",
+                    "end_time": "2025-07-10T08:00:00Z",
+                }
+            ]
+        )
+        events = await entity.async_get_events(
+            None,
+            datetime(2025, 7, 1, tzinfo=timezone.utc),
+            datetime(2025, 8, 1, tzinfo=timezone.utc),
+        )
+        assert [e.uid for e in events] == ["old"]
+        start, end = coordinator_with_data.history.async_workouts_between.await_args.args
+        assert start < datetime(2025, 7, 1, tzinfo=timezone.utc)
+        assert end == datetime(2025, 8, 1, tzinfo=timezone.utc)
+
+    async def test_range_inside_window_skips_history(
+        self, entity: HevyCalendarEntity, coordinator_with_data: MagicMock
+    ) -> None:
+        coordinator_with_data.window_start = datetime(2026, 7, 1, tzinfo=timezone.utc)
+        coordinator_with_data.history.async_workouts_between = AsyncMock()
+        events = await entity.async_get_events(
+            None,
+            datetime(2026, 7, 14, tzinfo=timezone.utc),
+            datetime(2026, 7, 16, tzinfo=timezone.utc),
+        )
+        assert len(events) == 1
+        coordinator_with_data.history.async_workouts_between.assert_not_awaited()
+
+    async def test_history_error_returns_window_events(
+        self, entity: HevyCalendarEntity, coordinator_with_data: MagicMock
+    ) -> None:
+        coordinator_with_data.window_start = datetime(2026, 7, 12, tzinfo=timezone.utc)
+        coordinator_with_data.history.async_workouts_between = AsyncMock(
+            side_effect=HevyApiError("boom")
+        )
+        events = await entity.async_get_events(
+            None,
+            datetime(2026, 7, 1, tzinfo=timezone.utc),
+            datetime(2026, 8, 1, tzinfo=timezone.utc),
+        )
+        assert [e.summary for e in events] == ["Leg Day", "Pull Day", "Push Day"]
+
+
+def _local_day(year: int, month: int, day: int) -> datetime:
+    return dt_util.start_of_local_day(date(year, month, day))
+
+
+ROTATION = [
+    {"id": "rA", "title": "Push", "exercises": [{"name": "Bench Press"}]},
+    {"id": "rB", "title": "Pull", "exercises": [{"name": "Deadlift"}]},
+    {"id": "rC", "title": "Legs", "exercises": [{"name": "Squat"}]},
+]
+
+
+@pytest.fixture
+def rotation_entity(
+    mock_entry: MagicMock, coordinator_imperial: MagicMock, freezer
+) -> HevyCalendarEntity:
+    """Return an entity whose coordinator trains Mon/Wed/Fri, next up Pull."""
+    freezer.move_to("2026-08-03T08:00:00+00:00")  # a Monday
+    coordinator_imperial.routines = ROTATION
+    coordinator_imperial.data = {
+        "workouts": [],
+        "worked_out_today": False,
+        "routine_data": {"rotation_position": 2},
+        "training_pattern": {
+            "weekdays": [0, 2, 4],
+            "start_minutes": 18 * 60,
+            "duration_minutes": 45,
+        },
+    }
+    return HevyCalendarEntity(coordinator_imperial, mock_entry)
+
+
+@pytest.mark.asyncio
+class TestProjectedEvents:
+    """Tests for projected upcoming routine events."""
+
+    async def test_rotation_continues_over_training_days(
+        self, rotation_entity: HevyCalendarEntity
+    ) -> None:
+        events = await rotation_entity.async_get_events(
+            None,
+            _local_day(2026, 8, 3),
+            _local_day(2026, 8, 11),
+        )
+        assert [(e.start.day, e.summary) for e in events] == [
+            (3, "Pull (planned)"),
+            (5, "Legs (planned)"),
+            (7, "Push (planned)"),
+            (10, "Pull (planned)"),
+        ]
+        assert events[0].end - events[0].start == timedelta(minutes=45)
+        assert events[0].description == "Deadlift"
+
+    async def test_far_ahead_matches_step_by_step_rotation(
+        self, rotation_entity: HevyCalendarEntity
+    ) -> None:
+        start = _local_day(2027, 8, 2)
+        events = await rotation_entity.async_get_events(
+            None, start, start + timedelta(days=7)
+        )
+        day = date(2026, 8, 3)
+        ordinal = 0
+        while day < events[0].start.date():
+            if day.weekday() in (0, 2, 4):
+                ordinal += 1
+            day += timedelta(days=1)
+        expected = ROTATION[(1 + ordinal) % 3]["title"]
+        assert events[0].summary == f"{expected} (planned)"
+        assert len(events) == 3
+
+    async def test_starts_tomorrow_after_todays_workout(
+        self, rotation_entity: HevyCalendarEntity, coordinator_imperial: MagicMock
+    ) -> None:
+        coordinator_imperial.data["worked_out_today"] = True
+        events = await rotation_entity.async_get_events(
+            None,
+            _local_day(2026, 8, 3),
+            _local_day(2026, 8, 6),
+        )
+        assert [(e.start.day, e.summary) for e in events] == [(5, "Pull (planned)")]
+
+    async def test_todays_event_does_not_start_in_the_past(
+        self, rotation_entity: HevyCalendarEntity, freezer
+    ) -> None:
+        now = _local_day(2026, 8, 3) + timedelta(hours=19, minutes=10)
+        freezer.move_to(now)
+        events = await rotation_entity.async_get_events(
+            None,
+            _local_day(2026, 8, 3),
+            _local_day(2026, 8, 4),
+        )
+        assert [(e.start, e.summary) for e in events] == [(now, "Pull (planned)")]
+        assert events[0].end == now + timedelta(minutes=45)
+
+    async def test_memo_is_bounded(
+        self, rotation_entity: HevyCalendarEntity
+    ) -> None:
+        start = _local_day(2026, 8, 3)
+        await rotation_entity.async_get_events(
+            None, start, start + timedelta(days=7 * 365)
+        )
+        projection = rotation_entity._get_projection()
+        assert 0 < len(projection._events) <= PROJECTION_MEMO_DAYS
+
+    async def test_events_reused_for_same_rotation_state(
+        self, rotation_entity: HevyCalendarEntity
+    ) -> None:
+        start = _local_day(2026, 8, 3)
+        end = _local_day(2026, 8, 31)
+        first = await rotation_entity.async_get_events(None, start, end)
+        second = await rotation_entity.async_get_events(None, start, end)
+        assert all(a is b for a, b in zip(first, second, strict=True))
+
+    async def test_no_projection_without_training_days(
+        self, rotation_entity: HevyCalendarEntity, coordinator_imperial: MagicMock
+    ) -> None:
+        coordinator_imperial.data["training_pattern"]["weekdays"] = []
+        events = await rotation_entity.async_get_events(
+            None,
+            _local_day(2026, 8, 3),
+            _local_day(2026, 9, 3),
+        )
+        assert events == []
+
+    async def test_current_event_is_not_a_projection(
+        self, rotation_entity: HevyCalendarEntity
+    ) -> None:
+        assert rotation_entity.event is None
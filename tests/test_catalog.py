@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from custom_components.hevy.catalog import ExerciseCatalogIndex, tokenize
+
+TEMPLATES = {
+    "t1": {
+        "title": "Bench Press (Barbell)",
+        "muscle_group": "chest",
+        "secondary_muscle_groups": ["triceps", "shoulders"],
+        "equipment": "barbell",
+        "type": "weight_reps",
+    },
+    "t2": {
+        "title": "Incline Bench Press (Dumbbell)",
+        "muscle_group": "chest",
+        "secondary_muscle_groups": ["shoulders"],
+        "equipment": "dumbbell",
+        "type": "weight_reps",
+    },
+    "t3": {
+        "title": "Running",
+        "muscle_group": "cardio",
+        "secondary_muscle_groups": [],
+        "equipment": "none",
+        "type": "distance_duration",
+    },
+    "t4": {
+        "title": "Triceps Pushdown",
+        "muscle_group": "triceps",
+        "secondary_muscle_groups": [],
+        "equipment": "cable",
+        "type": "weight_reps",
+    },
+}
+
+
+def _ids(results):
+    return [template_id for template_id, _ in results]
+
+
+class TestTokenize:
+    def test_splits_on_punctuation(self) -> None:
+        assert tokenize("Bench Press (Barbell)") == ["bench", "press", "barbell"]
+
+    def test_empty(self) -> None:
+        assert tokenize(None) == []
+
+
+class TestFind:
+    def test_ignores_case_and_punctuation(self) -> None:
+        index = ExerciseCatalogIndex(TEMPLATES)
+        assert index.find("bench press barbell") == "t1"
+        assert index.find("Bench Press (Barbell)") == "t1"
+
+    def test_partial_title_is_not_a_match(self) -> None:
+        assert ExerciseCatalogIndex(TEMPLATES).find("Bench Press") is None
+
+
+class TestSearch:
+    def test_title_prefix_ranks_first(self) -> None:
+        index = ExerciseCatalogIndex(TEMPLATES)
+        assert _ids(index.search("bench")) == ["t1", "t2"]
+
+    def test_every_token_must_match(self) -> None:
+        index = ExerciseCatalogIndex(TEMPLATES)
+        assert _ids(index.search("inc ben")) == ["t2"]
+
+    def test_exact_token_beats_prefix(self) -> None:
+        index = ExerciseCatalogIndex(TEMPLATES)
+        scores = dict(index.search("press"))
+        assert scores["t1"] > dict(index.search("pres"))["t1"]
+
+    def test_fuzzy_spelling(self) -> None:
+        index = ExerciseCatalogIndex(TEMPLATES)
+        assert _ids(index.search("runing")) == ["t3"]
+
+    def test_no_match(self) -> None:
+        index = ExerciseCatalogIndex(TEMPLATES)
+        assert index.search("deadlift") == []
+
+    def test_secondary_muscle_group_filter(self) -> None:
+        index = ExerciseCatalogIndex(TEMPLATES)
+        assert _ids(index.search(muscle_group="triceps")) == ["t1", "t4"]
+
+    def test_combined_filters(self) -> None:
+        index = ExerciseCatalogIndex(TEMPLATES)
+        assert _ids(
+            index.search("press", muscle_group="Chest", equipment="dumbbell")
+        ) == ["t2"]
+
+    def test_no_query_lists_by_title(self) -> None:
+        index = ExerciseCatalogIndex(TEMPLATES)
+        assert _ids(index.search(exercise_type="weight_reps")) == ["t1", "t2", "t4"]
+        assert index.size == 4
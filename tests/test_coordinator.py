@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 from datetime import timedelta
+from unittest.mock import AsyncMock, Mock, patch
 
 from homeassistant.util import dt as dt_util
 
+from custom_components.hevy.api import HevyApiError, HevyAuthError
+
 
 def _iso(dt) -> str:
     return dt.strftime("%Y-%m-%dT%H:%M:%S+00:00")
@@ -218,6 +221,65 @@ class TestCalculateCurrentStreak:
         assert imperial_coordinator._calculate_current_streak(workouts) == 0
 
 
+class TestPollOffset:
+    async def test_stretches_only_the_first_interval(
+        self, imperial_coordinator
+    ) -> None:
+        imperial_coordinator.async_offset_polls(timedelta(minutes=4))
+        await imperial_coordinator.async_refresh()
+        assert imperial_coordinator.update_interval == timedelta(minutes=19)
+
+        await imperial_coordinator.async_refresh()
+        assert imperial_coordinator.update_interval == timedelta(minutes=15)
+
+    async def test_no_offset(self, imperial_coordinator) -> None:
+        imperial_coordinator.async_offset_polls(timedelta(0))
+        await imperial_coordinator.async_refresh()
+        assert imperial_coordinator.update_interval == timedelta(minutes=15)
+
+
+class TestStaleWhileError:
+    async def test_keeps_last_good_data(
+        self, imperial_coordinator, mock_client
+    ) -> None:
+        mock_client.get_workout_count.return_value = 7
+        await imperial_coordinator.async_refresh()
+        data = imperial_coordinator.data
+        fetched_at = imperial_coordinator.data_fetched_at
+
+        mock_client.get_workout_count.side_effect = HevyApiError("down")
+        await imperial_coordinator.async_refresh()
+        assert imperial_coordinator.last_update_success
+        assert imperial_coordinator.data is data
+        assert imperial_coordinator.data_fetched_at == fetched_at
+        assert imperial_coordinator.last_refresh_error == "down"
+
+        mock_client.get_workout_count.side_effect = None
+        await imperial_coordinator.async_refresh()
+        assert imperial_coordinator.last_refresh_error is None
+
+    async def test_auth_error_is_not_hidden(
+        self, imperial_coordinator, mock_client
+    ) -> None:
+        await imperial_coordinator.async_refresh()
+        mock_client.get_workout_count.side_effect = HevyAuthError("bad key")
+        await imperial_coordinator.async_refresh()
+        assert not imperial_coordinator.last_update_success
+
+    async def test_gives_up_after_max_age(
+        self, imperial_coordinator, mock_client, freezer
+    ) -> None:
+        await imperial_coordinator.async_refresh()
+        mock_client.get_workout_count.side_effect = HevyApiError("down")
+        freezer.tick(timedelta(hours=23))
+        await imperial_coordinator.async_refresh()
+        assert imperial_coordinator.last_update_success
+
+        freezer.tick(timedelta(hours=2))
+        await imperial_coordinator.async_refresh()
+        assert not imperial_coordinator.last_update_success
+
+
 class TestFetch30DayWorkouts:
     async def test_single_page(self, imperial_coordinator, mock_client) -> None:
         now = dt_util.utcnow()
@@ -265,6 +327,21 @@ class TestFetch30DayWorkouts:
         assert [w["id"] for w in result] == ["w1", "w2"]
         assert mock_client.get_workouts.call_count == 2
 
+    async def test_truncated_page_is_not_cached(
+        self, imperial_coordinator, mock_client
+    ) -> None:
+        now = dt_util.utcnow()
+        mock_client.get_workouts.return_value = {
+            "workouts": [{"id": "w1", "start_time": _iso(now - timedelta(days=1))}],
+            "page_count": 3,
+            "truncated": True,
+        }
+        result = await imperial_coordinator._fetch_30_day_workouts()
+        assert [w["id"] for w in result] == ["w1"]
+        assert mock_client.get_workouts.call_count == 1
+        assert mock_client.get_workouts.call_args.kwargs["stop_before"] is not None
+        assert imperial_coordinator.history.cached_pages == 0
+
     async def test_stops_on_empty_page(
         self, imperial_coordinator, mock_client
     ) -> None:
@@ -321,9 +398,72 @@ class TestFetchRoutines:
         }
         await imperial_coordinator.fetch_routines()
         assert imperial_coordinator.routines == [
-            {"id": "r9", "title": "Empty", "exercises": []}
+            {"id": "r9", "title": "Empty", "folder": None, "exercises": []}
         ]
 
+    async def test_fetches_remaining_pages(
+        self, imperial_coordinator, mock_client
+    ) -> None:
+        pages = {
+            page: {
+                "routines": [{"id": f"r{page}", "title": f"Day {page}"}],
+                "page_count": 3,
+            }
+            for page in (1, 2, 3)
+        }
+        mock_client.get_routines = AsyncMock(
+            side_effect=lambda page, page_size: pages[page]
+        )
+        await imperial_coordinator.fetch_routines()
+        assert [r["id"] for r in imperial_coordinator.routines] == ["r1", "r2", "r3"]
+        assert sorted(
+            call.kwargs["page"] for call in mock_client.get_routines.await_args_list
+        ) == [1, 2, 3]
+
+    async def test_labels_routines_with_folders(
+        self, imperial_coordinator, mock_client
+    ) -> None:
+        mock_client.get_routines.return_value = {
+            "routines": [
+                {"id": "r1", "title": "Push", "folder_id": 7},
+                {"id": "r2", "title": "Pull", "folder_id": None},
+            ]
+        }
+        mock_client.get_routine_folders.return_value = {
+            "routine_folders": [{"id": 7, "title": "PPL"}],
+            "page_count": 1,
+        }
+        await imperial_coordinator.fetch_routines()
+        assert [r["folder"] for r in imperial_coordinator.routines] == ["PPL", None]
+        assert imperial_coordinator.routines_view["routines"][0]["folder"] == "PPL"
+
+    async def test_folder_failure_keeps_routines(
+        self, imperial_coordinator, mock_client
+    ) -> None:
+        mock_client.get_routine_folders.side_effect = HevyApiError("boom")
+        await imperial_coordinator.fetch_routines()
+        assert len(imperial_coordinator.routines) == 2
+
+    async def test_builds_view_in_configured_units(
+        self, imperial_coordinator
+    ) -> None:
+        await imperial_coordinator.fetch_routines()
+        view = imperial_coordinator.routines_view
+        assert view["count"] == 2
+        bench = view["routines"][0]["exercises"][0]
+        assert bench["sets"][1] == {"type": "normal", "weight": 225.0, "reps": 5}
+        # Built once per fetch, not per access
+        assert imperial_coordinator.routines_view is view
+
+    async def test_failed_fetch_keeps_view(
+        self, imperial_coordinator, mock_client
+    ) -> None:
+        await imperial_coordinator.fetch_routines()
+        view = imperial_coordinator.routines_view
+        mock_client.get_routines.side_effect = HevyApiError("boom")
+        await imperial_coordinator.fetch_routines()
+        assert imperial_coordinator.routines_view is view
+
 
 class TestDetectNextWorkout:
     async def test_no_routines(self, imperial_coordinator) -> None:
@@ -345,3 +485,238 @@ class TestDetectNextWorkout:
         result = imperial_coordinator._detect_next_workout()
         assert result["routine_id"] == "r2"
         assert result["exercises_preview"] == ["Hip Openers"]
+
+
+class TestDataVersion:
+    async def test_bumped_only_when_workouts_change(
+        self, imperial_coordinator, mock_client
+    ) -> None:
+        assert imperial_coordinator.data_version == 0
+        await imperial_coordinator.async_refresh()
+        assert imperial_coordinator.data_version == 1
+
+        await imperial_coordinator.async_refresh()
+        assert imperial_coordinator.data_version == 1
+
+        mock_client.get_workouts.return_value = {
+            "workouts": [{"id": "w1", "start_time": _iso(dt_util.utcnow())}],
+            "page_count": 1,
+        }
+        await imperial_coordinator.async_refresh()
+        assert imperial_coordinator.data_version == 2
+
+    async def test_bumped_when_count_changes(
+        self, imperial_coordinator, mock_client
+    ) -> None:
+        await imperial_coordinator.async_refresh()
+        mock_client.get_workout_count.return_value = 7
+        await imperial_coordinator.async_refresh()
+        assert imperial_coordinator.data_version == 2
+
+    async def test_refresh_clears_response_cache(self, imperial_coordinator) -> None:
+        imperial_coordinator.responses.put("key", {})
+        await imperial_coordinator.async_refresh()
+        assert len(imperial_coordinator.responses) == 0
+
+
+class TestLearnTrainingPattern:
+    async def test_weekdays_seen_on_two_dates(self, imperial_coordinator) -> None:
+        # Mondays and Wednesdays twice each, a single Saturday
+        starts = ["2026-08-03", "2026-08-05", "2026-08-10", "2026-08-12", "2026-08-15"]
+        imperial_coordinator._workout_history = [
+            {
+                "start_time": f"{day}T18:00:00+00:00",
+                "end_time": f"{day}T19:00:00+00:00",
+            }
+            for day in starts
+        ]
+        pattern = imperial_coordinator._learn_training_pattern()
+        assert pattern["weekdays"] == [0, 2]
+        assert pattern["duration_minutes"] == 60
+        assert pattern["start_minutes"] is not None
+
+    async def test_empty_history(self, imperial_coordinator) -> None:
+        pattern = imperial_coordinator._learn_training_pattern()
+        assert pattern == {
+            "weekdays": [],
+            "start_minutes": None,
+            "duration_minutes": 60,
+        }
+
+
+class TestCatalogRevalidation:
+    async def test_unchanged_routines_keep_views(
+        self, imperial_coordinator
+    ) -> None:
+        await imperial_coordinator.fetch_routines()
+        view = imperial_coordinator.routines_view
+        # The mock returns the same dict, as the client does for a 304
+        await imperial_coordinator.fetch_routines()
+        assert imperial_coordinator.routines_view is view
+
+    async def test_unchanged_template_page_keeps_index(
+        self, imperial_coordinator, mock_client
+    ) -> None:
+        mock_client.get_exercise_templates.return_value = {
+            "exercise_templates": [{"id": "t1", "title": "Bench Press"}],
+            "page_count": 1,
+        }
+        await imperial_coordinator.fetch_exercise_templates()
+        index = imperial_coordinator.exercise_index
+        await imperial_coordinator.fetch_exercise_templates()
+        assert imperial_coordinator.exercise_index is index
+
+        mock_client.get_exercise_templates.return_value = {
+            "exercise_templates": [{"id": "t1", "title": "Bench Press (Barbell)"}],
+            "page_count": 1,
+        }
+        await imperial_coordinator.fetch_exercise_templates()
+        assert imperial_coordinator.exercise_index is not index
+        assert imperial_coordinator.exercise_index.find("bench press barbell") == "t1"
+
+    async def test_refresh_revalidates_after_interval(
+        self, imperial_coordinator, mock_client, freezer
+    ) -> None:
+        await imperial_coordinator.fetch_catalog()
+        mock_client.get_routines.reset_mock()
+
+        await imperial_coordinator.async_refresh()
+        mock_client.get_routines.assert_not_awaited()
+
+        freezer.tick(timedelta(hours=7))
+        await imperial_coordinator.async_refresh()
+        mock_client.get_routines.assert_awaited()
+
+    async def test_failed_catalog_is_retried_next_refresh(
+        self, imperial_coordinator, mock_client
+    ) -> None:
+        mock_client.get_routines.side_effect = HevyApiError("down")
+        await imperial_coordinator.fetch_catalog()
+        assert imperial_coordinator._catalog_fetched_at is None
+
+        await imperial_coordinator.async_refresh()
+        mock_client.get_routines.side_effect = None
+        mock_client.get_routines.reset_mock()
+        await imperial_coordinator.async_refresh()
+        mock_client.get_routines.assert_awaited()
+        assert imperial_coordinator._catalog_fetched_at is not None
+
+
+class TestAddWorkout:
+    async def _seed(self, coordinator, mock_client):
+        now = dt_util.utcnow()
+        mock_client.get_workout_count.return_value = 2
+        mock_client.get_workouts.return_value = {
+            "workouts": [
+                {"id": "w2", "start_time": _iso(now - timedelta(days=1))},
+                {"id": "w1", "start_time": _iso(now - timedelta(days=3))},
+            ],
+            "page_count": 1,
+        }
+        await coordinator.async_refresh()
+        return now
+
+    async def test_inserts_in_start_order(
+        self, imperial_coordinator, mock_client
+    ) -> None:
+        now = await self._seed(imperial_coordinator, mock_client)
+        version = imperial_coordinator.data_version
+        workout = {"id": "new", "start_time": _iso(now - timedelta(days=2))}
+
+        assert imperial_coordinator.async_add_workout(workout) is True
+        assert [w["id"] for w in imperial_coordinator.data["workouts"]] == [
+            "w2", "new", "w1"
+        ]
+        assert imperial_coordinator.data["workout_count"] == 3
+        assert imperial_coordinator.data_version == version + 1
+
+    async def test_updates_sensors_and_prs(
+        self, imperial_coordinator, mock_client
+    ) -> None:
+        now = await self._seed(imperial_coordinator, mock_client)
+        imperial_coordinator._exercise_templates = {"t1": {"title": "Squat"}}
+        workout = {
+            "id": "new",
+            "title": "Legs",
+            "start_time": _iso(now),
+            "exercises": [
+                {
+                    "exercise_template_id": "t1",
+                    "sets": [{"weight_kg": 140, "reps": 3}],
+                }
+            ],
+        }
+
+        imperial_coordinator.async_add_workout(workout)
+        data = imperial_coordinator.data
+        assert data["last_workout_title"] == "Legs"
+        assert data["worked_out_today"] is True
+        assert data["exercise_data"]["squat"]["display_name"] == "Squat"
+        assert imperial_coordinator._exercise_prs["squat"]["weight_kg"] == 140
+
+    async def test_replaces_existing_id(
+        self, imperial_coordinator, mock_client
+    ) -> None:
+        now = await self._seed(imperial_coordinator, mock_client)
+        workout = {"id": "w2", "title": "Edited", "start_time": _iso(now)}
+
+        imperial_coordinator.async_add_workout(workout)
+        assert imperial_coordinator.data["workout_count"] == 2
+        assert len(imperial_coordinator.data["workouts"]) == 2
+
+    async def test_backdated_workout_only_counts(
+        self, imperial_coordinator, mock_client
+    ) -> None:
+        now = await self._seed(imperial_coordinator, mock_client)
+        workout = {"id": "old", "start_time": _iso(now - timedelta(days=60))}
+
+        assert imperial_coordinator.async_add_workout(workout) is True
+        assert imperial_coordinator.data["workout_count"] == 3
+        assert len(imperial_coordinator.data["workouts"]) == 2
+
+    async def test_sparse_workout_is_rejected(
+        self, imperial_coordinator, mock_client
+    ) -> None:
+        await self._seed(imperial_coordinator, mock_client)
+        assert imperial_coordinator.async_add_workout({"id": "x"}) is False
+        assert len(imperial_coordinator.data["workouts"]) == 2
+
+    async def test_needs_initial_data(self, imperial_coordinator) -> None:
+        workout = {"id": "x", "start_time": _iso(dt_util.utcnow())}
+        assert imperial_coordinator.async_add_workout(workout) is False
+
+    async def test_batch_rebuilds_once(
+        self, imperial_coordinator, mock_client
+    ) -> None:
+        now = await self._seed(imperial_coordinator, mock_client)
+        version = imperial_coordinator.data_version
+        listener = Mock()
+        remove_listener = imperial_coordinator.async_add_listener(listener)
+        workouts = [
+            {"id": f"new{day}", "start_time": _iso(now - timedelta(days=day))}
+            for day in (0, 2)
+        ]
+
+        with patch.object(
+            imperial_coordinator,
+            "_build_data",
+            wraps=imperial_coordinator._build_data,
+        ) as build:
+            assert imperial_coordinator.async_add_workouts(workouts) is True
+        remove_listener()
+        build.assert_called_once()
+        listener.assert_called_once()
+        assert imperial_coordinator.data_version == version + 1
+        assert [w["id"] for w in imperial_coordinator.data["workouts"]] == [
+            "new0", "w2", "new2", "w1"
+        ]
+        assert imperial_coordinator.data["workout_count"] == 4
+
+    async def test_batch_reports_sparse_workouts(
+        self, imperial_coordinator, mock_client
+    ) -> None:
+        now = await self._seed(imperial_coordinator, mock_client)
+        workouts = [{"id": "x"}, {"id": "new", "start_time": _iso(now)}]
+
+        assert imperial_coordinator.async_add_workouts(workouts) is False
+        assert len(imperial_coordinator.data["workouts"]) == 3
@@ -0,0 +1,12 @@
+from __future__ import annotations
+
+from custom_components.hevy.diagnostics import approximate_size
+
+
+class TestApproximateSize:
+    def test_counts_shared_objects_once(self) -> None:
+        leaf = {"title": "Bench Press", "sets": [1, 2, 3]}
+        assert approximate_size([leaf, leaf]) < 2 * approximate_size(leaf)
+
+    def test_grows_with_content(self) -> None:
+        assert approximate_size({"a": "x" * 1000}) > approximate_size({"a": "x"})
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import csv
+import json
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+from homeassistant.core import callback
+
+from custom_components.hevy.api import HevyApiError
+from custom_components.hevy.const import EVENT_EXPORT_PROGRESS
+from custom_components.hevy.export import CSV_COLUMNS, async_export_history
+
+
+def _workout(workout_id, sets=1):
+    return {
+        "id": workout_id,
+        "title": f"Workout {workout_id}",
+        "start_time": "2026-08-20T17:00:00+00:00",
+        "end_time": "2026-08-20T18:00:00+00:00",
+        "exercises": [
+            {
+                "title": "Bench Press",
+                "exercise_template_id": "t1",
+                "notes": None,
+                "sets": [
+                    {"type": "normal", "weight_kg": 100, "reps": 5}
+                    for _ in range(sets)
+                ],
+            }
+        ],
+    }
+
+
+PAGES = {
+    1: {"workouts": [_workout("w4"), _workout("w3", sets=2)], "page_count": 2},
+    # w3 repeats because a workout was logged between page fetches
+    2: {"workouts": [_workout("w3", sets=2), _workout("w2")], "page_count": 2},
+}
+
+
+@pytest.fixture(autouse=True)
+def config_dir(hass, tmp_path):
+    hass.config.config_dir = str(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def paged_coordinator(imperial_coordinator, mock_client):
+    mock_client.get_workouts = AsyncMock(
+        side_effect=lambda page, page_size: PAGES[page]
+    )
+    return imperial_coordinator
+
+
+@pytest.fixture
+def progress(hass):
+    events = []
+
+    @callback
+    def _listener(event):
+        events.append(event.data)
+
+    hass.bus.async_listen(EVENT_EXPORT_PROGRESS, _listener)
+    return events
+
+
+class TestExport:
+    async def test_csv_row_per_set(self, hass, paged_coordinator, progress) -> None:
+        result = await async_export_history(
+            hass, paged_coordinator, "entry_1", "csv", "out.csv"
+        )
+        await hass.async_block_till_done()
+
+        assert result["workouts"] == 3
+        assert result["sets"] == 4
+        text = await hass.async_add_executor_job(Path(result["path"]).read_text)
+        rows = list(csv.reader(text.splitlines()))
+        assert rows[0] == CSV_COLUMNS
+        assert [row[0] for row in rows[1:]] == ["w4", "w3", "w3", "w2"]
+        assert [row[8] for row in rows[1:]] == ["0", "0", "1", "0"]
+
+        assert [event["page"] for event in progress] == [1, 2, 2]
+        assert progress[-1]["done"] is True
+        assert progress[-1]["workouts"] == 3
+
+    async def test_jsonl_workout_per_line(self, hass, paged_coordinator) -> None:
+        result = await async_export_history(
+            hass, paged_coordinator, "entry_1", "jsonl", "out.jsonl"
+        )
+        text = await hass.async_add_executor_job(Path(result["path"]).read_text)
+        lines = text.splitlines()
+        assert [json.loads(line)["id"] for line in lines] == ["w4", "w3", "w2"]
+
+    async def test_uses_cached_pages(
+        self, hass, paged_coordinator, mock_client
+    ) -> None:
+        paged_coordinator.history.add_page(1, PAGES[1])
+        await async_export_history(
+            hass, paged_coordinator, "entry_1", "csv", "out.csv"
+        )
+        fetched = [call.kwargs["page"] for call in mock_client.get_workouts.await_args_list]
+        assert fetched == [2]
+        # Pages fetched for the export are not cached
+        assert paged_coordinator.history.cached_pages == 1
+
+    async def test_failure_leaves_no_file(
+        self, hass, paged_coordinator, mock_client, config_dir
+    ) -> None:
+        mock_client.get_workouts = AsyncMock(
+            side_effect=[PAGES[1], HevyApiError("boom")]
+        )
+        with pytest.raises(HevyApiError):
+            await async_export_history(
+                hass, paged_coordinator, "entry_1", "csv", "out.csv"
+            )
+        assert list((config_dir / "hevy_exports").iterdir()) == []
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from custom_components.hevy.history import HevyWorkoutHistory
+
+NEWEST = datetime(2026, 8, 1, 12, tzinfo=timezone.utc)
+PAGE_SIZE = 10
+
+
+def _workouts(count: int) -> list[dict]:
+    """One workout every two days, most recent first."""
+    return [
+        {
+            "id": f"w{i}",
+            "start_time": (NEWEST - timedelta(days=2 * i)).strftime(
+                "%Y-%m-%dT%H:%M:%S+00:00"
+            ),
+        }
+        for i in range(count)
+    ]
+
+
+def _client(workouts: list[dict]) -> MagicMock:
+    page_count = max(1, -(-len(workouts) // PAGE_SIZE))
+
+    async def get_workouts(page: int = 1, page_size: int = PAGE_SIZE) -> dict:
+        chunk = workouts[(page - 1) * page_size : page * page_size]
+        return {"workouts": chunk, "page_count": page_count}
+
+    client = MagicMock()
+    client.get_workouts = AsyncMock(side_effect=get_workouts)
+    return client
+
+
+class TestWorkoutsBetween:
+    async def test_returns_range_most_recent_first(self) -> None:
+        history = HevyWorkoutHistory(_client(_workouts(200)))
+        start = NEWEST - timedelta(days=300)
+        result = await history.async_workouts_between(
+            start, start + timedelta(days=10)
+        )
+        assert [w["id"] for w in result] == ["w146", "w147", "w148", "w149", "w150"]
+
+    async def test_bisects_instead_of_walking_pages(self) -> None:
+        client = _client(_workouts(200))
+        history = HevyWorkoutHistory(client)
+        start = NEWEST - timedelta(days=300)
+        await history.async_workouts_between(start, start + timedelta(days=10))
+        # 20 pages: page 1 for the page count plus a handful of probes
+        assert client.get_workouts.await_count <= 7
+
+    async def test_second_query_is_served_from_cache(self) -> None:
+        client = _client(_workouts(200))
+        history = HevyWorkoutHistory(client)
+        start = NEWEST - timedelta(days=300)
+        await history.async_workouts_between(start, start + timedelta(days=10))
+        calls = client.get_workouts.await_count
+        await history.async_workouts_between(start, start + timedelta(days=10))
+        assert client.get_workouts.await_count == calls
+
+    async def test_range_spanning_pages(self) -> None:
+        history = HevyWorkoutHistory(_client(_workouts(50)))
+        result = await history.async_workouts_between(
+            NEWEST - timedelta(days=45), NEWEST - timedelta(days=15)
+        )
+        assert [w["id"] for w in result] == [f"w{i}" for i in range(8, 23)]
+
+    async def test_range_before_first_workout(self) -> None:
+        history = HevyWorkoutHistory(_client(_workouts(30)))
+        result = await history.async_workouts_between(
+            NEWEST - timedelta(days=500), NEWEST - timedelta(days=400)
+        )
+        assert result == []
+
+    async def test_seeded_pages_are_not_refetched(self) -> None:
+        workouts = _workouts(30)
+        client = _client(workouts)
+        history = HevyWorkoutHistory(client)
+        history.add_page(1, {"workouts": workouts[:10], "page_count": 3})
+        result = await history.async_workouts_between(
+            NEWEST - timedelta(days=5), NEWEST + timedelta(days=1)
+        )
+        assert [w["id"] for w in result] == ["w0", "w1", "w2"]
+        client.get_workouts.assert_not_awaited()
+
+
+class TestCacheBounds:
+    async def test_lru_evicts_oldest_page(self) -> None:
+        history = HevyWorkoutHistory(_client(_workouts(100)), max_pages=3)
+        for page in range(1, 5):
+            history.add_page(page, {"workouts": [], "page_count": 10})
+        assert history.cached_pages == 3
+
+    @pytest.mark.parametrize(("new_count", "expected"), [(30, 1), (31, 0)])
+    async def test_count_change_invalidates(self, new_count, expected) -> None:
+        history = HevyWorkoutHistory(_client(_workouts(30)))
+        history.set_workout_count(30)
+        history.add_page(1, {"workouts": [], "page_count": 3})
+        history.set_workout_count(new_count)
+        assert history.cached_pages == expected
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from http import HTTPStatus
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.hevy.api import HevyApiClient, HevyApiError
+from custom_components.hevy.const import CONF_API_KEY, DOMAIN
+from custom_components.hevy.ics import _escape, _etag_matches, _fold
+
+
+def _workout(workout_id: str, title: str) -> dict:
+    now = dt_util.utcnow().strftime("%Y-%m-%dT%H:%M:%S+00:00")
+    return {
+        "id": workout_id,
+        "title": title,
+        "start_time": now,
+        "end_time": now,
+        "exercises": [
+            {
+                "title": "Bench Press",
+                "exercise_template_id": "t1",
+                "sets": [{"type": "normal", "weight_kg": 60, "reps": 10}],
+            }
+        ],
+    }
+
+
+@pytest.fixture
+async def feed_entry(hass):
+    entry = MockConfigEntry(domain=DOMAIN, data={CONF_API_KEY: "test_key"})
+    entry.add_to_hass(hass)
+    with patch.multiple(
+        HevyApiClient,
+        get_workout_count=AsyncMock(return_value=1),
+        get_workouts=AsyncMock(
+            return_value={
+                "workouts": [_workout("w1", "Push; Day, Heavy")],
+                "page_count": 1,
+            }
+        ),
+        get_workout_events=AsyncMock(return_value={"events": []}),
+        get_exercise_templates=AsyncMock(
+            return_value={"exercise_templates": [], "page_count": 1}
+        ),
+        get_routines=AsyncMock(return_value={"routines": []}),
+        get_routine_folders=AsyncMock(return_value={"routine_folders": []}),
+    ):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+    return entry
+
+
+def _url(entry_id: str) -> str:
+    return f"/api/hevy/{entry_id}/workouts.ics"
+
+
+class TestFeed:
+    async def test_streams_calendar(self, hass, hass_client, feed_entry) -> None:
+        client = await hass_client()
+        response = await client.get(_url(feed_entry.entry_id))
+        assert response.status == HTTPStatus.OK
+        assert response.headers["Content-Type"].startswith("text/calendar")
+        assert response.headers["ETag"]
+
+        body = await response.text()
+        assert body.startswith("BEGIN:VCALENDAR\r\n")
+        assert body.endswith("END:VCALENDAR\r\n")
+        assert body.count("BEGIN:VEVENT") == 1
+        assert "UID:w1@hevy" in body
+        assert r"SUMMARY:Push\; Day\, Heavy" in body
+
+    async def test_not_modified(self, hass, hass_client, feed_entry) -> None:
+        client = await hass_client()
+        first = await client.get(_url(feed_entry.entry_id))
+        etag = first.headers["ETag"]
+
+        second = await client.get(
+            _url(feed_entry.entry_id), headers={"If-None-Match": etag}
+        )
+        assert second.status == HTTPStatus.NOT_MODIFIED
+        assert second.headers["ETag"] == etag
+
+    async def test_etag_follows_content(
+        self, hass, hass_client, feed_entry
+    ) -> None:
+        client = await hass_client()
+        first = await client.get(_url(feed_entry.entry_id))
+        coordinator = hass.data[DOMAIN][feed_entry.entry_id]
+        # As after a restart: the counter is back where it was, the data isn't
+        coordinator.data["workouts"][0]["updated_at"] = "2030-01-01T00:00:00Z"
+
+        second = await client.get(
+            _url(feed_entry.entry_id),
+            headers={"If-None-Match": first.headers["ETag"]},
+        )
+        assert second.status == HTTPStatus.OK
+        assert second.headers["ETag"] != first.headers["ETag"]
+
+    async def test_etag_follows_window(self, hass, hass_client, feed_entry) -> None:
+        client = await hass_client()
+        first = await client.get(_url(feed_entry.entry_id))
+        coordinator = hass.data[DOMAIN][feed_entry.entry_id]
+        coordinator.window_start += timedelta(days=1)
+
+        second = await client.get(
+            _url(feed_entry.entry_id),
+            headers={"If-None-Match": first.headers["ETag"]},
+        )
+        assert second.status == HTTPStatus.OK
+
+    async def test_unknown_entry(self, hass, hass_client, feed_entry) -> None:
+        client = await hass_client()
+        response = await client.get(_url("missing"))
+        assert response.status == HTTPStatus.NOT_FOUND
+
+    async def test_history_failure_is_clean_error(
+        self, hass, hass_client, feed_entry
+    ) -> None:
+        coordinator = hass.data[DOMAIN][feed_entry.entry_id]
+        coordinator.history.async_workouts_between = AsyncMock(
+            side_effect=HevyApiError("boom")
+        )
+        client = await hass_client()
+        response = await client.get(_url(feed_entry.entry_id))
+        assert response.status == HTTPStatus.SERVICE_UNAVAILABLE
+
+    async def test_requires_auth(self, hass, hass_client_no_auth, feed_entry) -> None:
+        client = await hass_client_no_auth()
+        response = await client.get(_url(feed_entry.entry_id))
+        assert response.status == HTTPStatus.UNAUTHORIZED
+
+
+class TestEtagMatches:
+    @pytest.mark.parametrize(
+        "header",
+        ['"abc"', 'W/"abc"', '"x", "abc"', '"x",W/"abc"', "*"],
+    )
+    def test_matches(self, header) -> None:
+        assert _etag_matches(header, '"abc"')
+
+    @pytest.mark.parametrize("header", ["", '"ab"', '"abcd"', 'abc', '"x", "y"'])
+    def test_no_match(self, header) -> None:
+        assert not _etag_matches(header, '"abc"')
+
+
+class TestFormatting:
+    def test_escape(self) -> None:
+        assert _escape("a,b;c\\d\ne") == r"a\,b\;c\\d\ne"
+
+    def test_fold_long_line(self) -> None:
+        folded = _fold("DESCRIPTION:" + "é" * 100)
+        lines = folded.split("\r\n")[:-1]
+        assert len(lines) > 1
+        assert all(len(line.encode()) <= 75 for line in lines)
+        assert all(line.startswith(" ") for line in lines[1:])
+        assert "".join(line[1:] if i else line for i, line in enumerate(lines)) == (
+            "DESCRIPTION:" + "é" * 100
+        )
+
+    def test_short_line_untouched(self) -> None:
+        assert _fold("SUMMARY:Push") == "SUMMARY:Push\r\n"
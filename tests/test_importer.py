@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.util import dt as dt_util
+
+from custom_components.hevy.api import (
+    HevyApiError,
+    HevyAuthError,
+    HevyConnectionError,
+    HevyRequestError,
+)
+from custom_components.hevy.const import IMPORT_DIR
+from custom_components.hevy.importer import async_import_workouts
+
+TEMPLATES = {
+    "t_bench": {"id": "t_bench", "title": "Bench Press (Barbell)"},
+    "t_squat": {"id": "t_squat", "title": "Squat (Barbell)"},
+    "t_run": {"id": "t_run", "title": "Running"},
+}
+
+STRONG_CSV = """Date;Workout Name;Duration;Exercise Name;Set Order;Weight;Reps;Distance;Seconds;Notes;Workout Notes;RPE
+2024-01-15 08:30:00;Push;1h 5m;Bench Press (Barbell);W;45;10;0;0;;;
+2024-01-15 08:30:00;Push;1h 5m;Bench Press (Barbell);1;60;5;0;0;;;8
+2024-01-15 08:30:00;Push;1h 5m;Bench Press (Barbell);Rest Timer;0;0;0;90;;;
+2024-01-15 08:30:00;Push;1h 5m;Squat (Barbell);1;100;5;0;0;;;
+2024-01-17 18:00:00;Cardio;30m;Treadmill;1;0;0;5;1800;;;
+"""
+
+FITNOTES_CSV = """Date,Exercise,Category,Weight (kgs),Reps,Distance,Distance Unit,Time
+2024-01-15,Running,Cardio,,,5000,m,0:30:00
+2024-01-15,Running,Cardio,,,1.5,mi,12:30
+2024-01-16,Bench Press (Barbell),Chest,60.0,5,,,
+2024-01-16,Bench Press (Barbell),Chest,62.5,5,,,
+"""
+
+
+
+def _hevy_start(csv_text: str, title: str) -> str:
+    """Start time of a workout in the fixture as Hevy would return it."""
+    for line in csv_text.splitlines()[1:]:
+        cells = line.split(";")
+        if cells[1] == title:
+            start = dt_util.parse_datetime(cells[0]).replace(
+                tzinfo=dt_util.DEFAULT_TIME_ZONE
+            )
+            return dt_util.as_utc(start).isoformat().replace("+00:00", "Z")
+    raise ValueError(title)
+
+
+@pytest.fixture(autouse=True)
+def import_dir(hass, tmp_path):
+    hass.config.config_dir = str(tmp_path)
+    path = tmp_path / IMPORT_DIR
+    path.mkdir()
+    return path
+
+
+@pytest.fixture
+def importer_coordinator(metric_coordinator, mock_client):
+    metric_coordinator._exercise_templates = dict(TEMPLATES)
+    metric_coordinator.async_request_refresh = AsyncMock()
+    mock_client.create_workout = AsyncMock(
+        side_effect=lambda body: {"workout": {"id": f"id_{body['workout']['title']}"}}
+    )
+    return metric_coordinator
+
+
+async def _import(hass, coordinator, exercise_map=None, filename="strong.csv"):
+    return await async_import_workouts(
+        hass, coordinator, "entry_1", filename, exercise_map or {}
+    )
+
+
+class TestImportWorkouts:
+    async def test_groups_rows_into_workouts(
+        self, hass, importer_coordinator, mock_client, import_dir
+    ) -> None:
+        (import_dir / "strong.csv").write_text(STRONG_CSV)
+        result = await _import(
+            hass, importer_coordinator, {"Treadmill": "Running"}
+        )
+
+        assert result == {
+            "imported": 2, "skipped": 0, "failed": 0, "uncertain": 0, "errors": []
+        }
+        bodies = [call.args[0]["workout"] for call in mock_client.create_workout.await_args_list]
+        push = next(body for body in bodies if body["title"] == "Push")
+        assert push["start_time"].startswith("2024-01-15T08:30:00")
+        assert push["end_time"].startswith("2024-01-15T09:35:00")
+        assert [e["exercise_template_id"] for e in push["exercises"]] == [
+            "t_bench", "t_squat"
+        ]
+        bench_sets = push["exercises"][0]["sets"]
+        # The rest timer row is not a set
+        assert [s["type"] for s in bench_sets] == ["warmup", "normal"]
+        assert bench_sets[1]["weight_kg"] == 60
+        assert bench_sets[1]["rpe"] == 8
+
+        cardio = next(body for body in bodies if body["title"] == "Cardio")
+        run = cardio["exercises"][0]
+        assert run["exercise_template_id"] == "t_run"
+        assert run["sets"][0]["distance_meters"] == 5000
+        assert run["sets"][0]["duration_seconds"] == 1800
+        importer_coordinator.async_request_refresh.assert_awaited_once()
+
+    async def test_unresolved_exercise_posts_nothing(
+        self, hass, importer_coordinator, mock_client, import_dir
+    ) -> None:
+        (import_dir / "strong.csv").write_text(STRONG_CSV)
+        with pytest.raises(ServiceValidationError, match="Treadmill"):
+            await _import(hass, importer_coordinator)
+        mock_client.create_workout.assert_not_awaited()
+
+    async def test_suggests_close_exercise(
+        self, hass, importer_coordinator, import_dir
+    ) -> None:
+        (import_dir / "strong.csv").write_text(
+            "Date,Exercise Name,Weight,Reps\n2024-01-15 08:30:00,Bench Pres,60,5\n"
+        )
+        with pytest.raises(ServiceValidationError, match="Bench Press \\(Barbell\\)"):
+            await _import(hass, importer_coordinator)
+
+    async def test_missing_required_column(
+        self, hass, importer_coordinator, import_dir
+    ) -> None:
+        (import_dir / "strong.csv").write_text("Weight,Reps,api_key: secret\n60,5,1\n")
+        with pytest.raises(ServiceValidationError, match="no column") as err:
+            await _import(hass, importer_coordinator)
+        # Only the missing columns are named, never the file's contents
+        assert "secret" not in str(err.value)
+
+    async def test_resume_skips_imported_workouts(
+        self, hass, importer_coordinator, mock_client, import_dir, hass_storage
+    ) -> None:
+        (import_dir / "strong.csv").write_text(STRONG_CSV)
+        mock_client.create_workout = AsyncMock(
+            side_effect=[{"workout": {"id": "w1"}}, HevyRequestError("rejected")]
+        )
+        first = await _import(hass, importer_coordinator, {"Treadmill": "t_run"})
+        assert first["imported"] == 1
+        assert first["failed"] == 1
+        assert first["errors"][0]["title"] == "Cardio"
+        checkpoint = hass_storage["hevy.entry_1.imports"]["data"]["imported"]
+        assert list(checkpoint.values()) == ["w1"]
+
+        mock_client.create_workout = AsyncMock(return_value={"workout": {"id": "w2"}})
+        second = await _import(hass, importer_coordinator, {"Treadmill": "t_run"})
+        assert second["imported"] == 1
+        assert second["skipped"] == 1
+        assert mock_client.create_workout.await_args.args[0]["workout"]["title"] == (
+            "Cardio"
+        )
+
+    async def test_timed_out_workout_is_not_posted_twice(
+        self, hass, importer_coordinator, mock_client, import_dir, hass_storage
+    ) -> None:
+        (import_dir / "strong.csv").write_text(STRONG_CSV)
+        mock_client.create_workout = AsyncMock(
+            side_effect=[{"workout": {"id": "w1"}}, HevyConnectionError("timed out")]
+        )
+        first = await _import(hass, importer_coordinator, {"Treadmill": "t_run"})
+        assert first["uncertain"] == 1
+        assert first["failed"] == 0
+        stored = hass_storage["hevy.entry_1.imports"]["data"]
+        assert len(stored["uncertain"]) == 1
+
+        # The timed-out POST did create the workout
+        mock_client.get_workout_events.return_value = {
+            "events": [
+                {
+                    "type": "updated",
+                    "workout": {
+                        "id": "w2",
+                        "title": "Cardio",
+                        "start_time": _hevy_start(STRONG_CSV, "Cardio"),
+                    },
+                }
+            ],
+            "page_count": 1,
+        }
+        mock_client.create_workout = AsyncMock()
+        second = await _import(hass, importer_coordinator, {"Treadmill": "t_run"})
+        mock_client.create_workout.assert_not_awaited()
+        assert second["skipped"] == 2
+        stored = hass_storage["hevy.entry_1.imports"]["data"]
+        assert stored["uncertain"] == {}
+        assert sorted(stored["imported"].values()) == ["w1", "w2"]
+
+    async def test_uncertain_workout_not_found_is_posted_again(
+        self, hass, importer_coordinator, mock_client, import_dir
+    ) -> None:
+        (import_dir / "strong.csv").write_text(STRONG_CSV)
+        mock_client.create_workout = AsyncMock(
+            side_effect=[{"workout": {"id": "w1"}}, HevyApiError("502")]
+        )
+        await _import(hass, importer_coordinator, {"Treadmill": "t_run"})
+
+        mock_client.create_workout = AsyncMock(return_value={"workout": {"id": "w2"}})
+        second = await _import(hass, importer_coordinator, {"Treadmill": "t_run"})
+        assert second["imported"] == 1
+        assert mock_client.get_workout_events.await_args.kwargs["since"] is not None
+
+    async def test_auth_error_stops_import(
+        self, hass, importer_coordinator, mock_client, import_dir
+    ) -> None:
+        (import_dir / "strong.csv").write_text(STRONG_CSV)
+        mock_client.create_workout = AsyncMock(side_effect=HevyAuthError("bad key"))
+        with pytest.raises(HevyAuthError):
+            await _import(hass, importer_coordinator, {"Treadmill": "Running"})
+        importer_coordinator.async_request_refresh.assert_not_awaited()
+
+    async def test_reimports_export_history_csv(
+        self, hass, importer_coordinator, mock_client, import_dir
+    ) -> None:
+        (import_dir / "export.csv").write_text(
+            "workout_id,workout_title,start_time,end_time,exercise_index,"
+            "exercise_title,exercise_template_id,exercise_notes,set_index,"
+            "set_type,weight_kg,reps,distance_meters,duration_seconds,rpe\n"
+            "w1,Legs,2024-02-01T17:00:00+00:00,2024-02-01T18:00:00+00:00,0,"
+            "Back Squat,t_squat,,0,failure,140,3,,,\n"
+        )
+        result = await _import(hass, importer_coordinator, filename="export.csv")
+        assert result["imported"] == 1
+        body = mock_client.create_workout.await_args.args[0]["workout"]
+        assert body["end_time"] == "2024-02-01T18:00:00+00:00"
+        assert body["exercises"][0]["exercise_template_id"] == "t_squat"
+        assert body["exercises"][0]["sets"][0]["type"] == "failure"
+
+    async def test_imports_fitnotes_csv(
+        self, hass, importer_coordinator, mock_client, import_dir
+    ) -> None:
+        (import_dir / "fitnotes.csv").write_text(FITNOTES_CSV)
+        result = await _import(hass, importer_coordinator, filename="fitnotes.csv")
+        assert result["imported"] == 2
+        bodies = [call.args[0]["workout"] for call in mock_client.create_workout.await_args_list]
+        cardio, chest = sorted(bodies, key=lambda body: body["start_time"])
+
+        sets = cardio["exercises"][0]["sets"]
+        # Distances are in the row's unit, not the integration's
+        assert [s["distance_meters"] for s in sets] == [5000, 2414]
+        assert [s["duration_seconds"] for s in sets] == [1800, 750]
+        start = dt_util.parse_datetime(cardio["start_time"])
+        end = dt_util.parse_datetime(cardio["end_time"])
+        assert end - start == timedelta(seconds=2550)
+
+        # Sets without a time still give the workout a length
+        assert [s["weight_kg"] for s in chest["exercises"][0]["sets"]] == [60, 62.5]
+        assert chest["end_time"] > chest["start_time"]
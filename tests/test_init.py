@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from datetime import timedelta
 from unittest.mock import AsyncMock, patch
 
 from homeassistant.config_entries import ConfigEntryState
@@ -7,7 +8,14 @@ from homeassistant.util import dt as dt_util
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.hevy.api import HevyApiClient
-from custom_components.hevy.const import CONF_API_KEY, DOMAIN
+from custom_components.hevy.const import (
+    ATTR_DETAIL_OMITTED,
+    CONF_API_KEY,
+    CONF_ATTRIBUTE_BUDGET,
+    DATA_CLIENT_MANAGER,
+    DOMAIN,
+)
+from custom_components.hevy.diagnostics import async_get_config_entry_diagnostics
 
 
 def _sample_workout() -> dict:
@@ -27,12 +35,15 @@ def _sample_workout() -> dict:
     }
 
 
-def _patch_api():
+def _patch_api(workout: dict | None = None):
     return patch.multiple(
         HevyApiClient,
         get_workout_count=AsyncMock(return_value=42),
         get_workouts=AsyncMock(
-            return_value={"workouts": [_sample_workout()], "page_count": 1}
+            return_value={
+                "workouts": [workout or _sample_workout()],
+                "page_count": 1,
+            }
         ),
         get_workout_events=AsyncMock(return_value={"events": []}),
         get_exercise_templates=AsyncMock(
@@ -61,6 +72,7 @@ def _patch_api():
                 ]
             }
         ),
+        get_routine_folders=AsyncMock(return_value={"routine_folders": []}),
     )
 
 
@@ -96,6 +108,128 @@ async def test_setup_creates_entities_and_unloads(hass) -> None:
     assert workout_count is not None
     assert workout_count.state == "42"
 
+    queued = next(
+        s for s in sensor_states if s.entity_id.endswith("queued_workouts")
+    )
+    assert queued.state == "0"
+    assert queued.attributes["workouts"] == []
+
+    cache = next(
+        s for s in sensor_states if s.entity_id.endswith("api_cache_hit_rate")
+    )
+    # The client methods are mocked, so no request went through the cache
+    assert cache.state == "unknown"
+    assert cache.attributes["conditional_requests"] == 0
+
+    last_sync = next(
+        s for s in sensor_states if s.entity_id.endswith("last_successful_sync")
+    )
+    assert last_sync.state != "unknown"
+    assert last_sync.attributes["stale"] is False
+    assert last_sync.attributes["api_state"] == "closed"
+
     assert await hass.config_entries.async_unload(entry.entry_id)
     await hass.async_block_till_done()
     assert entry.state is ConfigEntryState.NOT_LOADED
+
+
+async def test_entries_share_request_budget(hass) -> None:
+    entries = [
+        MockConfigEntry(domain=DOMAIN, data={CONF_API_KEY: f"key_{n}"}, options={})
+        for n in range(2)
+    ]
+    with _patch_api():
+        for entry in entries:
+            entry.add_to_hass(hass)
+            assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+    first, second = (hass.data[DOMAIN][entry.entry_id] for entry in entries)
+    assert first.client._scheduler is second.client._scheduler
+    # The second account polls offset from the first
+    assert first.update_interval == timedelta(minutes=15)
+    assert second.update_interval > timedelta(minutes=15)
+
+    for entry in entries:
+        assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    assert DATA_CLIENT_MANAGER not in hass.data
+
+
+async def test_config_entry_diagnostics(hass) -> None:
+    entry = MockConfigEntry(
+        domain=DOMAIN, data={CONF_API_KEY: "secret_key"}, options={}
+    )
+    entry.add_to_hass(hass)
+    with _patch_api():
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+
+    assert diagnostics["entry"]["data"][CONF_API_KEY] == "**REDACTED**"
+    assert "secret_key" not in str(diagnostics)
+    assert diagnostics["history"]["workouts"] == 1
+    assert diagnostics["history"]["sets"] == 1
+    assert diagnostics["memory_bytes"]["data"] > 0
+    assert diagnostics["memory_bytes"]["workout_history"] > 0
+    assert set(diagnostics["refresh"]["stage_ms"]) == {
+        "workout_count",
+        "workouts",
+        "process",
+    }
+    assert "scheduler" in diagnostics["api"]
+    payloads = diagnostics["largest_attribute_payloads"]
+    assert payloads
+    assert payloads == sorted(payloads, key=lambda p: p["bytes"], reverse=True)
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_attribute_budget_and_detail_service(hass) -> None:
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_API_KEY: "test_key"},
+        options={CONF_ATTRIBUTE_BUDGET: 1},
+    )
+    entry.add_to_hass(hass)
+    workout = _sample_workout()
+    workout["exercises"][0]["sets"] *= 20
+    with _patch_api(workout):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+    entity_id = next(
+        s.entity_id
+        for s in hass.states.async_all()
+        if s.entity_id.endswith("last_workout_date")
+    )
+    state = hass.states.get(entity_id)
+    assert "workout_summaries" not in state.attributes
+    assert state.attributes[ATTR_DETAIL_OMITTED] == ["workout_summaries"]
+    assert state.attributes["workout_title"] == "Push Day"
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        "get_attribute_detail",
+        {"entity_id": entity_id},
+        blocking=True,
+        return_response=True,
+    )
+    detail = response[entity_id]
+    assert detail["omitted"] == ["workout_summaries"]
+    assert detail["bytes"] > 1024
+    (summary,) = detail["attributes"]["workout_summaries"].values()
+    assert len(summary["exercises"][0]["sets"]) == 20
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+    payload = next(
+        p
+        for p in diagnostics["largest_attribute_payloads"]
+        if p["entity_id"] == entity_id
+    )
+    assert payload["omitted"] == ["workout_summaries"]
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from custom_components.hevy.jsonstream import iter_array_items
+
+PAGE = {
+    "page": 1,
+    "page_count": 3,
+    "workouts": [
+        {"id": "w1", "title": "Push — Heavy", "sets": [{"weight_kg": 102.5}]},
+        {"id": "w2", "title": "Pull", "sets": []},
+        {"id": "w3", "title": "Legs", "sets": [{"reps": 12345}]},
+    ],
+}
+
+
+async def _chunks(body: bytes, size: int):
+    for start in range(0, len(body), size):
+        yield body[start : start + size]
+
+
+async def _collect(body: bytes, size: int, key: str = "workouts"):
+    meta: dict = {}
+    items = [item async for item in iter_array_items(_chunks(body, size), key, meta)]
+    return items, meta
+
+
+class TestIterArrayItems:
+    @pytest.mark.parametrize("size", [1, 2, 7, 64, 4096])
+    async def test_any_chunk_size(self, size) -> None:
+        # Chunk size 1 splits the multi-byte dash and every number
+        body = json.dumps(PAGE, ensure_ascii=False).encode()
+        items, meta = await _collect(body, size)
+        assert items == PAGE["workouts"]
+        assert meta == {"page": 1, "page_count": 3}
+
+    @pytest.mark.parametrize("size", [1, 13, 16])
+    async def test_numbers_split_mid_fraction_or_exponent(self, size) -> None:
+        # With 16-byte chunks the first chunk ends right after "1."
+        body = b'{"workouts": [1.5, 2, -0.25, 3e+2, 4.5E-1, 60.125]}'
+        items, _ = await _collect(body, size)
+        assert items == [1.5, 2, -0.25, 300.0, 0.45, 60.125]
+
+    async def test_members_after_the_array(self) -> None:
+        body = b'{"workouts": [{"id": "w1"}], "page_count": 2}'
+        items, meta = await _collect(body, 5)
+        assert items == [{"id": "w1"}]
+        assert meta == {"page_count": 2}
+
+    async def test_stops_reading_when_closed_early(self) -> None:
+        read: list[bytes] = []
+
+        async def _tracked():
+            async for chunk in _chunks(json.dumps(PAGE).encode(), 16):
+                read.append(chunk)
+                yield chunk
+
+        stream = iter_array_items(_tracked(), "workouts", {})
+        assert (await anext(stream))["id"] == "w1"
+        await stream.aclose()
+        assert sum(len(chunk) for chunk in read) < len(json.dumps(PAGE))
+
+    async def test_empty_and_missing_array(self) -> None:
+        assert await _collect(b'{"workouts": []}', 3) == ([], {})
+        assert await _collect(b'{"page": 1}', 3) == ([], {"page": 1})
+
+    @pytest.mark.parametrize(
+        "body", [b"[1, 2]", b'{"workouts": [{"id": 1}', b'{"workouts": [{"id": }]}']
+    )
+    async def test_invalid(self, body) -> None:
+        with pytest.raises(ValueError):
+            await _collect(body, 4)
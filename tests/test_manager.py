@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from itertools import pairwise
+
+from custom_components.hevy.const import DATA_CLIENT_MANAGER
+from custom_components.hevy.manager import (
+    async_get_client_manager,
+    async_release_client,
+)
+
+INTERVAL = timedelta(minutes=15)
+
+
+class TestHevyClientManager:
+    async def test_clients_share_scheduler(self, hass) -> None:
+        manager = async_get_client_manager(hass)
+        first = manager.async_get_client("entry_1", "key_1")
+        second = manager.async_get_client("entry_2", "key_2")
+        assert first._scheduler is second._scheduler is manager.scheduler
+        assert first._session is second._session
+        assert async_get_client_manager(hass) is manager
+
+    async def test_offsets_spread_polls(self, hass) -> None:
+        manager = async_get_client_manager(hass)
+        for number in range(4):
+            manager.async_get_client(f"entry_{number}", "key")
+        offsets = sorted(
+            manager.poll_offset(f"entry_{number}", INTERVAL) for number in range(4)
+        )
+        assert offsets[0] == timedelta(0)
+        assert all(offset < INTERVAL for offset in offsets)
+        gaps = [later - earlier for earlier, later in pairwise(offsets)]
+        assert min(gaps) >= timedelta(minutes=2)
+
+    async def test_released_slot_is_reused(self, hass) -> None:
+        manager = async_get_client_manager(hass)
+        manager.async_get_client("entry_1", "key")
+        manager.async_get_client("entry_2", "key")
+        second_offset = manager.poll_offset("entry_2", INTERVAL)
+
+        async_release_client(hass, "entry_2")
+        manager.async_get_client("entry_3", "key")
+        assert manager.poll_offset("entry_3", INTERVAL) == second_offset
+
+    async def test_last_release_drops_manager(self, hass) -> None:
+        manager = async_get_client_manager(hass)
+        manager.async_get_client("entry_1", "key")
+        async_release_client(hass, "entry_1")
+        assert DATA_CLIENT_MANAGER not in hass.data
+        assert async_get_client_manager(hass) is not manager
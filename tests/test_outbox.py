@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    async_capture_events,
+    async_fire_time_changed,
+)
+
+from custom_components.hevy.api import (
+    HevyApiError,
+    HevyConnectionError,
+    HevyRequestError,
+)
+from custom_components.hevy.outbox import HevyWorkoutOutbox
+
+STORAGE_KEY = "hevy.entry_1.outbox"
+
+
+def _created(body):
+    return {**body["workout"], "id": f"w-{body['workout']['title']}"}
+
+
+def _payload(title="Push Day"):
+    start = dt_util.utcnow() - timedelta(hours=1)
+    return {
+        "title": title,
+        "is_private": False,
+        "start_time": start.isoformat(),
+        "end_time": dt_util.utcnow().isoformat(),
+        "exercises": [
+            {
+                "exercise_template_id": "t1",
+                "notes": None,
+                "sets": [{"type": "normal", "weight_kg": 100, "reps": 5}],
+            }
+        ],
+    }
+
+
+@pytest.fixture
+async def outbox(hass, imperial_coordinator, mock_client):
+    imperial_coordinator._exercise_templates = {"t1": {"title": "Bench Press"}}
+    await imperial_coordinator.async_refresh()
+    outbox = HevyWorkoutOutbox(hass, imperial_coordinator, "entry_1")
+    await outbox.async_load()
+    imperial_coordinator.outbox = outbox
+    yield outbox
+    outbox.async_stop()
+
+
+class TestEnqueue:
+    async def test_persists_and_shows_pending(
+        self, hass, hass_storage, outbox, imperial_coordinator, mock_client
+    ) -> None:
+        mock_client.create_workout = AsyncMock(side_effect=HevyApiError("down"))
+        item = await outbox.async_enqueue(_payload())
+
+        assert hass_storage[STORAGE_KEY]["data"]["items"][0]["id"] == item["id"]
+        workout = imperial_coordinator.data["workouts"][0]
+        assert workout["id"] == f"pending_{item['id']}"
+        assert workout["pending"] is True
+        assert workout["exercises"][0]["title"] == "Bench Press"
+        # Pending workouts are not on Hevy yet
+        assert imperial_coordinator.data["workout_count"] == 0
+
+    async def test_pending_survives_refresh(
+        self, hass, outbox, imperial_coordinator, mock_client
+    ) -> None:
+        mock_client.create_workout = AsyncMock(side_effect=HevyApiError("down"))
+        await outbox.async_enqueue(_payload())
+        await hass.async_block_till_done()
+
+        await imperial_coordinator.async_refresh()
+        assert imperial_coordinator.data["workouts"][0]["pending"] is True
+        # Not on Hevy yet, so not a PR either
+        assert "bench press" not in imperial_coordinator._exercise_prs
+
+
+class TestProcess:
+    async def test_sent_workout_replaces_pending(
+        self, hass, hass_storage, outbox, imperial_coordinator, mock_client
+    ) -> None:
+        mock_client.create_workout = AsyncMock(
+            side_effect=lambda body: {"workout": [{**body["workout"], "id": "w-1"}]}
+        )
+        await outbox.async_enqueue(_payload())
+        await hass.async_block_till_done()
+
+        assert outbox.items == []
+        assert hass_storage[STORAGE_KEY]["data"]["items"] == []
+        assert [w["id"] for w in imperial_coordinator.data["workouts"]] == ["w-1"]
+        assert imperial_coordinator.data["workout_count"] == 1
+
+    async def test_failure_backs_off_and_retries(
+        self, hass, freezer, outbox, mock_client
+    ) -> None:
+        mock_client.create_workout = AsyncMock(side_effect=HevyApiError("down"))
+        await outbox.async_enqueue(_payload())
+        await hass.async_block_till_done()
+
+        item = outbox.items[0]
+        assert item["attempts"] == 1
+        assert item["last_error"] == "down"
+
+        # Not due yet
+        freezer.tick(timedelta(seconds=10))
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+        assert mock_client.create_workout.await_count == 1
+
+        mock_client.create_workout = AsyncMock(side_effect=_created)
+        freezer.tick(timedelta(seconds=30))
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+        assert outbox.items == []
+
+    async def test_failed_item_does_not_block_others(
+        self, hass, outbox, mock_client
+    ) -> None:
+        async def create(body):
+            if body["workout"]["title"] == "Bad":
+                raise HevyApiError("rejected")
+            return _created(body)
+
+        mock_client.create_workout = AsyncMock(side_effect=create)
+        await outbox.async_enqueue(_payload("Bad"))
+        await outbox.async_enqueue(_payload("Good"))
+        await hass.async_block_till_done()
+
+        assert [item["workout"]["title"] for item in outbox.items] == ["Bad"]
+
+
+    async def test_rejected_item_is_dropped(
+        self, hass, outbox, imperial_coordinator, mock_client
+    ) -> None:
+        events = async_capture_events(hass, "hevy_workout_rejected")
+        mock_client.create_workout = AsyncMock(
+            side_effect=HevyRequestError("API request failed with status 400")
+        )
+        await outbox.async_enqueue(_payload())
+        await hass.async_block_till_done()
+
+        assert outbox.items == []
+        assert mock_client.create_workout.await_count == 1
+        assert events[0].data["workout"]["title"] == "Push Day"
+        await imperial_coordinator.async_refresh()
+        assert not any(w.get("pending") for w in imperial_coordinator.data["workouts"])
+
+    async def test_timed_out_post_is_not_repeated(
+        self, hass, freezer, outbox, mock_client
+    ) -> None:
+        payload = _payload()
+        mock_client.create_workout = AsyncMock(
+            side_effect=HevyConnectionError("Request timeout")
+        )
+        await outbox.async_enqueue(payload)
+        await hass.async_block_till_done()
+        assert outbox.items[0]["maybe_sent"] is True
+
+        # The timed-out POST went through after all
+        mock_client.get_workouts = AsyncMock(
+            return_value={
+                "workouts": [{**payload, "id": "w-1"}],
+                "page_count": 1,
+            }
+        )
+        freezer.tick(timedelta(seconds=31))
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+
+        assert outbox.items == []
+        assert mock_client.create_workout.await_count == 1
+
+
+class TestLoad:
+    async def test_resumes_stored_items(
+        self, hass, hass_storage, imperial_coordinator, mock_client
+    ) -> None:
+        hass_storage[STORAGE_KEY] = {
+            "version": 1,
+            "key": STORAGE_KEY,
+            "data": {
+                "items": [
+                    {
+                        "id": "abc",
+                        "queued_at": dt_util.utcnow().isoformat(),
+                        "attempts": 2,
+                        "next_attempt_at": dt_util.utcnow().isoformat(),
+                        "last_error": "down",
+                        "workout": _payload(),
+                    }
+                ]
+            },
+        }
+        mock_client.create_workout = AsyncMock(side_effect=_created)
+        await imperial_coordinator.async_refresh()
+        outbox = HevyWorkoutOutbox(hass, imperial_coordinator, "entry_1")
+        await outbox.async_load()
+        assert len(outbox.items) == 1
+
+        outbox.async_start()
+        await hass.async_block_till_done()
+        assert outbox.items == []
+        mock_client.create_workout.assert_awaited_once()
+
+    async def test_saves_each_item_as_it_is_sent(
+        self, hass, hass_storage, imperial_coordinator, mock_client
+    ) -> None:
+        now = dt_util.utcnow().isoformat()
+        hass_storage[STORAGE_KEY] = {
+            "version": 1,
+            "key": STORAGE_KEY,
+            "data": {
+                "items": [
+                    {
+                        "id": queue_id,
+                        "queued_at": now,
+                        "attempts": 1,
+                        "next_attempt_at": now,
+                        "last_error": "down",
+                        "workout": _payload(queue_id),
+                    }
+                    for queue_id in ("first", "second")
+                ]
+            },
+        }
+        stored_before_second: list[str] = []
+
+        async def create(body):
+            if body["workout"]["title"] == "first":
+                return _created(body)
+            stored_before_second.extend(
+                item["id"] for item in hass_storage[STORAGE_KEY]["data"]["items"]
+            )
+            # Home Assistant stops while the second POST is in flight
+            raise asyncio.CancelledError
+
+        mock_client.create_workout = AsyncMock(side_effect=create)
+        await imperial_coordinator.async_refresh()
+        outbox = HevyWorkoutOutbox(hass, imperial_coordinator, "entry_1")
+        await outbox.async_load()
+
+        with pytest.raises(asyncio.CancelledError):
+            await outbox.async_process()
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+        await hass.async_block_till_done()
+
+        # The first was saved as sent before the second went out
+        assert stored_before_second == ["second"]
+        stored = hass_storage[STORAGE_KEY]["data"]["items"]
+        assert [item["id"] for item in stored] == ["second"]
+        assert stored[0]["maybe_sent"] is True
+        outbox.async_stop()
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+from homeassistant.util import dt as dt_util
+
+from custom_components.hevy.rollups import HevyRollupStore, estimated_one_rep_max
+
+
+def _workout(workout_id, start, exercises):
+    return {"id": workout_id, "start_time": start.isoformat(), "exercises": exercises}
+
+
+def _bench(*sets):
+    return {
+        "title": "Bench Press",
+        "exercise_template_id": "t1",
+        "sets": [{"weight_kg": weight, "reps": reps} for weight, reps in sets],
+    }
+
+
+def _run(meters, seconds):
+    return {
+        "title": "Running",
+        "exercise_template_id": "t3",
+        "sets": [{"distance_meters": meters, "duration_seconds": seconds}],
+    }
+
+
+@pytest.fixture
+def store(metric_coordinator):
+    metric_coordinator._exercise_templates = {
+        "t1": {"title": "Bench Press", "muscle_group": "chest"},
+        "t3": {"title": "Running", "muscle_group": "cardio"},
+    }
+    metric_coordinator.window_start = dt_util.start_of_local_day(
+        date(2026, 8, 1)
+    )
+    metric_coordinator._workout_count = 3
+    metric_coordinator._workout_history = [
+        _workout(
+            "w3",
+            dt_util.start_of_local_day(date(2026, 8, 12)) + timedelta(hours=18),
+            [_bench((100, 5))],
+        ),
+        _workout(
+            "w2",
+            dt_util.start_of_local_day(date(2026, 8, 11)) + timedelta(hours=7),
+            [_run(5000, 1500)],
+        ),
+        _workout(
+            "w1",
+            dt_util.start_of_local_day(date(2026, 8, 3)) + timedelta(hours=18),
+            [_bench((60, 10), (100, 3))],
+        ),
+    ]
+    metric_coordinator.data_version = 1
+    return HevyRollupStore(metric_coordinator)
+
+
+class TestEstimatedOneRepMax:
+    def test_single_rep_is_the_weight(self) -> None:
+        assert estimated_one_rep_max(100, 1) == 100
+
+    def test_epley(self) -> None:
+        assert estimated_one_rep_max(90, 10) == 120
+
+
+class TestQuery:
+    async def test_group_by_exercise(self, store) -> None:
+        await store.async_ensure(store._coordinator.window_start)
+        rows = store.query(
+            date(2026, 8, 1), date(2026, 8, 31), ["exercise"], ["volume", "sets", "e1rm"]
+        )
+        assert rows == [
+            {"exercise": "Bench Press", "volume": 1400.0, "sets": 3, "e1rm": 116.7},
+            {"exercise": "Running", "volume": 0.0, "sets": 1, "e1rm": None},
+        ]
+
+    async def test_warmup_sets_are_not_counted(self, store) -> None:
+        warmup = {"type": "warmup", "weight_kg": 40, "reps": 10}
+        store._coordinator._workout_history[0]["exercises"][0]["sets"].append(warmup)
+        await store.async_ensure(store._coordinator.window_start)
+        rows = store.query(
+            date(2026, 8, 12), date(2026, 8, 12), ["exercise"], ["volume", "sets"]
+        )
+        assert rows == [{"exercise": "Bench Press", "volume": 500.0, "sets": 1}]
+
+    async def test_group_by_muscle_and_week(self, store) -> None:
+        await store.async_ensure(store._coordinator.window_start)
+        rows = store.query(
+            date(2026, 8, 1),
+            date(2026, 8, 31),
+            ["muscle_group", "week"],
+            ["reps", "distance", "duration"],
+        )
+        assert rows == [
+            {
+                "muscle_group": "cardio",
+                "week": "2026-W33",
+                "reps": 0,
+                "distance": 5.0,
+                "duration": 1500,
+            },
+            {
+                "muscle_group": "chest",
+                "week": "2026-W32",
+                "reps": 13,
+                "distance": 0.0,
+                "duration": 0,
+            },
+            {
+                "muscle_group": "chest",
+                "week": "2026-W33",
+                "reps": 5,
+                "distance": 0.0,
+                "duration": 0,
+            },
+        ]
+
+    async def test_range_limits_days(self, store) -> None:
+        await store.async_ensure(store._coordinator.window_start)
+        rows = store.query(date(2026, 8, 11), date(2026, 8, 11), ["day"], ["sets"])
+        assert rows == [{"day": "2026-08-11", "sets": 1}]
+
+    async def test_window_changes_are_synced(self, store) -> None:
+        coordinator = store._coordinator
+        await store.async_ensure(coordinator.window_start)
+
+        coordinator._workout_history = coordinator._workout_history[1:]
+        coordinator.data_version += 1
+        await store.async_ensure(coordinator.window_start)
+
+        rows = store.query(date(2026, 8, 1), date(2026, 8, 31), ["day"], ["sets"])
+        assert [row["day"] for row in rows] == ["2026-08-03", "2026-08-11"]
+
+    async def test_older_days_come_from_history(self, store) -> None:
+        coordinator = store._coordinator
+        coordinator.history.async_workouts_between = AsyncMock(
+            return_value=[
+                _workout(
+                    "old",
+                    dt_util.start_of_local_day(date(2026, 7, 1)) + timedelta(hours=9),
+                    [_bench((80, 5))],
+                )
+            ]
+        )
+        start = dt_util.start_of_local_day(date(2026, 6, 1))
+        await store.async_ensure(start)
+        await store.async_ensure(start)
+
+        coordinator.history.async_workouts_between.assert_awaited_once()
+        rows = store.query(date(2026, 6, 1), date(2026, 8, 31), ["month"], ["volume"])
+        assert rows == [
+            {"month": "2026-07", "volume": 400.0},
+            {"month": "2026-08", "volume": 1400.0},
+        ]
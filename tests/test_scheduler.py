@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from custom_components.hevy.scheduler import (
+    DEFAULT_DEADLINES,
+    RequestPriority,
+    RequestScheduler,
+    current_request_class,
+    request_priority,
+)
+
+
+async def _run(scheduler, priority, order, hold=None):
+    async with scheduler.slot(priority):
+        order.append(priority)
+        if hold is not None:
+            await hold.wait()
+
+
+async def _queue(scheduler, priorities):
+    """Queue requests behind one in-flight request, then let them through."""
+    hold = asyncio.Event()
+    order: list[RequestPriority] = []
+    blocker = asyncio.create_task(
+        _run(scheduler, RequestPriority.BACKGROUND, [], hold)
+    )
+    await asyncio.sleep(0)
+    tasks = [
+        asyncio.create_task(_run(scheduler, priority, order))
+        for priority in priorities
+    ]
+    await asyncio.sleep(0)
+    hold.set()
+    await asyncio.gather(blocker, *tasks)
+    return order
+
+
+@pytest.fixture
+def scheduler():
+    scheduler = RequestScheduler(rate=1000, burst=1000, max_concurrent=1)
+    yield scheduler
+    scheduler.close()
+
+
+class TestRequestScheduler:
+    async def test_interactive_jumps_background_queue(self, scheduler) -> None:
+        order = await _queue(
+            scheduler, [RequestPriority.BACKGROUND] * 3 + [RequestPriority.INTERACTIVE]
+        )
+        assert order[0] == RequestPriority.INTERACTIVE
+
+    async def test_background_gets_its_share(self, scheduler) -> None:
+        order = await _queue(
+            scheduler,
+            [RequestPriority.INTERACTIVE] * 20 + [RequestPriority.BACKGROUND] * 5,
+        )
+        # 8:1 weights, so background is not starved until interactive drains
+        first = order[:20]
+        assert first.count(RequestPriority.BACKGROUND) == 2
+
+    async def test_idle_class_does_not_bank_credit(self, scheduler) -> None:
+        await _queue(scheduler, [RequestPriority.INTERACTIVE] * 16)
+        order = await _queue(
+            scheduler,
+            [RequestPriority.REFRESH] * 4 + [RequestPriority.INTERACTIVE] * 4,
+        )
+        # Refresh sat idle while interactive ran, but joins at the current
+        # pass rather than starting far behind
+        assert RequestPriority.REFRESH in order[:3]
+
+    async def test_deadline_drops_queued_request(self, scheduler) -> None:
+        hold = asyncio.Event()
+        blocker = asyncio.create_task(
+            _run(scheduler, RequestPriority.BACKGROUND, [], hold)
+        )
+        await asyncio.sleep(0)
+        with pytest.raises(TimeoutError):
+            async with asyncio.timeout(0.01):
+                await _run(scheduler, RequestPriority.INTERACTIVE, [])
+        assert scheduler.stats["dropped"] == 1
+        assert scheduler.stats["classes"]["interactive"]["waiting"] == 0
+
+        hold.set()
+        await blocker
+        order: list[RequestPriority] = []
+        await _run(scheduler, RequestPriority.REFRESH, order)
+        assert order == [RequestPriority.REFRESH]
+        assert scheduler.stats["in_flight"] == 0
+
+    async def test_rate_limit_spaces_requests(self) -> None:
+        scheduler = RequestScheduler(rate=50, burst=1, max_concurrent=4)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        order: list[RequestPriority] = []
+        await asyncio.gather(
+            *(_run(scheduler, RequestPriority.REFRESH, order) for _ in range(3))
+        )
+        assert len(order) == 3
+        assert loop.time() - start >= 0.035
+        scheduler.close()
+
+    async def test_throttle_pauses_admission(self) -> None:
+        scheduler = RequestScheduler(rate=1000, burst=10, max_concurrent=4)
+        loop = asyncio.get_running_loop()
+        scheduler.throttle(0.05)
+        start = loop.time()
+        await _run(scheduler, RequestPriority.INTERACTIVE, [])
+        assert loop.time() - start >= 0.045
+        assert scheduler.stats["throttled"] == 1
+        scheduler.close()
+
+
+class TestRequestPriority:
+    def test_defaults_to_refresh(self) -> None:
+        assert current_request_class() == (
+            RequestPriority.REFRESH,
+            DEFAULT_DEADLINES[RequestPriority.REFRESH],
+        )
+
+    def test_sets_and_restores(self) -> None:
+        with request_priority(RequestPriority.INTERACTIVE):
+            assert current_request_class() == (
+                RequestPriority.INTERACTIVE,
+                DEFAULT_DEADLINES[RequestPriority.INTERACTIVE],
+            )
+            with request_priority(RequestPriority.BACKGROUND, deadline=5):
+                assert current_request_class() == (RequestPriority.BACKGROUND, 5)
+        assert current_request_class()[0] == RequestPriority.REFRESH
+
+    def test_none_means_no_deadline(self) -> None:
+        with request_priority(RequestPriority.INTERACTIVE, deadline=None):
+            assert current_request_class() == (RequestPriority.INTERACTIVE, None)
+
+    async def test_follows_child_tasks(self) -> None:
+        with request_priority(RequestPriority.INTERACTIVE):
+            task = asyncio.create_task(asyncio.sleep(0, current_request_class()))
+        assert (await task)[0] == RequestPriority.INTERACTIVE
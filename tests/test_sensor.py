@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from homeassistant.helpers.json import json_bytes
+
+from custom_components.hevy import sensor
+from custom_components.hevy.const import ATTR_DETAIL_OMITTED, CONF_ATTRIBUTE_BUDGET
+from custom_components.hevy.sensor import HevyDetailAttributesMixin, fit_attributes
+
+ATTRIBUTES = {
+    "title": "Push Day",
+    "summaries": {"2026-08-20": "x" * 600},
+    "dates": ["2026-08-20"] * 40,
+}
+
+
+class TestFitAttributes:
+    def test_within_budget_is_unchanged(self) -> None:
+        attributes, omitted = fit_attributes(ATTRIBUTES, ("summaries",), 4096)
+        assert attributes is ATTRIBUTES
+        assert omitted == []
+
+    def test_no_limit(self) -> None:
+        attributes, omitted = fit_attributes(ATTRIBUTES, ("summaries",), 0)
+        assert attributes is ATTRIBUTES
+        assert omitted == []
+
+    def test_leaves_out_detail_in_order(self) -> None:
+        attributes, omitted = fit_attributes(
+            ATTRIBUTES, ("summaries", "dates"), 1024
+        )
+        assert omitted == ["summaries"]
+        assert attributes == {
+            "title": "Push Day",
+            "dates": ATTRIBUTES["dates"],
+            ATTR_DETAIL_OMITTED: ["summaries"],
+        }
+        # The full attributes are not touched
+        assert "summaries" in ATTRIBUTES
+
+    def test_keeps_going_until_it_fits(self) -> None:
+        attributes, omitted = fit_attributes(ATTRIBUTES, ("summaries", "dates"), 100)
+        assert omitted == ["summaries", "dates"]
+        assert attributes == {"title": "Push Day", ATTR_DETAIL_OMITTED: omitted}
+
+    def test_other_attributes_are_never_left_out(self) -> None:
+        attributes, omitted = fit_attributes(ATTRIBUTES, (), 10)
+        assert attributes is ATTRIBUTES
+        assert omitted == []
+
+
+class _DetailSensor(HevyDetailAttributesMixin):
+    entity_id = "sensor.hevy_test"
+    _detail_keys = ("summaries",)
+
+    def __init__(self, data: dict[str, Any]) -> None:
+        self.coordinator = SimpleNamespace(data=data)
+        self._entry = SimpleNamespace(options={CONF_ATTRIBUTE_BUDGET: 1})
+
+    @property
+    def detail_attributes(self) -> dict[str, Any]:
+        return dict(self.coordinator.data)
+
+
+class TestDetailAttributesMixin:
+    def test_detail_attributes_is_required(self) -> None:
+        class Incomplete(HevyDetailAttributesMixin):
+            pass
+
+        with pytest.raises(TypeError):
+            Incomplete()
+
+    def test_measured_once_per_update(self) -> None:
+        entity = _DetailSensor(ATTRIBUTES)
+        with patch.object(sensor, "json_bytes", wraps=json_bytes) as measure:
+            first = entity.extra_state_attributes
+            assert entity.extra_state_attributes == first
+            assert measure.call_count == 2  # Full attributes, then the dropped key
+
+            entity.coordinator.data = {"title": "Legs"}
+            assert entity.extra_state_attributes == {"title": "Legs"}
+            assert measure.call_count == 3
+        assert first[ATTR_DETAIL_OMITTED] == ["summaries"]
@@ -1,18 +1,41 @@
 from __future__ import annotations
 
+import base64
+from datetime import timedelta
 from unittest.mock import AsyncMock
 
 import pytest
 import voluptuous as vol
-from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
-
-from custom_components.hevy.api import HevyApiClient, HevyApiError, HevyAuthError
+from homeassistant.core import Context
+from homeassistant.exceptions import (
+    HomeAssistantError,
+    ServiceValidationError,
+    Unauthorized,
+)
+from homeassistant.util import dt as dt_util
+
+from custom_components.hevy.api import (
+    HevyApiClient,
+    HevyApiError,
+    HevyAuthError,
+    HevyConnectionError,
+    HevyRequestError,
+)
 from custom_components.hevy.const import DOMAIN
+from custom_components.hevy.outbox import HevyWorkoutOutbox
+from custom_components.hevy.scheduler import RequestPriority, current_request_class
 from custom_components.hevy.services import (
+    DEFAULT_HISTORY_PAGE_SIZE,
+    SERVICE_EXPORT_HISTORY,
     SERVICE_GET_EXERCISE_CATALOG,
     SERVICE_GET_ROUTINES,
     SERVICE_GET_WORKOUT_HISTORY,
+    SERVICE_IMPORT_WORKOUTS,
     SERVICE_LOG_WORKOUT,
+    SERVICE_LOG_WORKOUTS,
+    SERVICE_PROFILE_REFRESH,
+    SERVICE_QUERY,
+    SERVICE_SEARCH_EXERCISES,
     async_register_services,
 )
 
@@ -389,7 +412,9 @@ class TestResponseAndErrors:
         await _log(hass)
         imperial_setup.async_request_refresh.assert_awaited_once()
 
-    async def test_api_error_wrapped(self, hass, imperial_setup) -> None:
+    async def test_api_error_wrapped_without_outbox(
+        self, hass, imperial_setup
+    ) -> None:
         imperial_setup.client.create_workout = AsyncMock(
             side_effect=HevyApiError("boom")
         )
@@ -499,6 +524,7 @@ class TestGetRoutines:
                 {
                     "id": "r1",
                     "title": "Push Day",
+                    "folder": None,
                     "exercises": [
                         {
                             "name": "Bench Press",
@@ -524,6 +550,7 @@ class TestGetRoutines:
                 {
                     "id": "r2",
                     "title": "Mobility",
+                    "folder": None,
                     "exercises": [
                         {
                             "name": "Hip Openers",
@@ -570,6 +597,16 @@ class TestGetRoutines:
         assert running["sets"][0]["distance_meters"] == 4989
         assert running["sets"][0]["duration_seconds"] == 1500
 
+    async def test_response_does_not_share_the_view(
+        self, hass, metric_setup
+    ) -> None:
+        await metric_setup.fetch_routines()
+        response = await _routines(hass)
+        response["count"] = 0
+        response["routines"].clear()
+        assert metric_setup.routines_view["count"] == 2
+        assert len(metric_setup.routines_view["routines"]) == 2
+
     async def test_empty_routines(self, hass, imperial_setup) -> None:
         response = await _routines(hass)
         assert response == {"count": 0, "routines": []}
@@ -577,3 +614,580 @@ class TestGetRoutines:
     async def test_unknown_config_entry(self, hass, imperial_setup) -> None:
         with pytest.raises(ServiceValidationError):
             await _routines(hass, config_entry_id="missing")
+
+
+def _history_workout(workout_id, days_ago, reps=5):
+    start = dt_util.utcnow() - timedelta(days=days_ago)
+    return {
+        "id": workout_id,
+        "title": f"Workout {workout_id}",
+        "start_time": start.isoformat(),
+        "end_time": (start + timedelta(minutes=45)).isoformat(),
+        "exercises": [
+            {
+                "title": "Bench Press",
+                "exercise_template_id": "t1",
+                "sets": [{"type": "normal", "weight_kg": 100, "reps": reps}],
+            }
+        ],
+    }
+
+
+async def _history(hass, **data):
+    return await hass.services.async_call(
+        DOMAIN,
+        SERVICE_GET_WORKOUT_HISTORY,
+        {"config_entry_id": ENTRY_ID, **data},
+        blocking=True,
+        return_response=True,
+    )
+
+
+@pytest.fixture
+async def history_setup(hass, metric_setup):
+    metric_setup._workout_history = [
+        _history_workout(f"w{days_ago}", days_ago) for days_ago in range(1, 6)
+    ]
+    metric_setup.window_start = dt_util.utcnow() - timedelta(days=30)
+    return metric_setup
+
+
+class TestWorkoutHistory:
+    async def test_default_page_holds_small_range(self, hass, history_setup) -> None:
+        response = await _history(hass)
+        assert [w["id"] for w in response["workouts"]] == [
+            "w1", "w2", "w3", "w4", "w5"
+        ]
+        assert response["next_cursor"] is None
+        assert response["summary"]["total_workouts"] == 5
+        assert response["summary"]["avg_duration_minutes"] == 45.0
+
+    async def test_default_page_size(self, hass, history_setup) -> None:
+        history_setup._workout_history = [
+            _history_workout(f"w{days_ago}", days_ago) for days_ago in range(1, 26)
+        ]
+        response = await _history(hass)
+        assert len(response["workouts"]) == DEFAULT_HISTORY_PAGE_SIZE
+        assert response["next_cursor"] is not None
+
+        rest = await _history(hass, cursor=response["next_cursor"])
+        assert len(rest["workouts"]) == 25 - DEFAULT_HISTORY_PAGE_SIZE
+        assert rest["next_cursor"] is None
+
+    async def test_cursor_walks_all_pages(self, hass, history_setup) -> None:
+        seen: list[str] = []
+        cursor = None
+        for _ in range(3):
+            data = {"limit": 2}
+            if cursor:
+                data["cursor"] = cursor
+            response = await _history(hass, **data)
+            seen.extend(w["id"] for w in response["workouts"])
+            # The summary always covers the full range, not the page
+            assert response["summary"]["total_workouts"] == 5
+            cursor = response["next_cursor"]
+        assert seen == ["w1", "w2", "w3", "w4", "w5"]
+        assert cursor is None
+
+    async def test_summary_only(self, hass, history_setup) -> None:
+        response = await _history(hass, summary_only=True)
+        assert set(response) == {"summary"}
+        assert response["summary"]["total_volume"] == 2500.0
+
+    async def test_exclude_sets(self, hass, history_setup) -> None:
+        response = await _history(hass, limit=1, include_sets=False)
+        exercise = response["workouts"][0]["exercises"][0]
+        assert "sets" not in exercise
+        assert exercise["total_reps"] == 5
+
+    async def test_invalid_cursor(self, hass, history_setup) -> None:
+        with pytest.raises(ServiceValidationError):
+            await _history(hass, cursor="not-a-cursor")
+
+    async def test_naive_cursor_is_rejected(self, hass, history_setup) -> None:
+        cursor = base64.urlsafe_b64encode(b"2024-01-15T08:30:00|w1").decode()
+        with pytest.raises(ServiceValidationError, match="Invalid cursor"):
+            await _history(hass, cursor=cursor)
+
+    async def test_range_past_window_uses_history_store(
+        self, hass, history_setup
+    ) -> None:
+        history_setup.window_start = dt_util.utcnow() - timedelta(days=3)
+        history_setup.history.async_workouts_between = AsyncMock(
+            return_value=[_history_workout("old", 60)]
+        )
+        response = await _history(hass, days=90)
+        assert [w["id"] for w in response["workouts"]] == ["old"]
+        history_setup.history.async_workouts_between.assert_awaited_once()
+
+    async def test_history_store_error(self, hass, history_setup) -> None:
+        history_setup.window_start = dt_util.utcnow() - timedelta(days=3)
+        history_setup.history.async_workouts_between = AsyncMock(
+            side_effect=HevyApiError("boom")
+        )
+        with pytest.raises(HomeAssistantError):
+            await _history(hass, days=90)
+
+    async def test_identical_calls_are_memoized(self, hass, history_setup) -> None:
+        first = await _history(hass, limit=2)
+        second = await _history(hass, limit=2)
+        assert second is first
+        assert history_setup.responses.hits == 1
+        assert history_setup.responses.misses == 1
+
+        await _history(hass, limit=3)
+        assert history_setup.responses.misses == 2
+
+    async def test_new_data_version_misses(self, hass, history_setup) -> None:
+        first = await _history(hass)
+        history_setup.data_version += 1
+        history_setup._workout_history = history_setup._workout_history[:1]
+        second = await _history(hass)
+        assert second is not first
+        assert second["summary"]["total_workouts"] == 1
+
+
+def _batch_item(title, exercise="Bench Press"):
+    return {
+        "title": title,
+        "exercises": [{"name": exercise, "sets": [{"weight": 225, "reps": 5}]}],
+        "start_time": "2026-08-20T17:00:00+00:00",
+        "end_time": "2026-08-20T18:00:00+00:00",
+    }
+
+
+async def _log_batch(hass, workouts):
+    return await hass.services.async_call(
+        DOMAIN,
+        SERVICE_LOG_WORKOUTS,
+        {"config_entry_id": ENTRY_ID, "workouts": workouts},
+        blocking=True,
+        return_response=True,
+    )
+
+
+class TestLogWorkouts:
+    async def test_service_is_registered(self, hass, imperial_setup) -> None:
+        assert hass.services.has_service(DOMAIN, SERVICE_LOG_WORKOUTS)
+
+    async def test_posts_each_workout_and_refreshes_once(
+        self, hass, imperial_setup
+    ) -> None:
+        imperial_setup.client.create_workout = AsyncMock(
+            side_effect=lambda body: {"id": f"id-{body['workout']['title']}"}
+        )
+        response = await _log_batch(hass, [_batch_item("Mon"), _batch_item("Wed")])
+
+        assert imperial_setup.client.create_workout.await_count == 2
+        imperial_setup.async_request_refresh.assert_awaited_once()
+        assert response == {
+            "logged": 2,
+            "failed": 0,
+            "results": [
+                {"index": 0, "workout_id": "id-Mon", "title": None},
+                {"index": 1, "workout_id": "id-Wed", "title": None},
+            ],
+        }
+
+    async def test_posts_have_no_deadline(self, hass, imperial_setup) -> None:
+        classes = []
+
+        async def create(body):
+            classes.append(current_request_class())
+            return {"id": "ok"}
+
+        imperial_setup.client.create_workout = AsyncMock(side_effect=create)
+        await _log_batch(hass, [_batch_item("Mon"), _batch_item("Wed")])
+        assert classes == [(RequestPriority.INTERACTIVE, None)] * 2
+
+    async def test_reports_per_item_failures(self, hass, imperial_setup) -> None:
+        async def create(body):
+            if body["workout"]["title"] == "Bad":
+                raise HevyApiError("rejected")
+            return {"id": "ok", "title": body["workout"]["title"]}
+
+        imperial_setup.client.create_workout = AsyncMock(side_effect=create)
+        response = await _log_batch(hass, [_batch_item("Bad"), _batch_item("Good")])
+
+        assert response["logged"] == 1
+        assert response["failed"] == 1
+        assert response["results"][0] == {
+            "index": 0,
+            "title": "Bad",
+            "error": "rejected",
+        }
+        imperial_setup.async_request_refresh.assert_awaited_once()
+
+    async def test_unknown_exercise_posts_nothing(
+        self, hass, imperial_setup
+    ) -> None:
+        with pytest.raises(HomeAssistantError, match="Deadlift"):
+            await _log_batch(
+                hass, [_batch_item("Mon"), _batch_item("Tue", exercise="Deadlift")]
+            )
+        imperial_setup.client.create_workout.assert_not_awaited()
+        imperial_setup.async_request_refresh.assert_not_awaited()
+
+    async def test_no_refresh_when_everything_fails(
+        self, hass, imperial_setup
+    ) -> None:
+        imperial_setup.client.create_workout = AsyncMock(
+            side_effect=HevyApiError("down")
+        )
+        response = await _log_batch(hass, [_batch_item("Mon")])
+        assert response["failed"] == 1
+        imperial_setup.async_request_refresh.assert_not_awaited()
+
+    async def test_rejects_oversized_batch(self, hass, imperial_setup) -> None:
+        with pytest.raises(vol.Invalid):
+            await _log_batch(hass, [_batch_item(str(i)) for i in range(51)])
+
+
+class TestOptimisticInsert:
+    async def test_created_workout_is_ingested(
+        self, hass, imperial_setup, mock_client
+    ) -> None:
+        await imperial_setup.async_refresh()
+        imperial_setup.client.create_workout = AsyncMock(
+            return_value={
+                "workout": [
+                    {
+                        "id": "w-123",
+                        "title": "Push Day",
+                        "start_time": dt_util.utcnow().isoformat(),
+                        "exercises": [],
+                    }
+                ]
+            }
+        )
+
+        await _log(hass)
+
+        imperial_setup.async_request_refresh.assert_not_awaited()
+        assert imperial_setup.data["workouts"][0]["id"] == "w-123"
+
+    async def test_sparse_response_falls_back_to_refresh(
+        self, hass, imperial_setup
+    ) -> None:
+        await imperial_setup.async_refresh()
+        await _log(hass)
+        imperial_setup.async_request_refresh.assert_awaited_once()
+
+    async def test_batch_ingests_without_refresh(
+        self, hass, imperial_setup
+    ) -> None:
+        await imperial_setup.async_refresh()
+        imperial_setup.client.create_workout = AsyncMock(
+            side_effect=lambda body: {"id": body["workout"]["title"], **body["workout"]}
+        )
+        items = [_batch_item("Mon"), _batch_item("Wed")]
+        for item in items:
+            del item["start_time"], item["end_time"]
+
+        await _log_batch(hass, items)
+
+        imperial_setup.async_request_refresh.assert_not_awaited()
+        assert {w["id"] for w in imperial_setup.data["workouts"]} == {"Mon", "Wed"}
+
+
+@pytest.fixture
+async def queue_setup(hass, imperial_setup):
+    await imperial_setup.async_refresh()
+    outbox = HevyWorkoutOutbox(hass, imperial_setup, ENTRY_ID)
+    await outbox.async_load()
+    imperial_setup.outbox = outbox
+    yield imperial_setup
+    outbox.async_stop()
+
+
+class TestQueuedLogging:
+    async def test_queue_returns_without_posting(self, hass, queue_setup) -> None:
+        queue_setup.client.create_workout = AsyncMock(
+            side_effect=HevyApiError("down")
+        )
+        response = await _log(hass, queue=True)
+
+        assert response["queued"] is True
+        assert response["workout_id"] is None
+        assert response["title"] == "Push Day"
+        assert queue_setup.outbox.items[0]["id"] == response["queue_id"]
+        await hass.async_block_till_done()
+
+    async def test_api_error_falls_back_to_queue(self, hass, queue_setup) -> None:
+        queue_setup.client.create_workout = AsyncMock(
+            side_effect=HevyApiError("timeout")
+        )
+        response = await _log(hass)
+        await hass.async_block_till_done()
+
+        assert response["queued"] is True
+        assert len(queue_setup.outbox.items) == 1
+        assert queue_setup.outbox.items[0]["workout"]["exercises"][0] == {
+            "exercise_template_id": "t1",
+            "notes": None,
+            "sets": [
+                {
+                    "type": "normal",
+                    "weight_kg": 102.06,
+                    "reps": 5,
+                    "distance_meters": None,
+                    "duration_seconds": None,
+                    "rpe": None,
+                }
+            ],
+        }
+
+    async def test_auth_error_is_not_queued(self, hass, queue_setup) -> None:
+        queue_setup.client.create_workout = AsyncMock(
+            side_effect=HevyAuthError("Invalid API key")
+        )
+        with pytest.raises(HomeAssistantError):
+            await _log(hass)
+        assert queue_setup.outbox.items == []
+
+    async def test_rejected_workout_is_not_queued(self, hass, queue_setup) -> None:
+        queue_setup.client.create_workout = AsyncMock(
+            side_effect=HevyRequestError("API request failed with status 400")
+        )
+        with pytest.raises(HomeAssistantError, match="400"):
+            await _log(hass)
+        assert queue_setup.outbox.items == []
+
+    async def test_timeout_is_queued_as_maybe_sent(self, hass, queue_setup) -> None:
+        queue_setup.client.create_workout = AsyncMock(
+            side_effect=HevyConnectionError("Request timeout")
+        )
+        queue_setup.client.get_workouts = AsyncMock(
+            return_value={"workouts": [], "page_count": 1}
+        )
+        await _log(hass)
+        item = queue_setup.outbox.items[0]
+        assert item["maybe_sent"] is True
+        await hass.async_block_till_done()
+
+    async def test_queued_workout_is_pending_in_history(
+        self, hass, queue_setup
+    ) -> None:
+        queue_setup.client.create_workout = AsyncMock(
+            side_effect=HevyApiError("down")
+        )
+        now = dt_util.utcnow()
+        await _log(
+            hass,
+            queue=True,
+            start_time=(now - timedelta(hours=1)).isoformat(),
+            end_time=now.isoformat(),
+        )
+        await hass.async_block_till_done()
+
+        response = await _history(hass)
+        assert response["workouts"][0]["pending"] is True
+
+
+async def _search(hass, **data):
+    return await hass.services.async_call(
+        DOMAIN,
+        SERVICE_SEARCH_EXERCISES,
+        {"config_entry_id": ENTRY_ID, **data},
+        blocking=True,
+        return_response=True,
+    )
+
+
+class TestSearchExercises:
+    async def test_ranked_matches(self, hass, imperial_setup) -> None:
+        response = await _search(hass, query="bench")
+        assert response["total"] == 3
+        assert response["exercises"][0] == {
+            "id": "t1",
+            "title": "Bench Press",
+            "muscle_group": "chest",
+            "secondary_muscle_groups": [],
+            "equipment": None,
+            "type": None,
+            "score": 6,
+        }
+        assert response["next_offset"] is None
+
+    async def test_pagination(self, hass, imperial_setup) -> None:
+        first = await _search(hass, query="bench", limit=2)
+        assert len(first["exercises"]) == 2
+        assert first["next_offset"] == 2
+
+        second = await _search(hass, query="bench", limit=2, offset=2)
+        assert [e["id"] for e in second["exercises"]] == ["t2"]
+        assert second["next_offset"] is None
+
+    async def test_filter_only(self, hass, imperial_setup) -> None:
+        response = await _search(hass, muscle_group="chest")
+        assert [e["id"] for e in response["exercises"]] == ["t1", "t2"]
+
+    async def test_index_follows_catalog_changes(self, hass, imperial_setup) -> None:
+        assert (await _search(hass, query="deadlift"))["total"] == 0
+        imperial_setup._exercise_templates["t9"] = {"title": "Deadlift"}
+        assert (await _search(hass, query="deadlift"))["total"] == 1
+
+    async def test_unknown_config_entry(self, hass, imperial_setup) -> None:
+        with pytest.raises(ServiceValidationError):
+            await _search(hass, config_entry_id="missing")
+
+
+async def _query(hass, **data):
+    return await hass.services.async_call(
+        DOMAIN,
+        SERVICE_QUERY,
+        {"config_entry_id": ENTRY_ID, **data},
+        blocking=True,
+        return_response=True,
+    )
+
+
+class TestQuery:
+    async def test_rolls_up_recent_history(self, hass, history_setup) -> None:
+        response = await _query(hass, group_by="exercise", days=7)
+        assert response["weight_unit"] == "kg"
+        assert response["rows"] == [
+            {"exercise": "Bench Press", "volume": 2500.0, "sets": 5}
+        ]
+        end = dt_util.now().date()
+        assert response["end_date"] == end.isoformat()
+        assert response["start_date"] == (end - timedelta(days=6)).isoformat()
+
+    async def test_days_and_start_date_are_exclusive(
+        self, hass, history_setup
+    ) -> None:
+        with pytest.raises(vol.Invalid):
+            await _query(hass, group_by="day", days=7, start_date="2026-01-01")
+
+    async def test_start_after_end(self, hass, history_setup) -> None:
+        with pytest.raises(ServiceValidationError):
+            await _query(
+                hass,
+                group_by="day",
+                start_date="2026-02-01",
+                end_date="2026-01-01",
+            )
+
+    async def test_unknown_group_by(self, hass, history_setup) -> None:
+        with pytest.raises(vol.Invalid):
+            await _query(hass, group_by="year")
+
+    async def test_history_error(self, hass, history_setup) -> None:
+        history_setup.history.async_workouts_between = AsyncMock(
+            side_effect=HevyApiError("boom")
+        )
+        with pytest.raises(HomeAssistantError):
+            await _query(hass, group_by="month", days=365)
+
+
+async def _export(hass, **data):
+    return await hass.services.async_call(
+        DOMAIN,
+        SERVICE_EXPORT_HISTORY,
+        {"config_entry_id": ENTRY_ID, **data},
+        blocking=True,
+        return_response=True,
+    )
+
+
+class TestExportHistory:
+    @pytest.fixture(autouse=True)
+    def config_dir(self, hass, tmp_path):
+        hass.config.config_dir = str(tmp_path)
+        return tmp_path
+
+    async def test_default_filename(self, hass, metric_setup, mock_client) -> None:
+        mock_client.get_workouts = AsyncMock(
+            return_value={"workouts": [_history_workout("w1", 1)], "page_count": 1}
+        )
+        response = await _export(hass, format="jsonl")
+        assert response["format"] == "jsonl"
+        assert response["workouts"] == 1
+        assert response["path"].endswith(".jsonl")
+        assert "/hevy_exports/hevy_" in response["path"]
+
+    async def test_rejects_path_in_filename(self, hass, metric_setup) -> None:
+        with pytest.raises(vol.Invalid):
+            await _export(hass, filename="../secrets.yaml")
+
+    async def test_api_error(self, hass, metric_setup, mock_client) -> None:
+        mock_client.get_workouts = AsyncMock(side_effect=HevyApiError("boom"))
+        with pytest.raises(HomeAssistantError):
+            await _export(hass, filename="out.csv")
+
+
+class TestProfileRefresh:
+    @pytest.fixture(autouse=True)
+    def config_dir(self, hass, tmp_path):
+        hass.config.config_dir = str(tmp_path)
+        return tmp_path
+
+    async def _profile(self, hass, context=None, **data):
+        return await hass.services.async_call(
+            DOMAIN,
+            SERVICE_PROFILE_REFRESH,
+            {"config_entry_id": ENTRY_ID, **data},
+            blocking=True,
+            context=context,
+            return_response=True,
+        )
+
+    async def test_writes_profile(self, hass, metric_setup, config_dir) -> None:
+        async def refresh():
+            metric_setup.last_refresh_timings = {"workouts": 1.0}
+            return [bytearray(4096) for _ in range(8)]
+
+        metric_setup.async_refresh = refresh
+        response = await self._profile(hass, top=5)
+
+        files = sorted(path.name for path in (config_dir / "hevy_profiles").iterdir())
+        assert len(files) == 2
+        assert files[0].endswith(".pstats")
+        assert files[1].endswith("_allocations.txt")
+        assert response["stats_path"].endswith(files[0])
+        assert response["stage_ms"] == {"workouts": 1.0}
+        assert 0 < len(response["functions"]) <= 5
+        assert {"function", "calls", "total_ms", "cumulative_ms"} <= set(
+            response["functions"][0]
+        )
+        assert len(response["allocations"]) <= 5
+        assert response["peak_traced_kib"] > 0
+
+    async def test_requires_admin(
+        self, hass, metric_setup, hass_read_only_user
+    ) -> None:
+        metric_setup.async_refresh = AsyncMock()
+        with pytest.raises(Unauthorized):
+            await self._profile(hass, context=Context(user_id=hass_read_only_user.id))
+        metric_setup.async_refresh.assert_not_called()
+
+    async def test_unknown_entry(self, hass, metric_setup) -> None:
+        with pytest.raises(ServiceValidationError):
+            await self._profile(hass, config_entry_id="missing")
+
+
+class TestImportWorkouts:
+    async def _import(self, hass, **data):
+        return await hass.services.async_call(
+            DOMAIN,
+            SERVICE_IMPORT_WORKOUTS,
+            {"config_entry_id": ENTRY_ID, **data},
+            blocking=True,
+            return_response=True,
+        )
+
+    async def test_rejects_parent_directory(self, hass, metric_setup) -> None:
+        with pytest.raises(vol.Invalid):
+            await self._import(hass, filename="../strong.csv")
+
+    @pytest.mark.parametrize("filename", ["imports/strong.csv", "secrets.yaml"])
+    async def test_rejects_other_files(self, hass, metric_setup, filename) -> None:
+        with pytest.raises(vol.Invalid):
+            await self._import(hass, filename=filename)
+
+    async def test_missing_file(self, hass, metric_setup, tmp_path) -> None:
+        hass.config.config_dir = str(tmp_path)
+        (tmp_path / "strong.csv").write_text("Date,Exercise Name,Reps\n")
+        # Only files inside the imports directory are read
+        with pytest.raises(ServiceValidationError, match="not found in hevy_imports"):
+            await self._import(hass, filename="strong.csv")
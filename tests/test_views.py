@@ -0,0 +1,303 @@
+from __future__ import annotations
+
+import random
+from datetime import timedelta
+
+import orjson
+import pytest
+from homeassistant.util import dt as dt_util
+
+from custom_components.hevy.diagnostics import approximate_size
+
+EXERCISES = [f"Exercise {index}" for index in range(20)]
+
+# Keys of coordinator.data derived from the raw workouts
+DERIVED_KEYS = ("exercises_summary", "exercise_data", "workout_summaries")
+
+
+def _workouts(count: int, now=None) -> list[dict]:
+    """Build workouts the way the API client decodes them."""
+    now = now or dt_util.utcnow()
+    workouts = []
+    for index in range(count):
+        start = now - timedelta(hours=6 * index)
+        workouts.append(
+            {
+                "id": f"w{index}",
+                "title": "Push Day",
+                "start_time": start.isoformat(),
+                "end_time": (start + timedelta(minutes=55)).isoformat(),
+                "exercises": [
+                    {
+                        "title": EXERCISES[(index + offset) % len(EXERCISES)],
+                        "exercise_template_id": f"t{(index + offset) % 20}",
+                        "notes": None,
+                        "sets": [
+                            {
+                                "type": "normal",
+                                "weight_kg": 60 + (index % 4) * 2.5,
+                                "reps": 5,
+                            }
+                            for _ in range(4)
+                        ],
+                    }
+                    for offset in range(4)
+                ],
+            }
+        )
+    # Fresh strings and dicts per workout, like a decoded response
+    return orjson.loads(orjson.dumps(workouts))
+
+
+def _build(coordinator, workouts):
+    coordinator._workout_history = workouts
+    return coordinator._build_data(workouts, len(workouts))
+
+
+class TestWorkoutViews:
+    async def test_views_are_shared(self, metric_coordinator) -> None:
+        data = _build(metric_coordinator, _workouts(3))
+        last = data["exercises_summary"][0]
+        assert last["name"] == "Exercise 0"
+        assert data["exercise_data"]["exercise 0"]["last_workout_sets"] is last["sets"]
+
+        today = next(iter(data["workout_summaries"].values()))
+        assert [e["name"] for e in today["exercises"]] == [
+            e["name"] for e in data["exercises_summary"]
+        ]
+
+        # Identical sets are one object
+        assert len({id(set_view) for set_view in last["sets"]}) == 1
+        assert last["sets"][0] == {
+            "type": "normal",
+            "weight": 60.0,
+            "weight_unit": "kg",
+            "reps": 5,
+            "duration_seconds": None,
+            "distance": None,
+            "distance_unit": "km",
+        }
+
+    async def test_summaries_keep_their_layout(self, metric_coordinator) -> None:
+        data = _build(metric_coordinator, _workouts(3))
+        summaries = list(data["workout_summaries"].values())
+        exercise = summaries[0]["exercises"][0]
+        assert exercise.keys() == {"name", "sets", "best_set", "total_reps", "notes"}
+        assert exercise["sets"][0] == {
+            "type": "normal",
+            "weight": 60.0,
+            "weight_unit": "kg",
+            "reps": 5,
+            "distance": None,
+            "distance_unit": "km",
+        }
+        # Identical sets are one object
+        assert summaries[0]["exercises"][0]["sets"][0] is (
+            summaries[0]["exercises"][1]["sets"][0]
+        )
+
+    async def test_views_are_read_only(self, metric_coordinator) -> None:
+        data = _build(metric_coordinator, _workouts(1))
+        with pytest.raises(RuntimeError):
+            data["exercises_summary"][0]["sets"][0]["reps"] = 10
+
+    async def test_refetched_workouts_reuse_views(self, metric_coordinator) -> None:
+        now = dt_util.utcnow()
+        first = _build(metric_coordinator, _workouts(3, now))
+        second = _build(metric_coordinator, _workouts(3, now))
+        assert second["exercises_summary"] is first["exercises_summary"]
+
+    async def test_changed_workout_is_rebuilt(self, metric_coordinator) -> None:
+        now = dt_util.utcnow()
+        first = _build(metric_coordinator, _workouts(3, now))
+        workouts = _workouts(3, now)
+        workouts[0]["exercises"][0]["sets"][0]["reps"] = 8
+        second = _build(metric_coordinator, workouts)
+        assert second["exercises_summary"][0]["sets"][0]["reps"] == 8
+        # Untouched workouts keep their views
+        assert (
+            second["exercise_data"]["exercise 4"]["last_workout_sets"]
+            is first["exercise_data"]["exercise 4"]["last_workout_sets"]
+        )
+
+    async def test_prunes_workouts_leaving_window(self, metric_coordinator) -> None:
+        _build(metric_coordinator, _workouts(5))
+        _build(metric_coordinator, _workouts(2))
+        assert len(metric_coordinator.views) == 2
+
+
+def _varied_workouts(count: int) -> list[dict]:
+    """Build workouts with warm-ups, ramping weights, and cardio."""
+    rng = random.Random(count)
+    now = dt_util.utcnow()
+    workouts = []
+    for index in range(count):
+        start = now - timedelta(hours=6 * index)
+        exercises = []
+        for offset in range(rng.randint(3, 6)):
+            title = EXERCISES[(index + offset) % len(EXERCISES)]
+            if title.endswith("9"):
+                sets = [
+                    {
+                        "type": "normal",
+                        "duration_seconds": rng.randrange(600, 2400, 30),
+                        "distance_meters": rng.randrange(1000, 8000, 50),
+                    }
+                ]
+            else:
+                top = rng.randrange(40, 180) + rng.choice((0, 1.25, 2.5))
+                sets = [
+                    {"type": "warmup", "weight_kg": top / 2, "reps": 10},
+                    *(
+                        {
+                            "type": rng.choice(("normal", "normal", "failure")),
+                            "weight_kg": top - rng.choice((0, 0, 2.5, 5)),
+                            "reps": rng.randint(3, 12),
+                        }
+                        for _ in range(rng.randint(2, 5))
+                    ),
+                ]
+                if rng.random() < 0.2:
+                    sets.append({"type": "dropset", "weight_kg": top * 0.7, "reps": 12})
+            exercises.append(
+                {
+                    "title": title,
+                    "exercise_template_id": f"t{(index + offset) % 20}",
+                    "notes": None,
+                    "sets": sets,
+                }
+            )
+        workouts.append(
+            {
+                "id": f"w{index}",
+                "title": rng.choice(("Push", "Pull", "Legs", "Upper", "Cardio")),
+                "start_time": start.isoformat(),
+                "end_time": (start + timedelta(minutes=rng.randint(30, 90))).isoformat(),
+                "exercises": exercises,
+            }
+        )
+    return orjson.loads(orjson.dumps(workouts))
+
+
+def _previous_layout(coordinator, workouts: list[dict]) -> dict:
+    """Derived data as _build_data laid it out before views were shared.
+
+    Every view converted its sets again, into separate dicts and lists.
+    """
+
+    def convert_sets(sets, with_duration=True):
+        converted = []
+        for set_data in sets:
+            set_info = {
+                "type": set_data.get("type", "normal"),
+                "weight": coordinator._convert_weight(set_data.get("weight_kg")),
+                "weight_unit": coordinator._get_weight_unit(),
+                "reps": set_data.get("reps"),
+            }
+            if with_duration:
+                set_info["duration_seconds"] = set_data.get("duration_seconds")
+            set_info["distance"] = coordinator._convert_distance(
+                set_data.get("distance_meters")
+            )
+            set_info["distance_unit"] = coordinator._get_distance_unit()
+            converted.append(set_info)
+        return converted
+
+    def totals(sets):
+        reps = sum(s.get("reps") or 0 for s in sets)
+        duration = sum(s.get("duration_seconds") or 0 for s in sets)
+        meters = sum(s.get("distance_meters") or 0 for s in sets)
+        return {
+            "total_reps": reps or None,
+            "total_duration_seconds": duration or None,
+            "total_distance": coordinator._convert_distance(meters) if meters else None,
+            "distance_unit": coordinator._get_distance_unit() if meters else None,
+        }
+
+    exercises_summary = [
+        {
+            "name": exercise.get("title", "Unknown"),
+            "sets": convert_sets(exercise["sets"]),
+            "best_set": coordinator._get_best_set_string(exercise["sets"]),
+            **totals(exercise["sets"]),
+            "notes": exercise.get("notes"),
+        }
+        for exercise in workouts[0]["exercises"]
+    ]
+
+    exercise_data = {}
+    for workout in workouts:
+        for exercise in workout["exercises"]:
+            key = exercise["title"].lower()
+            if key in exercise_data:
+                continue
+            sets = convert_sets(exercise["sets"])
+            exercise_data[key] = {
+                "display_name": exercise["title"],
+                "last_workout_date": workout["start_time"],
+                "last_workout_sets": sets,
+                "weight": next((s["weight"] for s in reversed(sets) if s["weight"]), None),
+                "weight_unit": coordinator._get_weight_unit(),
+                "total_sets": len(sets),
+                "exercise_template_id": exercise.get("exercise_template_id"),
+                "notes": exercise.get("notes"),
+                "personal_record_weight": None,
+                "personal_record_reps": None,
+                "best_set": coordinator._get_best_set_string(exercise["sets"]),
+                **totals(exercise["sets"]),
+                "personal_record_distance": None,
+                "personal_record_distance_unit": None,
+            }
+
+    workout_summaries = {}
+    for workout in workouts:
+        date_key = dt_util.as_local(
+            dt_util.parse_datetime(workout["start_time"])
+        ).date().isoformat()
+        if date_key in workout_summaries:
+            continue
+        summary_exercises = [
+            {
+                "name": exercise.get("title", "Unknown"),
+                "sets": convert_sets(exercise["sets"], with_duration=False),
+                "best_set": coordinator._get_best_set_string(exercise["sets"]),
+                "total_reps": totals(exercise["sets"])["total_reps"],
+                "notes": exercise.get("notes"),
+            }
+            for exercise in workout["exercises"]
+        ]
+        workout_summaries[date_key] = {
+            "title": workout.get("title", "Untitled"),
+            "duration_minutes": 0.0,
+            "total_volume": coordinator._calculate_total_volume(workout),
+            "total_volume_unit": coordinator._get_weight_unit(),
+            "exercise_count": len(summary_exercises),
+            "exercises": summary_exercises,
+        }
+
+    return {
+        "exercises_summary": exercises_summary,
+        "exercise_data": exercise_data,
+        "workout_summaries": workout_summaries,
+    }
+
+
+class TestMemoryBenchmark:
+    # Sharing pays off as the pool of distinct sets fills up: about 15%
+    # smaller at 1,000 workouts and under half the size at 10,000
+    @pytest.mark.parametrize(("count", "ratio"), [(1_000, 0.95), (10_000, 0.6)])
+    async def test_derived_data_is_compact(
+        self, metric_coordinator, count, ratio
+    ) -> None:
+        workouts = _varied_workouts(count)
+        data = _build(metric_coordinator, workouts)
+        # Same keys and day buckets as before, so only the layout differs
+        previous = _previous_layout(metric_coordinator, workouts)
+        assert previous.keys() == set(DERIVED_KEYS)
+        assert previous["exercise_data"].keys() == data["exercise_data"].keys()
+        assert previous["workout_summaries"].keys() == data["workout_summaries"].keys()
+
+        raw = approximate_size(workouts)
+        compact = approximate_size(data) - raw
+        baseline = approximate_size({**data, **previous}) - raw
+        assert compact < baseline * ratio